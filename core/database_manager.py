@@ -10,7 +10,7 @@ import threading
 import logging
 from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Iterator
 from datetime import datetime
 
 from models import Task, Idea, StudySession, SmartDevice
@@ -323,6 +323,23 @@ class DatabaseManager:
             self.logger.error(f"Failed to get ideas: {e}")
             return []
     
+    def iter_ideas(self) -> Iterator[Idea]:
+        """
+        Stream all ideas, most recently updated first.
+        
+        Rows are deserialized one at a time from the cursor so callers can
+        build their own indexes in the same pass. Errors are logged and
+        re-raised, as a caller may already hold part of the stream.
+        """
+        try:
+            with self.get_cursor() as cursor:
+                cursor.execute("SELECT * FROM ideas ORDER BY updated_at DESC")
+                for row in cursor:
+                    yield Idea.from_dict(dict(row))
+        except Exception as e:
+            self.logger.error(f"Failed to iterate ideas: {e}")
+            raise
+    
     def update_idea(self, idea: Idea) -> bool:
         """Update an existing idea."""
         try:
@@ -350,6 +367,19 @@ class DatabaseManager:
             self.logger.error(f"Failed to delete idea {idea_id}: {e}")
             return False
     
+    def delete_ideas(self, idea_ids: List[str]) -> bool:
+        """Delete several ideas by ID in a single transaction."""
+        try:
+            with self.get_cursor() as cursor:
+                cursor.executemany(
+                    "DELETE FROM ideas WHERE id = ?",
+                    [(idea_id,) for idea_id in idea_ids]
+                )
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to delete {len(idea_ids)} ideas: {e}")
+            return False
+    
     # Study Session CRUD operations
     def create_study_session(self, session: StudySession) -> bool:
         """Create a new study session in the database."""
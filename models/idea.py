@@ -4,7 +4,8 @@ Idea data model for StosOS idea board system.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from functools import cached_property
+from typing import FrozenSet, List, Optional
 import uuid
 
 
@@ -20,6 +21,8 @@ class Idea:
         created_at: When the idea was created
         updated_at: When the idea was last modified
         attachments: List of file paths for attachments
+        tags_set: Frozen set of the tags for membership checks
+        tag_count: Number of tags, for sorting by tag count
     """
     content: str
     tags: List[str] = field(default_factory=list)
@@ -27,14 +30,26 @@ class Idea:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    tags_set: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    tag_count: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name, value):
+        """Keep tags_set, tag_count and the cached title in step with tags and content."""
+        super().__setattr__(name, value)
+        if name == 'tags':
+            self.tags_set = frozenset(value)
+        elif name == 'tags_set':
+            super().__setattr__('tag_count', len(value))
+        elif name == 'content':
+            self.__dict__.pop('short_title', None)
     
     def __post_init__(self):
         """Validate idea data after initialization."""
         if not self.content.strip():
             raise ValueError("Idea content cannot be empty")
         
-        # Ensure tags are lowercase and unique
-        self.tags = list(set(tag.lower().strip() for tag in self.tags if tag.strip()))
+        # Ensure tags are lowercase and unique, keeping their original order
+        self.tags = list(dict.fromkeys(tag.lower().strip() for tag in self.tags if tag.strip()))
         
         # Validate attachment paths
         for attachment in self.attachments:
@@ -77,15 +92,17 @@ class Idea:
     def add_tag(self, tag: str):
         """Add a tag to the idea."""
         tag = tag.lower().strip()
-        if tag and tag not in self.tags:
+        if tag and tag not in self.tags_set:
             self.tags.append(tag)
+            self.tags_set = frozenset(self.tags)
             self.updated_at = datetime.now()
     
     def remove_tag(self, tag: str):
         """Remove a tag from the idea."""
         tag = tag.lower().strip()
-        if tag in self.tags:
+        if tag in self.tags_set:
             self.tags.remove(tag)
+            self.tags_set = frozenset(self.tags)
             self.updated_at = datetime.now()
     
     def add_attachment(self, file_path: str):
@@ -107,6 +124,13 @@ class Idea:
         self.content = new_content.strip()
         self.updated_at = datetime.now()
     
+    @cached_property
+    def short_title(self) -> str:
+        """Content truncated to 50 characters for titles and headings."""
+        if len(self.content) > 50:
+            return self.content[:50] + "..."
+        return self.content
+    
     def has_tag(self, tag: str) -> bool:
         """Check if the idea has a specific tag."""
-        return tag.lower().strip() in self.tags
\ No newline at end of file
+        return tag.lower().strip() in self.tags_set
\ No newline at end of file
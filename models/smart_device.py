@@ -44,6 +44,7 @@ class SmartDevice:
         room: Room where the device is located
         last_updated: When the device status was last updated
         is_online: Whether the device is currently reachable
+        name_lower: Lowercased name, cached for name matching
     """
     name: str
     device_type: DeviceType
@@ -54,12 +55,15 @@ class SmartDevice:
     is_online: bool = True
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     last_updated: datetime = field(default_factory=datetime.now)
+    name_lower: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate smart device data after initialization."""
         if not self.name.strip():
             raise ValueError("Device name cannot be empty")
         
+        self.name_lower = self.name.lower()
+        
         if isinstance(self.device_type, str):
             self.device_type = DeviceType(self.device_type)
         
@@ -12,13 +12,18 @@ Requirements: 9.1, 9.2, 9.3
 """
 
 import logging
+from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from typing import List, Dict, Any, Optional, Callable
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.anchorlayout import AnchorLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.recyclegridlayout import RecycleGridLayout
 from kivy.clock import Clock
 from kivy.metrics import dp
 from kivy.animation import Animation
@@ -34,6 +39,36 @@ from ui.theme import StosOSTheme
 from ui.animations import StosOSAnimations
 
 
+def _mirror_size_to_text_size(instance, value):
+    """Shared size -> text_size handler so labels don't each need a setter"""
+    instance.text_size = value
+
+
+@dataclass(frozen=True)
+class DashboardThemeValues:
+    """Theme values resolved once and reused while building dashboard widgets"""
+    spacing_xs: float
+    spacing_sm: float
+    spacing_md: float
+    font_title: str
+    font_caption: str
+    color_accent: tuple
+    color_text_secondary: tuple
+    
+    @classmethod
+    def from_theme(cls) -> 'DashboardThemeValues':
+        """Snapshot the current StosOSTheme values"""
+        return cls(
+            spacing_xs=StosOSTheme.get_spacing('xs'),
+            spacing_sm=StosOSTheme.get_spacing('sm'),
+            spacing_md=StosOSTheme.get_spacing('md'),
+            font_title=str(StosOSTheme.get_font_size('title')) + 'sp',
+            font_caption=str(StosOSTheme.get_font_size('caption')) + 'sp',
+            color_accent=StosOSTheme.get_color('accent_primary'),
+            color_text_secondary=StosOSTheme.get_color('text_secondary')
+        )
+
+
 class ModuleTile(StosOSCard):
     """Individual module tile component"""
     
@@ -52,9 +87,9 @@ class ModuleTile(StosOSCard):
         self.bind(on_touch_down=self._on_tile_click)
     
     def _setup_tile_content(self):
-        """Setup the content of the module tile"""
+        """Build the tile's widgets once; _apply_module_info fills them in"""
         # Main container
-        container = BoxLayout(
+        self._container = BoxLayout(
             orientation='vertical',
             padding=StosOSTheme.get_spacing('md'),
             spacing=StosOSTheme.get_spacing('sm')
@@ -69,75 +104,88 @@ class ModuleTile(StosOSCard):
         )
         
         # Module icon
-        icon_label = StosOSLabel(
-            text=self.module_info.get('icon', '●'),
+        self._icon_label = StosOSLabel(
             font_size=str(StosOSTheme.get_font_size('display')) + 'sp',
             color=StosOSTheme.get_color('accent_primary'),
             size_hint_x=None,
             width=dp(40),
             halign='center'
         )
-        header.add_widget(icon_label)
+        header.add_widget(self._icon_label)
         
         # Status indicator
-        status = self.module_info.get('status', {})
-        status_color = StosOSTheme.get_color('success') if status.get('connected', True) else StosOSTheme.get_color('error')
-        
-        status_indicator = StosOSLabel(
+        self._status_indicator = StosOSLabel(
             text='●',
             font_size='12sp',
-            color=status_color,
             size_hint_x=None,
             width=dp(20),
             halign='center'
         )
-        header.add_widget(status_indicator)
+        header.add_widget(self._status_indicator)
         
-        container.add_widget(header)
+        self._container.add_widget(header)
         
         # Module name
-        name_label = StosOSLabel(
-            text=self.module_info.get('display_name', 'Unknown'),
+        self._name_label = StosOSLabel(
             font_size=str(StosOSTheme.get_font_size('title')) + 'sp',
             color=StosOSTheme.get_color('text_primary'),
             halign='center',
             size_hint_y=None,
             height=dp(30)
         )
-        name_label.bind(size=name_label.setter('text_size'))
-        container.add_widget(name_label)
+        self._name_label.bind(size=_mirror_size_to_text_size)
+        self._container.add_widget(self._name_label)
+        
+        # Module description, shown only when there is one
+        self._desc_label = StosOSLabel(
+            font_size=str(StosOSTheme.get_font_size('caption')) + 'sp',
+            color=StosOSTheme.get_color('text_secondary'),
+            halign='center',
+            text_size=(dp(160), None),
+            size_hint_y=None,
+            height=dp(40)
+        )
+        
+        # Notification badge as an overlay, shown only when there are any
+        self._badge = StosOSLabel(
+            font_size='10sp',
+            color=StosOSTheme.get_color('text_secondary'),
+            size_hint=(None, None),
+            size=(dp(20), dp(20)),
+            pos_hint={'right': 0.95, 'top': 0.95}
+        )
+        self._badge_overlay = FloatLayout()
+        self._badge_overlay.add_widget(self._badge)
+        
+        self.add_widget(self._container)
+        self._apply_module_info()
+    
+    def _apply_module_info(self):
+        """Show module_info in the tile's existing widgets"""
+        self._icon_label.text = self.module_info.get('icon', '●')
+        
+        status = self.module_info.get('status', {})
+        self._status_indicator.color = (
+            StosOSTheme.get_color('success') if status.get('connected', True)
+            else StosOSTheme.get_color('error')
+        )
+        
+        self._name_label.text = self.module_info.get('display_name', 'Unknown')
+        
+        # The optional rows are re-added in order below the name
+        for optional in (self._desc_label, self._badge_overlay):
+            if optional.parent is not None:
+                self._container.remove_widget(optional)
         
-        # Module description
         description = self.module_info.get('description', '')
         if description:
-            desc_label = StosOSLabel(
-                text=description,
-                font_size=str(StosOSTheme.get_font_size('caption')) + 'sp',
-                color=StosOSTheme.get_color('text_secondary'),
-                halign='center',
-                text_size=(dp(160), None),
-                size_hint_y=None,
-                height=dp(40)
-            )
-            container.add_widget(desc_label)
+            self._desc_label.text = description
+            self._container.add_widget(self._desc_label)
         
-        # Notification badge (if any)
         notifications = status.get('notifications', 0)
         if notifications > 0:
-            badge = StosOSLabel(
-                text=str(notifications),
-                font_size='10sp',
-                color=StosOSTheme.get_color('text_secondary'),
-                size_hint=(None, None),
-                size=(dp(20), dp(20)),
-                pos_hint={'right': 0.95, 'top': 0.95}
-            )
-            # Add badge as overlay
-            overlay = FloatLayout()
-            overlay.add_widget(badge)
-            container.add_widget(overlay)
-        
-        self.add_widget(container)
+            self._badge.text = str(notifications)
+            self._container.add_widget(self._badge_overlay)
     
     def _on_tile_click(self, touch):
         """Handle tile click"""
@@ -156,8 +204,23 @@ class ModuleTile(StosOSCard):
         """Update the status of the module tile"""
         self.module_info['status'] = status
         # Refresh tile content
-        self.clear_widgets()
-        self._setup_tile_content()
+        self._apply_module_info()
+
+
+class RecycledModuleTile(RecycleDataViewBehavior, ModuleTile):
+    """Module tile used as a RecycleView view class, rebound to new data on scroll"""
+    
+    def __init__(self, **kwargs):
+        self.index = None
+        # The widgets are built once here and reused for every module shown
+        super().__init__(module_info={}, **kwargs)
+    
+    def refresh_view_attrs(self, rv, index, data):
+        """Rebind this recycled tile to the module at ``index``"""
+        self.index = index
+        self.module_info = data['module_info']
+        self.on_click = data.get('on_click')
+        self._apply_module_info()
 
 
 class QuickActionBar(BoxLayout):
@@ -361,7 +424,7 @@ class GlobalSearchOverlay(FloatLayout):
             height=dp(25),
             halign='left'
         )
-        title_label.bind(size=title_label.setter('text_size'))
+        title_label.bind(size=_mirror_size_to_text_size)
         info_container.add_widget(title_label)
         
         desc_label = StosOSLabel(
@@ -372,7 +435,7 @@ class GlobalSearchOverlay(FloatLayout):
             height=dp(20),
             halign='left'
         )
-        desc_label.bind(size=desc_label.setter('text_size'))
+        desc_label.bind(size=_mirror_size_to_text_size)
         info_container.add_widget(desc_label)
         
         container.add_widget(info_container)
@@ -509,7 +572,7 @@ class SettingsPanel(StosOSPanel):
             height=dp(30),
             halign='left'
         )
-        title_label.bind(size=title_label.setter('text_size'))
+        title_label.bind(size=_mirror_size_to_text_size)
         container.add_widget(title_label)
         
         # Settings items
@@ -535,7 +598,7 @@ class SettingsPanel(StosOSPanel):
             color=StosOSTheme.get_color('text_primary'),
             halign='left'
         )
-        name_label.bind(size=name_label.setter('text_size'))
+        name_label.bind(size=_mirror_size_to_text_size)
         item.add_widget(name_label)
         
         # Setting control based on type
@@ -599,6 +662,21 @@ class SettingsPanel(StosOSPanel):
 class DashboardModule(BaseModule):
     """Main Dashboard Module"""
     
+    # Power menu entries as (label, handler method name)
+    _POWER_OPTIONS = (
+        ("Sleep Display", "_sleep_display"),
+        ("Restart System", "_restart_system"),
+        ("Shutdown System", "_shutdown_system")
+    )
+    
+    # Pixel sizes used on hot build paths; display density doesn't change at runtime
+    _H20 = dp(20)
+    _H50 = dp(50)
+    
+    # Shared theme snapshot, resolved on first use; the theme is fixed for the
+    # life of the process, as StosOSTheme has no way to change it at runtime
+    _theme_values: Optional[DashboardThemeValues] = None
+    
     def __init__(self):
         super().__init__(
             module_id="dashboard",
@@ -616,6 +694,14 @@ class DashboardModule(BaseModule):
         
         # Module registry for status tracking
         self.registered_modules = {}
+        self.modules_view = None
+        
+        # Status timestamp, refreshed only when the module state changes
+        self._last_updated = datetime.now()
+        self._last_updated_iso = self._last_updated.isoformat()
+        
+        # (label, uid) pairs from fbind so they can be released on cleanup
+        self._text_size_bindings = []
     
     def initialize(self) -> bool:
         """Initialize the dashboard module"""
@@ -718,7 +804,7 @@ class DashboardModule(BaseModule):
             height=dp(40),
             halign='center'
         )
-        greeting_label.bind(size=greeting_label.setter('text_size'))
+        greeting_label.bind(size=_mirror_size_to_text_size)
         container.add_widget(greeting_label)
         
         # Current date and time
@@ -731,7 +817,7 @@ class DashboardModule(BaseModule):
             height=dp(30),
             halign='center'
         )
-        datetime_label.bind(size=datetime_label.setter('text_size'))
+        datetime_label.bind(size=_mirror_size_to_text_size)
         container.add_widget(datetime_label)
         
         section.add_widget(container)
@@ -745,14 +831,19 @@ class DashboardModule(BaseModule):
             height=dp(400)
         )
         
-        # Module tiles grid
-        tiles_grid = GridLayout(
+        # Module tiles grid - only visible tiles are instantiated and they are
+        # reused as the grid scrolls
+        self.modules_view = RecycleView(viewclass=RecycledModuleTile)
+        tiles_grid = RecycleGridLayout(
             cols=3,
             spacing=StosOSTheme.get_spacing('md'),
             padding=StosOSTheme.get_spacing('md'),
+            default_size=(dp(180), dp(140)),
+            default_size_hint=(None, None),
             size_hint_y=None
         )
         tiles_grid.bind(minimum_height=tiles_grid.setter('height'))
+        self.modules_view.add_widget(tiles_grid)
         
         # Define available modules
         modules_info = [
@@ -800,20 +891,25 @@ class DashboardModule(BaseModule):
             }
         ]
         
-        # Create tiles
+        # Store module info for status updates
         for module_info in modules_info:
-            tile = ModuleTile(
-                module_info=module_info,
-                on_click=self._navigate_to_module
-            )
-            tiles_grid.add_widget(tile)
-            
-            # Store module info for status updates
             self.registered_modules[module_info['module_id']] = module_info
         
-        section.add_widget(tiles_grid)
+        self._refresh_modules_view()
+        
+        section.add_widget(self.modules_view)
         return section
     
+    def _refresh_modules_view(self):
+        """Push registered module info into the modules RecycleView"""
+        self._mark_updated()
+        if self.modules_view is None:
+            return
+        self.modules_view.data = [
+            {'module_info': module_info, 'on_click': self._navigate_to_module}
+            for module_info in self.registered_modules.values()
+        ]
+    
     def _create_stats_section(self) -> StosOSPanel:
         """Create quick stats section"""
         section = StosOSPanel(
@@ -822,10 +918,11 @@ class DashboardModule(BaseModule):
             height=dp(150)
         )
         
+        t = self._theme_cache()
         stats_grid = GridLayout(
             cols=3,
-            spacing=StosOSTheme.get_spacing('md'),
-            padding=StosOSTheme.get_spacing('md')
+            spacing=t.spacing_md,
+            padding=t.spacing_md
         )
         
         # Mock stats - in real implementation, these would come from modules
@@ -840,8 +937,8 @@ class DashboardModule(BaseModule):
             
             stat_container = BoxLayout(
                 orientation='vertical',
-                padding=StosOSTheme.get_spacing('sm'),
-                spacing=StosOSTheme.get_spacing('xs')
+                padding=t.spacing_sm,
+                spacing=t.spacing_xs
             )
             
             # Icon and value
@@ -849,7 +946,7 @@ class DashboardModule(BaseModule):
                 orientation='horizontal',
                 size_hint_y=None,
                 height=dp(40),
-                spacing=StosOSTheme.get_spacing('sm')
+                spacing=t.spacing_sm
             )
             
             icon_label = StosOSLabel(
@@ -863,11 +960,13 @@ class DashboardModule(BaseModule):
             
             value_label = StosOSLabel(
                 text=stat_value,
-                font_size=str(StosOSTheme.get_font_size('title')) + 'sp',
-                color=StosOSTheme.get_color('accent_primary'),
+                font_size=t.font_title,
+                color=t.color_accent,
                 halign='left'
             )
-            value_label.bind(size=value_label.setter('text_size'))
+            self._text_size_bindings.append(
+                (value_label, value_label.fbind('size', _mirror_size_to_text_size))
+            )
             value_container.add_widget(value_label)
             
             stat_container.add_widget(value_container)
@@ -875,13 +974,15 @@ class DashboardModule(BaseModule):
             # Stat name
             name_label = StosOSLabel(
                 text=stat_name,
-                font_size=str(StosOSTheme.get_font_size('caption')) + 'sp',
-                color=StosOSTheme.get_color('text_secondary'),
+                font_size=t.font_caption,
+                color=t.color_text_secondary,
                 size_hint_y=None,
-                height=dp(20),
+                height=self._H20,
                 halign='center'
             )
-            name_label.bind(size=name_label.setter('text_size'))
+            self._text_size_bindings.append(
+                (name_label, name_label.fbind('size', _mirror_size_to_text_size))
+            )
             stat_container.add_widget(name_label)
             
             stat_card.add_widget(stat_container)
@@ -890,6 +991,13 @@ class DashboardModule(BaseModule):
         section.add_widget(stats_grid)
         return section
     
+    @classmethod
+    def _theme_cache(cls) -> DashboardThemeValues:
+        """Get the cached theme values, resolving them on first use"""
+        if cls._theme_values is None:
+            cls._theme_values = DashboardThemeValues.from_theme()
+        return cls._theme_values
+    
     def _navigate_to_module(self, module_info: Dict[str, Any]):
         """Navigate to a specific module"""
         module_id = module_info['module_id']
@@ -907,26 +1015,37 @@ class DashboardModule(BaseModule):
         else:
             self.logger.warning("Screen manager not available for navigation")
     
-    def _show_global_search(self):
-        """Show global search overlay"""
-        if not self.search_overlay:
-            self.search_overlay = GlobalSearchOverlay(
-                on_close=self._hide_global_search,
-                on_result_select=self._handle_search_result
-            )
+    def _show_overlay(self, attr: str, factory: Callable, anim_in: Callable):
+        """Create the overlay stored in ``attr`` if needed, add it and animate it in"""
+        widget = getattr(self, attr) or factory()
+        if widget is None:
+            return
+        setattr(self, attr, widget)
         
         # Add to screen
-        self.screen.add_widget(self.search_overlay)
-        StosOSAnimations.fade_in(self.search_overlay, duration=0.3)
+        self.screen.add_widget(widget)
+        anim_in(widget, duration=0.3)
+    
+    def _hide_overlay(self, attr: str, anim_out: Callable):
+        """Animate out the overlay stored in ``attr`` and remove it from the screen"""
+        widget = getattr(self, attr)
+        if widget and widget.parent:
+            anim_out(widget, duration=0.2, callback=self._remove_after(widget))
+    
+    def _show_global_search(self):
+        """Show global search overlay"""
+        self._show_overlay('search_overlay', self._create_search_overlay, StosOSAnimations.fade_in)
     
     def _hide_global_search(self):
         """Hide global search overlay"""
-        if self.search_overlay and self.search_overlay.parent:
-            StosOSAnimations.fade_out(
-                self.search_overlay, 
-                duration=0.2,
-                callback=lambda: self.screen.remove_widget(self.search_overlay)
-            )
+        self._hide_overlay('search_overlay', StosOSAnimations.fade_out)
+    
+    def _create_search_overlay(self) -> GlobalSearchOverlay:
+        """Create the global search overlay"""
+        return GlobalSearchOverlay(
+            on_close=self._hide_global_search,
+            on_result_select=self._handle_search_result
+        )
     
     def _handle_search_result(self, result: Dict[str, Any]):
         """Handle search result selection"""
@@ -937,36 +1056,35 @@ class DashboardModule(BaseModule):
     
     def _show_settings(self):
         """Show settings panel"""
-        if not self.settings_overlay:
-            # Get config manager from parent app
-            config_manager = getattr(self, '_config_manager', None)
-            if not config_manager:
-                self.logger.warning("Config manager not available")
-                return
-            
-            self.settings_overlay = FloatLayout()
-            
-            settings_panel = SettingsPanel(
-                config_manager=config_manager,
-                on_close=self._hide_settings,
-                size_hint=(0.9, 0.9),
-                pos_hint={'center_x': 0.5, 'center_y': 0.5}
-            )
-            
-            self.settings_overlay.add_widget(settings_panel)
-        
-        # Add to screen
-        self.screen.add_widget(self.settings_overlay)
-        StosOSAnimations.slide_in_from_right(self.settings_overlay, duration=0.3)
+        self._show_overlay('settings_overlay', self._create_settings_overlay,
+                           StosOSAnimations.slide_in_from_right)
     
     def _hide_settings(self):
         """Hide settings panel"""
-        if self.settings_overlay and self.settings_overlay.parent:
-            StosOSAnimations.slide_out_to_right(
-                self.settings_overlay,
-                duration=0.2,
-                callback=lambda: self.screen.remove_widget(self.settings_overlay)
-            )
+        self._hide_overlay('settings_overlay', StosOSAnimations.slide_out_to_right)
+    
+    def _create_settings_overlay(self) -> Optional[FloatLayout]:
+        """Create the settings overlay, or None if no config manager is available"""
+        # Get config manager from parent app
+        config_manager = getattr(self, '_config_manager', None)
+        if not config_manager:
+            self.logger.warning("Config manager not available")
+            return None
+        
+        # The slide animations move the overlay's x, which the screen would
+        # reset from a pos_hint; the wrapper has none and centres the panel
+        settings_overlay = FloatLayout()
+        settings_overlay.add_widget(SettingsPanel(
+            config_manager=config_manager,
+            on_close=self._hide_settings,
+            size_hint=(0.9, 0.9),
+            pos_hint={'center_x': 0.5, 'center_y': 0.5}
+        ))
+        return settings_overlay
+    
+    def _remove_after(self, widget) -> Callable:
+        """Build an animation callback that removes exactly this widget from the screen"""
+        return partial(self.screen.remove_widget, widget)
     
     def _show_power_menu(self):
         """Show power management menu"""
@@ -978,38 +1096,38 @@ class DashboardModule(BaseModule):
         
         content = BoxLayout(
             orientation='vertical',
-            spacing=StosOSTheme.get_spacing('md')
+            spacing=self._theme_cache().spacing_md
         )
         
-        # Power options
-        options = [
-            ("Sleep Display", self._sleep_display),
-            ("Restart System", self._restart_system),
-            ("Shutdown System", self._shutdown_system)
-        ]
-        
-        for option_text, option_callback in options:
+        for option_text, method_name in self._POWER_OPTIONS:
+            option_callback = getattr(self, method_name)
             btn = StosOSButton(
                 text=option_text,
                 size_hint_y=None,
-                height=dp(50)
+                height=self._H50
             )
-            btn.bind(on_press=lambda x, cb=option_callback: (power_menu.dismiss(), cb()))
+            btn.fbind('on_press', partial(self._dispatch_power_option, power_menu, option_callback))
             content.add_widget(btn)
         
         # Cancel button
         cancel_btn = StosOSButton(
             text="Cancel",
             size_hint_y=None,
-            height=dp(50),
+            height=self._H50,
             button_type='secondary'
         )
-        cancel_btn.bind(on_press=lambda x: power_menu.dismiss())
+        # ModalView.dismiss ignores positional args, so it can be bound directly
+        cancel_btn.fbind('on_press', power_menu.dismiss)
         content.add_widget(cancel_btn)
         
         power_menu.content = content
         power_menu.open_with_animation()
     
+    def _dispatch_power_option(self, menu, callback: Callable, *args):
+        """Close the power menu and run the selected option"""
+        menu.dismiss()
+        callback()
+    
     def _sleep_display(self):
         """Sleep the display"""
         self.logger.info("Sleeping display")
@@ -1043,14 +1161,23 @@ class DashboardModule(BaseModule):
         """Refresh the status of all registered modules"""
         # In a real implementation, this would query actual module statuses
         # For now, we'll just update the display
-        pass
+        self._mark_updated()
+    
+    def _mark_updated(self):
+        """Record that the dashboard state changed"""
+        self._last_updated = datetime.now()
+        self._last_updated_iso = self._last_updated.isoformat()
+    
+    def get_last_updated_timestamp(self) -> datetime:
+        """Get the time of the last dashboard state change"""
+        return self._last_updated
     
     def get_status(self) -> Dict[str, Any]:
         """Get module status"""
         return {
             'active': True,
             'modules_count': len(self.registered_modules),
-            'last_updated': datetime.now().isoformat()
+            'last_updated': self._last_updated_iso
         }
     
     def cleanup(self):
@@ -1064,6 +1191,11 @@ class DashboardModule(BaseModule):
         if self.settings_overlay and self.settings_overlay.parent:
             self.screen.remove_widget(self.settings_overlay)
         
+        # Release fast-path label bindings
+        for label, uid in self._text_size_bindings:
+            label.unbind_uid('size', uid)
+        self._text_size_bindings.clear()
+        
         # Cancel any scheduled events
         Clock.unschedule(self._refresh_module_statuses)
         
@@ -11,173 +11,193 @@ Provides comprehensive idea management functionality including:
 Requirements: 5.1, 5.2, 5.3, 5.4, 5.5
 """
 
+import bisect
+import functools
+import io
 import logging
+import operator
 import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Set, TextIO, Tuple
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.gridlayout import GridLayout
 from kivy.uix.floatlayout import FloatLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
 from kivy.clock import Clock
 from kivy.metrics import dp
+from kivy.utils import escape_markup, get_hex_from_color
 
 from core.base_module import BaseModule
 from core.database_manager import DatabaseManager
 from models.idea import Idea
 from ui.components import (
     StosOSButton, StosOSLabel, StosOSTextInput, StosOSPanel, 
-    StosOSCard, StosOSScrollView, StosOSPopup, StosOSLoadingOverlay,
+    StosOSCard, StosOSPopup,
     StosOSIconButton, StosOSToggleButton
 )
 from ui.theme import StosOSTheme
 from ui.animations import StosOSAnimations
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-class IdeaCard(StosOSCard):
-    """Individual idea card component"""
+
+# Tag suggestions offered in the idea form
+COMMON_TAGS = ("physics", "math", "chemistry", "research", "experiment", "theory", "project")
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_dt(ts: float) -> str:
+    """Format a timestamp for idea cards, memoized since strftime is slow"""
+    return datetime.fromtimestamp(ts).strftime('%m/%d %H:%M')
+
+
+# Shared worker pool for export generation and file writes; a burst of
+# exports queues up instead of spawning a thread each
+_EXPORT_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="idea-export")
+
+
+# Characters dropped from an idea's content when building export filenames
+_UNSAFE_TITLE_RE = re.compile(r'[^\w \-]+')
+
+
+def _dump_json(data: Dict[str, Any], fp: TextIO, default: Optional[Callable[[Any], Any]] = None,
+               indent: bool = True):
+    """Write export data as JSON to an open file
+    
+    ``default`` converts objects the encoder can't handle natively, as in
+    json.dump. With ``indent`` off the output uses compact separators.
+    """
+    if ORJSON_AVAILABLE:
+        # Dataclasses go through ``default`` too, as they would with json
+        option = orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        fp.write(orjson.dumps(data, default=default, option=option).decode('utf-8'))
+        return
+    
+    # json.dump encodes incrementally, so the document is never held whole
+    import json
+    if indent:
+        json.dump(data, fp, indent=2, ensure_ascii=False, default=default)
+    else:
+        json.dump(data, fp, separators=(',', ':'), ensure_ascii=False, default=default)
+
+
+def _dumps_json(data: Dict[str, Any]) -> str:
+    """Serialize export data as indented JSON, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    
+    import json
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _content_preview(content: str, limit: int = 120) -> str:
+    """Truncate idea content for card display"""
+    content = content.strip()
+    if len(content) > limit:
+        return content[:limit] + "..."
+    return content
+
+
+def _parse_tags(text: str) -> List[str]:
+    """Split comma separated tag input into lowercased tags, deduplicated in order"""
+    return list(dict.fromkeys(
+        tag.strip().lower() for tag in text.split(',') if tag.strip()
+    ))
+
+
+class _IdeaCardStyle:
+    """Theme values for the idea card, read once at import"""
+    
+    _COLOR_TEXT_PRIMARY = StosOSTheme.get_color('text_primary')
+    _SPACING_MD = StosOSTheme.get_spacing('md')
+    _SPACING_SM = StosOSTheme.get_spacing('sm')
+    _SPACING_XS = StosOSTheme.get_spacing('xs')
+    _FONT_BODY = StosOSTheme.get_font_size('body')
+    _FONT_CAPTION = StosOSTheme.get_font_size('caption')
+    _BUTTON_SIZE = (dp(35), dp(35))
+    
+    # Markup colors for the card's single label
+    _HEX_ACCENT_SECONDARY = get_hex_from_color(StosOSTheme.get_color('accent_secondary'))
+    _HEX_ACCENT_TERTIARY = get_hex_from_color(StosOSTheme.get_color('accent_tertiary'))
+    _HEX_TEXT_DISABLED = get_hex_from_color(StosOSTheme.get_color('text_disabled'))
+
+
+class IdeaCardRV(_IdeaCardStyle, RecycleDataViewBehavior, StosOSCard):
+    """
+    Recycled idea card used as the idea list RecycleView view class
+    
+    The widget tree is built once; refresh_view_attrs only rewrites label
+    text from the view data, and actions look the idea up by id when pressed.
+    """
+    
+    MAX_TAGS = 3
     
-    def __init__(self, idea: Idea, on_edit: Callable = None, on_delete: Callable = None, 
-                 on_export: Callable = None, **kwargs):
+    def __init__(self, **kwargs):
         super().__init__(**kwargs)
         
-        self.idea = idea
-        self.on_edit = on_edit
-        self.on_delete = on_delete
-        self.on_export = on_export
+        self.index = None
+        self.idea_id = None
+        self.on_action = None
         
         self.size_hint_y = None
         self.height = dp(150)
-        self.spacing = StosOSTheme.get_spacing('sm')
+        self.spacing = self._SPACING_SM
         
         self._build_ui()
     
     def _build_ui(self):
-        """Build the idea card UI"""
-        # Main content layout
-        content_layout = BoxLayout(orientation='horizontal', spacing=StosOSTheme.get_spacing('md'))
-        
-        # Left side - idea info
-        info_layout = BoxLayout(orientation='vertical', spacing=StosOSTheme.get_spacing('xs'))
-        
-        # Content preview
-        content_preview = self._get_content_preview()
-        content_label = StosOSLabel(
-            text=content_preview,
-            color=StosOSTheme.get_color('text_primary'),
-            font_size=StosOSTheme.get_font_size('body'),
-            size_hint_y=None,
-            height=dp(60),
-            text_size=(None, None)
-        )
-        content_label.bind(size=content_label.setter('text_size'))
-        info_layout.add_widget(content_label)
-        
-        # Tags
-        if self.idea.tags:
-            tags_layout = BoxLayout(
-                orientation='horizontal', 
-                size_hint_y=None, 
-                height=dp(30),
-                spacing=StosOSTheme.get_spacing('xs')
-            )
-            
-            # Show first few tags
-            displayed_tags = self.idea.tags[:3]
-            for tag in displayed_tags:
-                tag_label = StosOSLabel(
-                    text=f"#{tag}",
-                    color=StosOSTheme.get_color('accent_tertiary'),
-                    font_size=StosOSTheme.get_font_size('caption'),
-                    size_hint_x=None,
-                    width=dp(80)
-                )
-                tags_layout.add_widget(tag_label)
-            
-            # Show count if more tags exist
-            if len(self.idea.tags) > 3:
-                more_label = StosOSLabel(
-                    text=f"+{len(self.idea.tags) - 3}",
-                    color=StosOSTheme.get_color('text_disabled'),
-                    font_size=StosOSTheme.get_font_size('caption'),
-                    size_hint_x=None,
-                    width=dp(30)
-                )
-                tags_layout.add_widget(more_label)
-            
-            info_layout.add_widget(tags_layout)
-        
-        # Timestamps
-        timestamp_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(25))
-        
-        # Created date
-        created_text = f"Created: {self.idea.created_at.strftime('%m/%d %H:%M')}"
-        created_label = StosOSLabel(
-            text=created_text,
-            color=StosOSTheme.get_color('text_disabled'),
-            font_size=StosOSTheme.get_font_size('caption'),
-            size_hint_x=0.5
+        """Build the fixed card widget tree and keep a reference to its label"""
+        content_layout = BoxLayout(orientation='horizontal', spacing=self._SPACING_MD)
+        
+        # Preview, tags, timestamps and attachments share one markup label,
+        # so a card is a single texture instead of a label per field
+        self.info_label = StosOSLabel(
+            color=self._COLOR_TEXT_PRIMARY,
+            font_size=self._FONT_BODY,
+            markup=True,
+            valign='top'
         )
-        timestamp_layout.add_widget(created_label)
-        
-        # Updated date (if different from created)
-        if self.idea.updated_at != self.idea.created_at:
-            updated_text = f"Updated: {self.idea.updated_at.strftime('%m/%d %H:%M')}"
-            updated_label = StosOSLabel(
-                text=updated_text,
-                color=StosOSTheme.get_color('text_disabled'),
-                font_size=StosOSTheme.get_font_size('caption'),
-                size_hint_x=0.5,
-                halign='right'
-            )
-            updated_label.bind(size=updated_label.setter('text_size'))
-            timestamp_layout.add_widget(updated_label)
-        
-        info_layout.add_widget(timestamp_layout)
-        
-        # Attachments indicator
-        if self.idea.attachments:
-            attachment_label = StosOSLabel(
-                text=f"📎 {len(self.idea.attachments)} attachment(s)",
-                color=StosOSTheme.get_color('accent_secondary'),
-                font_size=StosOSTheme.get_font_size('caption'),
-                size_hint_y=None,
-                height=dp(20)
-            )
-            info_layout.add_widget(attachment_label)
-        
-        content_layout.add_widget(info_layout)
+        self.info_label.bind(size=self.info_label.setter('text_size'))
+        content_layout.add_widget(self.info_label)
         
         # Right side - action buttons
         actions_layout = BoxLayout(
             orientation='vertical', 
             size_hint_x=None, 
             width=dp(80),
-            spacing=StosOSTheme.get_spacing('xs')
+            spacing=self._SPACING_XS
         )
         
-        # Edit button
         edit_btn = StosOSIconButton(
             icon="✏",
-            size=(dp(35), dp(35)),
+            size=self._BUTTON_SIZE,
             button_type="secondary"
         )
         edit_btn.bind(on_press=self._on_edit)
         actions_layout.add_widget(edit_btn)
         
-        # Export button
         export_btn = StosOSIconButton(
             icon="📤",
-            size=(dp(35), dp(35)),
+            size=self._BUTTON_SIZE,
             button_type="accent"
         )
         export_btn.bind(on_press=self._on_export)
         actions_layout.add_widget(export_btn)
         
-        # Delete button
         delete_btn = StosOSIconButton(
             icon="🗑",
-            size=(dp(35), dp(35)),
+            size=self._BUTTON_SIZE,
             button_type="danger"
         )
         delete_btn.bind(on_press=self._on_delete)
@@ -187,27 +207,80 @@ class IdeaCard(StosOSCard):
         
         self.add_widget(content_layout)
     
-    def _get_content_preview(self) -> str:
-        """Get truncated content preview"""
-        content = self.idea.content.strip()
-        if len(content) > 120:
-            return content[:120] + "..."
-        return content
+    def refresh_view_attrs(self, rv, index, data):
+        """Rebind this card to the idea at ``index`` by updating its label text"""
+        self.index = index
+        self.idea_id = data['idea_id']
+        self.on_action = data.get('on_action')
+        
+        self.info_label.text = data['markup']
+    
+    @classmethod
+    def markup_for(cls, idea: Idea) -> str:
+        """Build the info label markup for an idea"""
+        caption = f"[size={int(cls._FONT_CAPTION)}]"
+        lines = [escape_markup(_content_preview(idea.content))]
+        
+        if idea.tags:
+            shown = "  ".join(f"#{tag}" for tag in idea.tags[:cls.MAX_TAGS])
+            tags_line = f"{caption}[color={cls._HEX_ACCENT_TERTIARY}]{escape_markup(shown)}[/color]"
+            extra_tags = len(idea.tags) - cls.MAX_TAGS
+            if extra_tags > 0:
+                tags_line += f"  [color={cls._HEX_TEXT_DISABLED}]+{extra_tags}[/color]"
+            lines.append(tags_line + "[/size]")
+        
+        dates = f"Created: {_fmt_dt(idea.created_at.timestamp())}"
+        if idea.updated_at != idea.created_at:
+            dates += f"    Updated: {_fmt_dt(idea.updated_at.timestamp())}"
+        lines.append(f"{caption}[color={cls._HEX_TEXT_DISABLED}]{dates}[/color][/size]")
+        
+        if idea.attachments:
+            lines.append(
+                f"{caption}[color={cls._HEX_ACCENT_SECONDARY}]"
+                f"📎 {len(idea.attachments)} attachment(s)[/color][/size]"
+            )
+        
+        return "\n".join(lines)
+    
+    def _dispatch_action(self, action: str):
+        """Forward a card action to the board with this card's idea id"""
+        if self.on_action and self.idea_id is not None:
+            self.on_action(action, self.idea_id)
     
     def _on_edit(self, *args):
         """Handle edit button press"""
-        if self.on_edit:
-            self.on_edit(self.idea)
+        self._dispatch_action('edit')
     
     def _on_export(self, *args):
         """Handle export button press"""
-        if self.on_export:
-            self.on_export(self.idea)
+        self._dispatch_action('export')
     
     def _on_delete(self, *args):
         """Handle delete button press"""
-        if self.on_delete:
-            self.on_delete(self.idea)
+        self._dispatch_action('delete')
+
+
+class TagOptionButton(RecycleDataViewBehavior, StosOSButton):
+    """Recycled tag filter option; presses are forwarded with the row's data"""
+    
+    def __init__(self, **kwargs):
+        kwargs.setdefault('button_type', "secondary")
+        super().__init__(**kwargs)
+        
+        self.index = None
+        self.option = None
+        self.bind(on_press=self._on_option_press)
+    
+    def refresh_view_attrs(self, rv, index, data):
+        """Rebind this button to the tag option at ``index``"""
+        self.index = index
+        self.option = data
+        self.text = data['text']
+    
+    def _on_option_press(self, *args):
+        """Handle option button press"""
+        if self.option is not None:
+            self.option['on_press'](self.option, self)
 
 
 class QuickCaptureWidget(StosOSPanel):
@@ -284,9 +357,7 @@ class QuickCaptureWidget(StosOSPanel):
             return
         
         # Parse tags
-        tags = []
-        if self.tags_input.text.strip():
-            tags = [tag.strip().lower() for tag in self.tags_input.text.split(',') if tag.strip()]
+        tags = _parse_tags(self.tags_input.text)
         
         # Create idea
         idea = Idea(content=content, tags=tags)
@@ -302,6 +373,21 @@ class QuickCaptureWidget(StosOSPanel):
 class IdeaFormPopup(StosOSPopup):
     """Popup for creating/editing ideas with rich text support"""
     
+    # Last created form, reused while it is not open
+    _popup_pool: Optional['IdeaFormPopup'] = None
+    
+    @classmethod
+    def acquire(cls, idea: Idea = None, on_save: Callable = None) -> 'IdeaFormPopup':
+        """Get a form for the given idea, reusing the pooled popup when it is closed"""
+        popup = cls._popup_pool
+        if popup is not None and popup.parent is None:
+            popup.reset(idea, on_save)
+            return popup
+        
+        popup = cls(idea=idea, on_save=on_save)
+        cls._popup_pool = popup
+        return popup
+    
     def __init__(self, idea: Idea = None, on_save: Callable = None, **kwargs):
         self.idea = idea
         self.on_save = on_save
@@ -354,8 +440,7 @@ class IdeaFormPopup(StosOSPopup):
             spacing=StosOSTheme.get_spacing('xs')
         )
         
-        common_tags = ["physics", "math", "chemistry", "research", "experiment", "theory", "project"]
-        for tag in common_tags:
+        for tag in COMMON_TAGS:
             tag_btn = StosOSButton(
                 text=f"#{tag}",
                 button_type="secondary",
@@ -363,19 +448,15 @@ class IdeaFormPopup(StosOSPopup):
                 width=dp(80),
                 font_size=StosOSTheme.get_font_size('caption')
             )
-            tag_btn.bind(on_press=lambda x, t=tag: self._add_tag_suggestion(t))
+            tag_btn.tag_name = tag
+            tag_btn.bind(on_press=self._on_tag_suggestion)
             suggestions_layout.add_widget(tag_btn)
         
         form_layout.add_widget(suggestions_layout)
         
-        # Attachments section (placeholder for future file attachment support)
-        if self.is_editing and self.idea.attachments:
-            attachments_label = StosOSLabel(
-                text=f"Attachments: {len(self.idea.attachments)} file(s)",
-                size_hint_y=None,
-                height=dp(25)
-            )
-            form_layout.add_widget(attachments_label)
+        # Attachments section (placeholder for future file attachment support),
+        # attached by _update_attachments_label when the idea has any
+        self.attachments_label = StosOSLabel(size_hint_y=None, height=dp(25))
         
         # Buttons
         button_layout = BoxLayout(
@@ -403,13 +484,41 @@ class IdeaFormPopup(StosOSPopup):
         
         form_layout.add_widget(button_layout)
         
+        self.form_layout = form_layout
+        self._update_attachments_label()
+        
         self.content = form_layout
     
+    def reset(self, idea: Idea = None, on_save: Callable = None):
+        """Rebind the form to another idea without rebuilding its widgets"""
+        self.idea = idea
+        self.on_save = on_save
+        self.is_editing = idea is not None
+        
+        self.title = "Edit Idea" if self.is_editing else "New Idea"
+        self.content_input.text = self.idea.content if self.is_editing else ""
+        self.tags_input.text = ', '.join(self.idea.tags) if self.is_editing else ""
+        self._update_attachments_label()
+    
+    def _update_attachments_label(self):
+        """Show the attachments label only when the edited idea has attachments"""
+        if self.attachments_label.parent:
+            self.form_layout.remove_widget(self.attachments_label)
+        
+        if self.is_editing and self.idea.attachments:
+            self.attachments_label.text = f"Attachments: {len(self.idea.attachments)} file(s)"
+            # Insert just above the button row (children are stored in reverse)
+            self.form_layout.add_widget(self.attachments_label, index=1)
+    
+    def _on_tag_suggestion(self, instance):
+        """Handle a tag suggestion button press"""
+        self._add_tag_suggestion(instance.tag_name)
+    
     def _add_tag_suggestion(self, tag: str):
         """Add suggested tag to tags input"""
         current_tags = self.tags_input.text.strip()
         if current_tags:
-            if tag not in current_tags.lower():
+            if tag not in _parse_tags(current_tags):
                 self.tags_input.text = f"{current_tags}, {tag}"
         else:
             self.tags_input.text = tag
@@ -424,9 +533,7 @@ class IdeaFormPopup(StosOSPopup):
                 return
             
             # Parse tags
-            tags = []
-            if self.tags_input.text.strip():
-                tags = [tag.strip().lower() for tag in self.tags_input.text.split(',') if tag.strip()]
+            tags = _parse_tags(self.tags_input.text)
             
             # Create or update idea
             if self.is_editing:
@@ -484,7 +591,8 @@ class ExportOptionsPopup(StosOSPopup):
             text="📝 Export as Markdown (.md)",
             button_type="accent"
         )
-        markdown_btn.bind(on_press=lambda x: self._export_format('markdown'))
+        markdown_btn.export_format = 'markdown'
+        markdown_btn.bind(on_press=self._on_format_press)
         format_buttons_layout.add_widget(markdown_btn)
         
         # Text export
@@ -492,7 +600,8 @@ class ExportOptionsPopup(StosOSPopup):
             text="📄 Export as Text (.txt)",
             button_type="secondary"
         )
-        text_btn.bind(on_press=lambda x: self._export_format('text'))
+        text_btn.export_format = 'text'
+        text_btn.bind(on_press=self._on_format_press)
         format_buttons_layout.add_widget(text_btn)
         
         # JSON export (for backup/import)
@@ -500,7 +609,8 @@ class ExportOptionsPopup(StosOSPopup):
             text="🔧 Export as JSON (.json)",
             button_type="secondary"
         )
-        json_btn.bind(on_press=lambda x: self._export_format('json'))
+        json_btn.export_format = 'json'
+        json_btn.bind(on_press=self._on_format_press)
         format_buttons_layout.add_widget(json_btn)
         
         export_layout.add_widget(format_buttons_layout)
@@ -515,6 +625,10 @@ class ExportOptionsPopup(StosOSPopup):
         
         self.content = export_layout
     
+    def _on_format_press(self, instance):
+        """Export in the format stored on the pressed button"""
+        self._export_format(instance.export_format)
+    
     def _export_format(self, format_type: str):
         """Handle export format selection"""
         if self.on_export:
@@ -530,6 +644,25 @@ class IdeaBoard(BaseModule):
     tag system, search/filtering, rich text editing, and export capabilities.
     """
     
+    # Sort key and reverse flag per sort option
+    _SORT_KEYS = {
+        "updated_at": (operator.attrgetter('updated_at'), True),
+        "created_at": (operator.attrgetter('created_at'), True),
+        "content": (lambda i: i.content.lower(), False),
+        "tags": (operator.attrgetter('tag_count'), True),
+    }
+    
+    # Statistics label text per stats key
+    _STATS_FORMATS = {
+        'total': "Total: {}",
+        'week': "This Week: {}",
+        'tags': "Tags: {}",
+        'recent': "Recent: {}",
+    }
+    
+    # Quiet period after the last change before the list refreshes
+    REFRESH_DELAY = 0.05
+    
     def __init__(self):
         super().__init__(
             module_id="idea_board",
@@ -538,23 +671,85 @@ class IdeaBoard(BaseModule):
         )
         
         self.db_manager = None
-        self.ideas = []
         self.filtered_ideas = []
-        self.current_filter = {"tag": None}
+        self.selected_tags: Set[str] = set()
         self.current_sort = "updated_at"
         self.search_term = ""
         
+        # Formatted card data per idea id; ordering changes reuse these as-is
+        self._view_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Serialized record per idea id, shared by the JSON exports, and
+        # rendered export bodies per idea id and format
+        self._record_cache: Dict[str, Dict[str, str]] = {}
+        self._render_cache: Dict[str, Dict[str, str]] = {}
+        # Export workers fill both caches; edits evict under the same lock
+        self._export_cache_lock = threading.Lock()
+        
+        # Loaded ideas by id, in load order; the primary idea store
+        self._ideas_by_id: Dict[str, Idea] = {}
+        
+        # Search/filter indexes: lowercased content+tags haystack per idea id,
+        # tag -> idea ids, and the tags each idea was indexed under
+        self._search_index: Dict[str, str] = {}
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._indexed_tags: Dict[str, Tuple[str, ...]] = {}
+        
+        # Ideas kept ordered by most recent update, with parallel bisect keys
+        self._ideas_by_updated: List[Idea] = []
+        self._updated_keys: List[float] = []
+        
+        # Debounced search refresh
+        self._search_trigger = Clock.create_trigger(self._do_search, 0.15)
+        
+        # Trailing-edge list refresh; the signature records which filter, sort
+        # and idea set filtered_ideas currently reflects
+        self._refresh_trigger = Clock.create_trigger(self._refresh_if_changed, self.REFRESH_DELAY)
+        self._ideas_version = 0
+        self._filter_signature = None
+        
+        # Tag filter options as (ideas version, sorted tag counts)
+        self._tag_counts_cache = (-1, [])
+        
+        # Last value shown per statistics label
+        self._stats_prev: Dict[str, int] = {}
+        
+        # Set until the ideas have been loaded from the database successfully
+        self._ideas_dirty = True
+        
+        # Reusable popups, built on first use
+        self._confirm_popup = None
+        self._confirm_label = None
+        self._pending_delete: Optional[Idea] = None
+        self._export_popup = None
+        self._export_message = None
+        
+        # Option popups that are open, so their buttons can close them
+        self._bulk_export_popup = None
+        self._sort_popup = None
+        
+        # Export target, created once in initialize()
+        self._export_dir = "data/exports"
+        
         # UI components
         self.quick_capture = None
         self.idea_list_layout = None
+        self.idea_rv = None
+        self.empty_label = None
         self.stats_panel = None
         self.filter_panel = None
         self.search_input = None
     
+    @property
+    def ideas(self) -> List[Idea]:
+        """All loaded ideas, in load order"""
+        return list(self._ideas_by_id.values())
+    
     def initialize(self) -> bool:
         """Initialize the idea board module"""
         try:
             self.db_manager = DatabaseManager()
+            os.makedirs(self._export_dir, exist_ok=True)
             self._load_ideas()
             self._initialized = True
             self.logger.info("Idea Board module initialized successfully")
@@ -669,6 +864,7 @@ class IdeaBoard(BaseModule):
             'tags': tags_label,
             'recent': recent_label
         }
+        self._stats_prev = {}
     
     def _build_filter_panel(self):
         """Build the search and filter panel"""
@@ -712,135 +908,278 @@ class IdeaBoard(BaseModule):
         self.filter_panel.add_widget(filter_layout)
     
     def _build_idea_list(self):
-        """Build the scrollable idea list"""
-        self.idea_list_layout = StosOSScrollView()
+        """Build the recycled idea list"""
+        self.idea_list_layout = FloatLayout()
         
-        self.idea_container = BoxLayout(
+        # Only the visible cards are instantiated; they are rebound to new
+        # ideas as the list scrolls
+        self.idea_rv = RecycleView(viewclass=IdeaCardRV)
+        idea_rv_layout = RecycleBoxLayout(
             orientation='vertical',
             spacing=StosOSTheme.get_spacing('sm'),
+            default_size=(None, dp(150)),
+            default_size_hint=(1, None),
             size_hint_y=None
         )
-        self.idea_container.bind(minimum_height=self.idea_container.setter('height'))
+        idea_rv_layout.bind(minimum_height=idea_rv_layout.setter('height'))
+        self.idea_rv.add_widget(idea_rv_layout)
+        self.idea_list_layout.add_widget(self.idea_rv)
         
-        self.idea_list_layout.add_widget(self.idea_container)
+        # Empty state, shown over the list when there is nothing to display
+        self.empty_label = StosOSLabel(
+            halign='center',
+            color=StosOSTheme.get_color('text_disabled')
+        )
+        self.empty_label.bind(size=self.empty_label.setter('text_size'))
+        self.idea_list_layout.add_widget(self.empty_label)
         
         # Initial idea list population
-        self._refresh_idea_list()    def 
-_load_ideas(self):
+        self._refresh_idea_list()
+    
+    def _load_ideas(self):
         """Load ideas from database"""
         try:
-            self.ideas = self.db_manager.get_ideas()
+            self._view_cache.clear()
+            self._reset_indexes()
+            
+            # Deserialize and index in a single pass over the rows
+            for idea in self.db_manager.iter_ideas():
+                self._index_idea(idea)
+            
             self._apply_filters_and_sort()
-            self.logger.debug(f"Loaded {len(self.ideas)} ideas")
+            self._ideas_dirty = False
+            self.logger.debug(f"Loaded {len(self._ideas_by_id)} ideas")
         except Exception as e:
             self.logger.error(f"Failed to load ideas: {e}")
-            self.ideas = []
             self.filtered_ideas = []
+            self._reset_indexes()
+            self._ideas_dirty = True
+    
+    def _reset_indexes(self):
+        """Empty the search, tag and ordering indexes"""
+        self._ideas_version += 1
+        self._ideas_by_id = {}
+        self._record_cache = {}
+        self._render_cache = {}
+        self._search_index = {}
+        self._tag_index = {}
+        self._indexed_tags = {}
+        self._ideas_by_updated = []
+        self._updated_keys = []
+    
+    def _index_idea(self, idea: Idea):
+        """Add an idea to the search and tag indexes"""
+        self._ideas_version += 1
+        self._ideas_by_id[idea.id] = idea
+        # Unique tags in first-seen order, remembered so unindexing can find
+        # the postings even after the idea's tags are edited in place
+        tags = tuple(dict.fromkeys(idea.tags))
+        self._indexed_tags[idea.id] = tags
+        # NUL separators keep a match from spanning content and tags
+        self._search_index[idea.id] = idea.content.lower() + '\x00' + '\x00'.join(tags)
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add(idea.id)
+        
+        # Negated timestamp so ascending bisect order is newest first
+        key = -idea.updated_at.timestamp()
+        pos = bisect.bisect_right(self._updated_keys, key)
+        self._updated_keys.insert(pos, key)
+        self._ideas_by_updated.insert(pos, idea)
+    
+    def _unindex_idea(self, idea_id: str):
+        """Remove an idea from the search and tag indexes"""
+        self._ideas_version += 1
+        self._ideas_by_id.pop(idea_id, None)
+        with self._export_cache_lock:
+            self._record_cache.pop(idea_id, None)
+            self._render_cache.pop(idea_id, None)
+        self._search_index.pop(idea_id, None)
+        for tag in self._indexed_tags.pop(idea_id, ()):
+            ids = self._tag_index[tag]
+            ids.discard(idea_id)
+            if not ids:
+                del self._tag_index[tag]
+        
+        for pos, idea in enumerate(self._ideas_by_updated):
+            if idea.id == idea_id:
+                del self._ideas_by_updated[pos]
+                del self._updated_keys[pos]
+                break
+    
+    def _selected_tag_ids(self) -> Optional[Set[str]]:
+        """Ids of ideas carrying every selected tag, or None when unfiltered"""
+        if not self.selected_tags:
+            return None
+        
+        # Intersect from the smallest posting set so the work is bounded by it
+        id_sets = sorted(
+            (self._tag_index.get(tag, set()) for tag in self.selected_tags),
+            key=len
+        )
+        return id_sets[0].intersection(*id_sets[1:])
+    
+    def _list_signature(self) -> tuple:
+        """Inputs that determine filtered_ideas"""
+        return (self.search_term, frozenset(self.selected_tags),
+                self.current_sort, self._ideas_version)
+    
+    def _request_refresh(self):
+        """Schedule a list refresh REFRESH_DELAY after the latest request"""
+        # Restart the countdown so a burst of changes refreshes once, after
+        # the last of them
+        self._refresh_trigger.cancel()
+        self._refresh_trigger()
+    
+    def _refresh_if_changed(self, *args):
+        """Re-filter and redraw the list unless its inputs are unchanged"""
+        if self._list_signature() == self._filter_signature:
+            return
+        self._apply_filters_and_sort()
+        self._refresh_idea_list()
     
     def _apply_filters_and_sort(self):
         """Apply current filters and sorting to idea list"""
-        # Start with all ideas
-        filtered = self.ideas[:]
-        
-        # Apply search filter
-        if self.search_term:
-            filtered = [
-                idea for idea in filtered
-                if self.search_term.lower() in idea.content.lower() or
-                   any(self.search_term.lower() in tag for tag in idea.tags)
-            ]
+        self._filter_signature = self._list_signature()
+        
+        # The default "most recent" order is maintained incrementally, so
+        # filtering that list keeps it sorted without another sort pass
+        presorted = self.current_sort == "updated_at"
+        
+        needle = self.search_term.lower() if self.search_term else None
+        tag_ids = self._selected_tag_ids()
         
-        # Apply tag filter
-        if self.current_filter["tag"]:
-            filtered = [idea for idea in filtered if self.current_filter["tag"] in idea.tags]
+        # Pick the smallest candidate source. An unsorted view can start from
+        # the tag's ideas directly; the presorted view walks its ordered list.
+        if tag_ids is not None and not presorted:
+            candidates = (self._ideas_by_id[idea_id] for idea_id in tag_ids)
+            tag_ids = None
+        else:
+            candidates = self._ideas_by_updated if presorted else self._ideas_by_id.values()
+        
+        # Apply tag and search filters (against the precomputed haystacks) in
+        # one pass
+        search_index = self._search_index
+        filtered = [
+            idea for idea in candidates
+            if (tag_ids is None or idea.id in tag_ids)
+            and (needle is None or needle in search_index[idea.id])
+        ]
         
-        # Apply sorting
-        if self.current_sort == "updated_at":
-            filtered.sort(key=lambda i: i.updated_at, reverse=True)
-        elif self.current_sort == "created_at":
-            filtered.sort(key=lambda i: i.created_at, reverse=True)
-        elif self.current_sort == "content":
-            filtered.sort(key=lambda i: i.content.lower())
-        elif self.current_sort == "tags":
-            filtered.sort(key=lambda i: len(i.tags), reverse=True)
+        # Apply sorting; "updated_at" needs none since its source is presorted
+        if not presorted:
+            key_fn, reverse = self._SORT_KEYS[self.current_sort]
+            filtered.sort(key=key_fn, reverse=reverse)
         
         self.filtered_ideas = filtered
     
     def _refresh_idea_list(self):
         """Refresh the idea list UI"""
-        # Clear existing idea cards
-        self.idea_container.clear_widgets()
-        
-        # Add idea cards
-        for idea in self.filtered_ideas:
-            idea_card = IdeaCard(
-                idea=idea,
-                on_edit=self._edit_idea,
-                on_delete=self._delete_idea,
-                on_export=self._export_single_idea
-            )
-            self.idea_container.add_widget(idea_card)
+        if self.idea_rv is None:
+            return
+        
+        # One assignment; the RecycleView only builds the visible rows
+        self.idea_rv.data = [self._view_for(idea) for idea in self.filtered_ideas]
         
         # Show empty state if no ideas
         if not self.filtered_ideas:
-            empty_label = StosOSLabel(
-                text="No ideas found" if self.search_term or self.current_filter["tag"] 
-                      else "No ideas yet. Capture your first brilliant thought!",
-                halign='center',
-                color=StosOSTheme.get_color('text_disabled'),
-                size_hint_y=None,
-                height=dp(100)
+            self.empty_label.text = (
+                "No ideas found" if self.search_term or self.selected_tags
+                else "No ideas yet. Capture your first brilliant thought!"
             )
-            empty_label.bind(size=empty_label.setter('text_size'))
-            self.idea_container.add_widget(empty_label)
+        else:
+            self.empty_label.text = ""
         
         # Update statistics
         self._update_statistics()
     
+    def _view_for(self, idea: Idea) -> Dict[str, Any]:
+        """Get the memoized view data for an idea, building it on first use"""
+        view = self._view_cache.get(idea.id)
+        if view is None:
+            view = self._view_cache[idea.id] = self._idea_view_data(idea)
+        return view
+    
+    def _idea_view_data(self, idea: Idea) -> Dict[str, Any]:
+        """Build the RecycleView data dict for an idea"""
+        return {
+            'idea_id': idea.id,
+            'on_action': self._on_card_action,
+            'markup': IdeaCardRV.markup_for(idea)
+        }
+    
+    def _find_idea(self, idea_id: str) -> Optional[Idea]:
+        """Find a loaded idea by id"""
+        return self._ideas_by_id.get(idea_id)
+    
+    def _on_card_action(self, action: str, idea_id: str):
+        """Handle an edit/export/delete press from a recycled idea card"""
+        idea = self._find_idea(idea_id)
+        if idea is None:
+            return
+        
+        if action == 'edit':
+            self._edit_idea(idea)
+        elif action == 'export':
+            self._export_single_idea(idea)
+        elif action == 'delete':
+            self._delete_idea(idea)
+    
     def _update_statistics(self):
         """Update the statistics panel"""
         if not hasattr(self, 'stats_labels'):
             return
         
-        total_ideas = len(self.ideas)
-        
-        # Ideas this week
-        week_ago = datetime.now() - timedelta(days=7)
-        week_ideas = len([i for i in self.ideas if i.created_at >= week_ago])
-        
-        # Unique tags
-        all_tags = set()
-        for idea in self.ideas:
-            all_tags.update(idea.tags)
-        unique_tags = len(all_tags)
-        
-        # Recent activity (last 24 hours)
-        day_ago = datetime.now() - timedelta(days=1)
-        recent_ideas = len([i for i in self.ideas if i.updated_at >= day_ago])
-        
-        self.stats_labels['total'].text = f"Total: {total_ideas}"
-        self.stats_labels['week'].text = f"This Week: {week_ideas}"
-        self.stats_labels['tags'].text = f"Tags: {unique_tags}"
-        self.stats_labels['recent'].text = f"Recent: {recent_ideas}"
+        total_ideas = len(self._ideas_by_id)
+        
+        # Ideas this week and recent activity (last 24 hours) in one pass
+        now = datetime.now()
+        week_ago = now - timedelta(days=7)
+        day_ago = now - timedelta(days=1)
+        week_ideas = 0
+        recent_ideas = 0
+        for idea in self._ideas_by_id.values():
+            if idea.created_at >= week_ago:
+                week_ideas += 1
+            if idea.updated_at >= day_ago:
+                recent_ideas += 1
+        
+        # Unique tags come straight from the tag index
+        unique_tags = len(self._tag_index)
+        
+        # Only touch labels whose value changed; each text set re-renders
+        # the label texture
+        values = {
+            'total': total_ideas,
+            'week': week_ideas,
+            'tags': unique_tags,
+            'recent': recent_ideas,
+        }
+        for key, value in values.items():
+            if self._stats_prev.get(key) != value:
+                self.stats_labels[key].text = self._STATS_FORMATS[key].format(value)
+                self._stats_prev[key] = value
     
     def _on_search_text_change(self, instance, text):
         """Handle search text change"""
         self.search_term = text.strip()
-        self._apply_filters_and_sort()
-        self._refresh_idea_list()
+        # Coalesce keystrokes; only the last change within the window refreshes
+        self._search_trigger()
+    
+    def _do_search(self, dt):
+        """Apply the pending search term"""
+        self._refresh_if_changed()
     
     def _show_new_idea_form(self, *args):
         """Show form for creating new idea"""
-        popup = IdeaFormPopup(on_save=self._save_new_idea)
+        popup = IdeaFormPopup.acquire(on_save=self._save_new_idea)
         popup.open_with_animation()
     
     def _save_quick_idea(self, idea: Idea):
         """Save quick captured idea to database"""
         try:
             if self.db_manager.create_idea(idea):
-                self.ideas.append(idea)
-                self._apply_filters_and_sort()
-                self._refresh_idea_list()
+                self._index_idea(idea)
+                self._request_refresh()
                 self.logger.info(f"Quick captured idea: {idea.content[:50]}...")
                 
                 # Show success feedback
@@ -855,9 +1194,8 @@ _load_ideas(self):
         """Save new idea to database"""
         try:
             if self.db_manager.create_idea(idea):
-                self.ideas.append(idea)
-                self._apply_filters_and_sort()
-                self._refresh_idea_list()
+                self._index_idea(idea)
+                self._request_refresh()
                 self.logger.info(f"Created new idea: {idea.content[:50]}...")
             else:
                 self.logger.error("Failed to save new idea to database")
@@ -867,15 +1205,17 @@ _load_ideas(self):
     
     def _edit_idea(self, idea: Idea):
         """Show form for editing existing idea"""
-        popup = IdeaFormPopup(idea=idea, on_save=self._save_edited_idea)
+        popup = IdeaFormPopup.acquire(idea=idea, on_save=self._save_edited_idea)
         popup.open_with_animation()
     
     def _save_edited_idea(self, idea: Idea):
         """Save edited idea to database"""
         try:
             if self.db_manager.update_idea(idea):
-                self._apply_filters_and_sort()
-                self._refresh_idea_list()
+                self._view_cache.pop(idea.id, None)
+                self._unindex_idea(idea.id)
+                self._index_idea(idea)
+                self._request_refresh()
                 self.logger.info(f"Updated idea: {idea.content[:50]}...")
             else:
                 self.logger.error("Failed to update idea in database")
@@ -885,29 +1225,25 @@ _load_ideas(self):
     
     def _delete_idea(self, idea: Idea):
         """Delete idea with confirmation"""
-        def confirm_delete():
-            try:
-                if self.db_manager.delete_idea(idea.id):
-                    self.ideas = [i for i in self.ideas if i.id != idea.id]
-                    self._apply_filters_and_sort()
-                    self._refresh_idea_list()
-                    self.logger.info(f"Deleted idea: {idea.content[:50]}...")
-                else:
-                    self.logger.error("Failed to delete idea from database")
-            except Exception as e:
-                self.logger.error(f"Error deleting idea: {e}")
-                self.handle_error(e, "delete_idea")
+        preview = idea.content[:100] + "..." if len(idea.content) > 100 else idea.content
+        
+        # The confirmation popup is built once and re-texted for each delete;
+        # its Delete button acts on whatever is pending when pressed
+        if self._confirm_popup is None:
+            self._build_confirm_popup()
+        self._pending_delete = idea
+        self._confirm_label.text = f"Are you sure you want to delete this idea?\n\n'{preview}'"
         
-        # Show confirmation popup
+        if self._confirm_popup.parent is None:
+            self._confirm_popup.open_with_animation()
+    
+    def _build_confirm_popup(self):
+        """Build the reusable delete confirmation popup"""
         content = BoxLayout(orientation='vertical', spacing=StosOSTheme.get_spacing('md'))
         
-        preview = idea.content[:100] + "..." if len(idea.content) > 100 else idea.content
-        message = StosOSLabel(
-            text=f"Are you sure you want to delete this idea?\n\n'{preview}'",
-            halign='center'
-        )
-        message.bind(size=message.setter('text_size'))
-        content.add_widget(message)
+        self._confirm_label = StosOSLabel(halign='center')
+        self._confirm_label.bind(size=self._confirm_label.setter('text_size'))
+        content.add_widget(self._confirm_label)
         
         button_layout = BoxLayout(orientation='horizontal', spacing=StosOSTheme.get_spacing('md'))
         
@@ -918,16 +1254,35 @@ _load_ideas(self):
         button_layout.add_widget(delete_btn)
         content.add_widget(button_layout)
         
-        popup = StosOSPopup(
+        self._confirm_popup = StosOSPopup(
             title="Confirm Delete",
             content=content,
             size_hint=(0.7, 0.5)
         )
         
-        cancel_btn.bind(on_press=popup.dismiss)
-        delete_btn.bind(on_press=lambda x: (confirm_delete(), popup.dismiss()))
-        
-        popup.open_with_animation()
+        cancel_btn.bind(on_press=self._confirm_popup.dismiss)
+        delete_btn.bind(on_press=self._on_confirm_delete)
+    
+    def _on_confirm_delete(self, *args):
+        """Delete the pending idea and close the confirmation popup"""
+        idea, self._pending_delete = self._pending_delete, None
+        self._confirm_popup.dismiss()
+        if idea is not None:
+            self._confirm_delete(idea)
+    
+    def _confirm_delete(self, idea: Idea):
+        """Remove a confirmed idea from the database and the board"""
+        try:
+            if self.db_manager.delete_idea(idea.id):
+                self._view_cache.pop(idea.id, None)
+                self._unindex_idea(idea.id)
+                self._request_refresh()
+                self.logger.info(f"Deleted idea: {idea.content[:50]}...")
+            else:
+                self.logger.error("Failed to delete idea from database")
+        except Exception as e:
+            self.logger.error(f"Error deleting idea: {e}")
+            self.handle_error(e, "delete_idea")
     
     def _export_single_idea(self, idea: Idea):
         """Show export options for single idea"""
@@ -936,29 +1291,27 @@ _load_ideas(self):
     
     def _export_all_ideas(self, *args):
         """Export all ideas"""
-        if not self.ideas:
+        if not self._ideas_by_id:
             # Show message - no ideas to export
             return
         
-        # Show format selection for all ideas
-        def export_all_format(format_type):
-            self._perform_bulk_export(self.ideas, format_type)
-        
         # Create simple format selection popup
         content = BoxLayout(orientation='vertical', spacing=StosOSTheme.get_spacing('md'))
         
         content.add_widget(StosOSLabel(
-            text=f"Export all {len(self.ideas)} ideas:",
+            text=f"Export all {len(self._ideas_by_id)} ideas:",
             size_hint_y=None,
             height=dp(30)
         ))
         
         markdown_btn = StosOSButton(text="📝 Markdown Collection", button_type="accent")
-        markdown_btn.bind(on_press=lambda x: (export_all_format('markdown_collection'), popup.dismiss()))
+        markdown_btn.export_format = 'markdown_collection'
+        markdown_btn.bind(on_press=self._on_bulk_format_press)
         content.add_widget(markdown_btn)
         
         json_btn = StosOSButton(text="🔧 JSON Backup", button_type="secondary")
-        json_btn.bind(on_press=lambda x: (export_all_format('json_backup'), popup.dismiss()))
+        json_btn.export_format = 'json_backup'
+        json_btn.bind(on_press=self._on_bulk_format_press)
         content.add_widget(json_btn)
         
         cancel_btn = StosOSButton(text="Cancel", button_type="secondary")
@@ -969,42 +1322,46 @@ _load_ideas(self):
             content=content,
             size_hint=(0.6, 0.5)
         )
+        self._bulk_export_popup = popup
         
         cancel_btn.bind(on_press=popup.dismiss)
         popup.open_with_animation()
     
+    def _on_bulk_format_press(self, instance):
+        """Export all ideas in the pressed button's format and close the popup"""
+        self._perform_bulk_export(self.ideas, instance.export_format)
+        if self._bulk_export_popup:
+            self._bulk_export_popup.dismiss()
+            self._bulk_export_popup = None
+    
     def _perform_export(self, idea: Idea, format_type: str):
         """Perform the actual export of a single idea"""
         try:
-            # Create exports directory if it doesn't exist
-            export_dir = "data/exports"
-            os.makedirs(export_dir, exist_ok=True)
+            export_dir = self._export_dir
             
             # Generate filename
-            safe_title = "".join(c for c in idea.content[:30] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            safe_title = safe_title.replace(' ', '_')
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            safe_title = _UNSAFE_TITLE_RE.sub('', idea.content[:30]).rstrip().replace(' ', '_')
+            
+            # One clock read shared by the filename and the file content
+            exported_at = datetime.now()
+            timestamp = exported_at.strftime('%Y%m%d_%H%M%S')
             
             if format_type == 'markdown':
                 filename = f"{export_dir}/idea_{safe_title}_{timestamp}.md"
-                content = self._generate_markdown_content(idea)
+                generate = self._generate_markdown_content
             elif format_type == 'text':
                 filename = f"{export_dir}/idea_{safe_title}_{timestamp}.txt"
-                content = self._generate_text_content(idea)
+                generate = self._generate_text_content
             elif format_type == 'json':
                 filename = f"{export_dir}/idea_{safe_title}_{timestamp}.json"
-                content = self._generate_json_content(idea)
+                generate = self._generate_json_content
             else:
                 return
             
-            # Write file
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            self.logger.info(f"Exported idea to {filename}")
-            
-            # Show success message
-            self._show_export_success(filename)
+            self._export_in_background(
+                filename, lambda fp: fp.write(generate(idea, exported_at)),
+                "Exported idea to", "export_idea"
+            )
             
         except Exception as e:
             self.logger.error(f"Error exporting idea: {e}")
@@ -1013,182 +1370,261 @@ _load_ideas(self):
     def _perform_bulk_export(self, ideas: List[Idea], format_type: str):
         """Perform bulk export of multiple ideas"""
         try:
-            # Create exports directory if it doesn't exist
-            export_dir = "data/exports"
-            os.makedirs(export_dir, exist_ok=True)
+            export_dir = self._export_dir
             
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            # One clock read shared by the filename and the file content
+            exported_at = datetime.now()
+            timestamp = exported_at.strftime('%Y%m%d_%H%M%S')
             
             if format_type == 'markdown_collection':
                 filename = f"{export_dir}/ideas_collection_{timestamp}.md"
-                content = self._generate_markdown_collection(ideas)
+                write = self._write_markdown_collection
             elif format_type == 'json_backup':
                 filename = f"{export_dir}/ideas_backup_{timestamp}.json"
-                content = self._generate_json_backup(ideas)
+                write = self._write_json_backup
             else:
                 return
             
-            # Write file
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            self.logger.info(f"Exported {len(ideas)} ideas to {filename}")
-            
-            # Show success message
-            self._show_export_success(filename)
+            # Snapshot the list so later board changes don't leak into the file
+            self._export_in_background(
+                filename, functools.partial(write, list(ideas), exported_at=exported_at),
+                f"Exported {len(ideas)} ideas to", "bulk_export_ideas"
+            )
             
         except Exception as e:
             self.logger.error(f"Error exporting ideas: {e}")
             self.handle_error(e, "bulk_export_ideas")
     
-    def _generate_markdown_content(self, idea: Idea) -> str:
+    def _export_in_background(self, filename: str, write: Callable[[TextIO], Any],
+                              log_message: str, context: str):
+        """Write an export file off the UI thread; ``write`` fills the open file"""
+        def export_job():
+            try:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    write(f)
+                
+                self.logger.info(f"{log_message} {filename}")
+                
+                # Show success message on main thread
+                Clock.schedule_once(lambda dt: self._show_export_success(filename), 0)
+                
+            except Exception as e:
+                self.logger.error(f"Error writing export {filename}: {e}")
+                Clock.schedule_once(lambda dt, error=e: self.handle_error(error, context), 0)
+        
+        _EXPORT_EXECUTOR.submit(export_job)
+    
+    def _generate_markdown_content(self, idea: Idea, exported_at: Optional[datetime] = None) -> str:
         """Generate markdown content for a single idea"""
-        content = f"# Idea: {idea.content[:50]}{'...' if len(idea.content) > 50 else ''}\n\n"
-        content += f"**Created:** {idea.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
-        content += f"**Updated:** {idea.updated_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        exported_at = exported_at or datetime.now()
+        body = self._rendered_body(idea, 'markdown', self._markdown_body)
+        return body + f"*Exported from StosOS Idea Board on {exported_at.strftime('%Y-%m-%d %H:%M:%S')}*\n"
+    
+    def _markdown_body(self, idea: Idea) -> str:
+        """Markdown for a single idea, up to the export footer"""
+        parts = [
+            f"# Idea: {idea.short_title}\n\n",
+            f"**Created:** {idea.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"**Updated:** {idea.updated_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        ]
         
         if idea.tags:
-            content += f"**Tags:** {', '.join(f'#{tag}' for tag in idea.tags)}\n\n"
+            parts.append(f"**Tags:** {', '.join(f'#{tag}' for tag in idea.tags)}\n\n")
         
-        content += "## Content\n\n"
-        content += idea.content + "\n\n"
+        parts.append("## Content\n\n")
+        parts.append(idea.content + "\n\n")
         
         if idea.attachments:
-            content += "## Attachments\n\n"
-            for attachment in idea.attachments:
-                content += f"- {attachment}\n"
-            content += "\n"
+            parts.append("## Attachments\n\n")
+            parts.extend(f"- {attachment}\n" for attachment in idea.attachments)
+            parts.append("\n")
         
-        content += "---\n"
-        content += f"*Exported from StosOS Idea Board on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
+        parts.append("---\n")
         
-        return content
+        return "".join(parts)
     
-    def _generate_text_content(self, idea: Idea) -> str:
+    def _generate_text_content(self, idea: Idea, exported_at: Optional[datetime] = None) -> str:
         """Generate plain text content for a single idea"""
-        content = f"IDEA: {idea.content[:50]}{'...' if len(idea.content) > 50 else ''}\n"
-        content += "=" * 60 + "\n\n"
-        content += f"Created: {idea.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
-        content += f"Updated: {idea.updated_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        exported_at = exported_at or datetime.now()
+        body = self._rendered_body(idea, 'text', self._text_body)
+        return body + f"Exported from StosOS Idea Board on {exported_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
+    
+    def _text_body(self, idea: Idea) -> str:
+        """Plain text for a single idea, up to the export footer"""
+        parts = [
+            f"IDEA: {idea.short_title}\n",
+            "=" * 60 + "\n\n",
+            f"Created: {idea.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Updated: {idea.updated_at.strftime('%Y-%m-%d %H:%M:%S')}\n",
+        ]
         
         if idea.tags:
-            content += f"Tags: {', '.join(idea.tags)}\n"
+            parts.append(f"Tags: {', '.join(idea.tags)}\n")
         
-        content += "\nCONTENT:\n"
-        content += "-" * 20 + "\n"
-        content += idea.content + "\n\n"
+        parts.append("\nCONTENT:\n")
+        parts.append("-" * 20 + "\n")
+        parts.append(idea.content + "\n\n")
         
         if idea.attachments:
-            content += "ATTACHMENTS:\n"
-            content += "-" * 20 + "\n"
-            for attachment in idea.attachments:
-                content += f"- {attachment}\n"
-            content += "\n"
-        
-        content += f"Exported from StosOS Idea Board on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            parts.append("ATTACHMENTS:\n")
+            parts.append("-" * 20 + "\n")
+            parts.extend(f"- {attachment}\n" for attachment in idea.attachments)
+            parts.append("\n")
         
-        return content
+        return "".join(parts)
     
-    def _generate_json_content(self, idea: Idea) -> str:
+    def _rendered_body(self, idea: Idea, fmt: str, render: Callable[[Idea], str]) -> str:
+        """Get the memoized export body of an idea in a format, rendering it on first use"""
+        cache = self._render_cache
+        body = cache.get(idea.id, {}).get(fmt)
+        if body is None:
+            stamp = idea.updated_at
+            body = render(idea)
+            # Runs on export workers: an idea edited meanwhile is not memoized,
+            # and a cache swapped out by a reload only receives orphaned entries
+            with self._export_cache_lock:
+                if idea.updated_at == stamp:
+                    cache.setdefault(idea.id, {})[fmt] = body
+        return body
+    
+    def _generate_json_content(self, idea: Idea, exported_at: Optional[datetime] = None) -> str:
         """Generate JSON content for a single idea"""
-        import json
+        exported_at = exported_at or datetime.now()
         
         data = {
-            "idea": idea.to_dict(),
+            "idea": self._record_for(idea),
             "export_info": {
-                "exported_at": datetime.now().isoformat(),
+                "exported_at": exported_at.isoformat(),
                 "exported_by": "StosOS Idea Board",
                 "format_version": "1.0"
             }
         }
         
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        return _dumps_json(data)
+    
+    def _record_for(self, idea: Idea) -> Dict[str, str]:
+        """Get the memoized storage dict for an idea, building it on first use"""
+        cache = self._record_cache
+        record = cache.get(idea.id)
+        if record is None:
+            stamp = idea.updated_at
+            record = idea.to_dict()
+            # Same worker-thread guard as _rendered_body
+            with self._export_cache_lock:
+                if idea.updated_at == stamp:
+                    cache[idea.id] = record
+        return record
     
-    def _generate_markdown_collection(self, ideas: List[Idea]) -> str:
+    def _generate_markdown_collection(self, ideas: List[Idea],
+                                      exported_at: Optional[datetime] = None) -> str:
         """Generate markdown collection of multiple ideas"""
-        content = f"# StosOS Ideas Collection\n\n"
-        content += f"**Exported:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        content += f"**Total Ideas:** {len(ideas)}\n\n"
-        
-        # Table of contents
-        content += "## Table of Contents\n\n"
+        buffer = io.StringIO()
+        self._write_markdown_collection(ideas, buffer, exported_at)
+        return buffer.getvalue()
+    
+    def _write_markdown_collection(self, ideas: List[Idea], fp: TextIO,
+                                   exported_at: Optional[datetime] = None):
+        """Write a markdown collection of multiple ideas to an open file"""
+        exported_at = exported_at or datetime.now()
+        
+        # Header and table of contents are small, so they are built up front;
+        # idea sections are written one at a time instead of buffered
+        toc = [
+            "# StosOS Ideas Collection\n\n",
+            f"**Exported:** {exported_at.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"**Total Ideas:** {len(ideas)}\n\n",
+            "## Table of Contents\n\n",
+        ]
         for i, idea in enumerate(ideas, 1):
-            title = idea.content[:50] + "..." if len(idea.content) > 50 else idea.content
-            title = title.replace('\n', ' ').strip()
-            content += f"{i}. [{title}](#idea-{i})\n"
-        content += "\n---\n\n"
+            title = idea.short_title.replace('\n', ' ').strip()
+            toc.append(f"{i}. [{title}](#idea-{i})\n")
+        toc.append("\n---\n\n")
+        fp.writelines(toc)
         
-        # Individual ideas
         for i, idea in enumerate(ideas, 1):
-            content += f"## Idea {i}\n\n"
-            content += f"**Created:** {idea.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            content += f"**Updated:** {idea.updated_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            section = [
+                f"## Idea {i}\n\n",
+                f"**Created:** {idea.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n",
+                f"**Updated:** {idea.updated_at.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            ]
             
             if idea.tags:
-                content += f"**Tags:** {', '.join(f'#{tag}' for tag in idea.tags)}\n"
+                section.append(f"**Tags:** {', '.join(f'#{tag}' for tag in idea.tags)}\n")
             
-            content += "\n### Content\n\n"
-            content += idea.content + "\n\n"
+            section.append("\n### Content\n\n")
+            section.append(idea.content + "\n\n")
             
             if idea.attachments:
-                content += "### Attachments\n\n"
-                for attachment in idea.attachments:
-                    content += f"- {attachment}\n"
-                content += "\n"
+                section.append("### Attachments\n\n")
+                section.extend(f"- {attachment}\n" for attachment in idea.attachments)
+                section.append("\n")
             
-            content += "---\n\n"
+            section.append("---\n\n")
+            fp.writelines(section)
         
-        content += f"*Collection exported from StosOS Idea Board*\n"
-        
-        return content
+        fp.write("*Collection exported from StosOS Idea Board*\n")
     
-    def _generate_json_backup(self, ideas: List[Idea]) -> str:
+    def _generate_json_backup(self, ideas: List[Idea],
+                              exported_at: Optional[datetime] = None) -> str:
         """Generate JSON backup of multiple ideas"""
-        import json
+        buffer = io.StringIO()
+        self._write_json_backup(ideas, buffer, exported_at)
+        return buffer.getvalue()
+    
+    def _write_json_backup(self, ideas: List[Idea], fp: TextIO,
+                           exported_at: Optional[datetime] = None):
+        """Write a JSON backup of multiple ideas to an open file"""
+        exported_at = exported_at or datetime.now()
         
         data = {
-            "ideas": [idea.to_dict() for idea in ideas],
+            # Encoded lazily through _json_default as the encoder reaches each idea
+            "ideas": ideas,
             "export_info": {
-                "exported_at": datetime.now().isoformat(),
+                "exported_at": exported_at.isoformat(),
                 "exported_by": "StosOS Idea Board",
                 "format_version": "1.0",
                 "total_ideas": len(ideas)
             }
         }
         
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        # Backups are read back by software, not people, so skip the indentation
+        _dump_json(data, fp, default=self._json_default, indent=False)
+    
+    def _json_default(self, obj: Any) -> Dict[str, str]:
+        """Encode ideas met by the JSON encoder as their memoized records"""
+        if isinstance(obj, Idea):
+            return self._record_for(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
     
     def _show_export_success(self, filename: str):
         """Show export success message"""
-        content = BoxLayout(orientation='vertical', spacing=StosOSTheme.get_spacing('md'))
-        
-        message = StosOSLabel(
-            text=f"Successfully exported to:\n{filename}",
-            halign='center'
-        )
-        message.bind(size=message.setter('text_size'))
-        content.add_widget(message)
-        
-        ok_btn = StosOSButton(text="OK", button_type="accent")
-        content.add_widget(ok_btn)
-        
-        popup = StosOSPopup(
-            title="Export Complete",
-            content=content,
-            size_hint=(0.7, 0.4)
-        )
+        if self._export_popup is None:
+            content = BoxLayout(orientation='vertical', spacing=StosOSTheme.get_spacing('md'))
+            
+            self._export_message = StosOSLabel(halign='center')
+            self._export_message.bind(size=self._export_message.setter('text_size'))
+            content.add_widget(self._export_message)
+            
+            ok_btn = StosOSButton(text="OK", button_type="accent")
+            content.add_widget(ok_btn)
+            
+            self._export_popup = StosOSPopup(
+                title="Export Complete",
+                content=content,
+                size_hint=(0.7, 0.4)
+            )
+            
+            ok_btn.bind(on_press=self._export_popup.dismiss)
         
-        ok_btn.bind(on_press=popup.dismiss)
-        popup.open_with_animation()
+        self._export_message.text = f"Successfully exported to:\n{filename}"
+        if self._export_popup.parent is None:
+            self._export_popup.open_with_animation()
     
     def _show_tag_filter(self, *args):
         """Show tag filter options"""
-        # Get all unique tags
-        all_tags = set()
-        for idea in self.ideas:
-            all_tags.update(idea.tags)
+        tag_counts = self._sorted_tag_counts()
         
-        if not all_tags:
+        if not tag_counts:
             return
         
         # Create tag selection popup
@@ -1197,60 +1633,92 @@ _load_ideas(self):
         # All tags option
         all_btn = StosOSButton(
             text="All Tags",
-            button_type="accent" if not self.current_filter["tag"] else "secondary"
+            button_type="accent" if not self.selected_tags else "secondary"
         )
-        all_btn.bind(on_press=lambda x: self._apply_tag_filter(None))
         content.add_widget(all_btn)
         
-        # Individual tags
-        scroll_view = StosOSScrollView(size_hint_y=0.7)
-        tag_container = BoxLayout(orientation='vertical', spacing=StosOSTheme.get_spacing('xs'), size_hint_y=None)
-        tag_container.bind(minimum_height=tag_container.setter('height'))
-        
-        for tag in sorted(all_tags):
-            tag_count = sum(1 for idea in self.ideas if tag in idea.tags)
-            tag_btn = StosOSButton(
-                text=f"#{tag} ({tag_count})",
-                button_type="accent" if self.current_filter["tag"] == tag else "secondary",
-                size_hint_y=None,
-                height=dp(40)
-            )
-            tag_btn.bind(on_press=lambda x, t=tag: self._apply_tag_filter(t))
-            tag_container.add_widget(tag_btn)
+        # Individual tags; each press toggles the tag in the selection. Only
+        # the visible rows get a button widget.
+        tag_rv = RecycleView(viewclass=TagOptionButton, size_hint_y=0.7)
+        tag_rv_layout = RecycleBoxLayout(
+            orientation='vertical',
+            spacing=StosOSTheme.get_spacing('xs'),
+            default_size=(None, dp(40)),
+            default_size_hint=(1, None),
+            size_hint_y=None
+        )
+        tag_rv_layout.bind(minimum_height=tag_rv_layout.setter('height'))
+        tag_rv.add_widget(tag_rv_layout)
+        tag_rv.data = [
+            {
+                'tag': tag,
+                'count': tag_count,
+                'text': self._tag_option_text(tag, tag_count),
+                'on_press': self._on_tag_option_press
+            }
+            for tag, tag_count in tag_counts
+        ]
+        content.add_widget(tag_rv)
         
-        scroll_view.add_widget(tag_container)
-        content.add_widget(scroll_view)
+        done_btn = StosOSButton(text="Done", button_type="secondary", size_hint_y=None, height=dp(40))
+        content.add_widget(done_btn)
         
         popup = StosOSPopup(
-            title="Filter by Tag",
+            title="Filter by Tags",
             content=content,
             size_hint=(0.6, 0.7)
         )
         
-        # Update filter button text when selection changes
-        def update_and_close(tag):
-            self._apply_tag_filter(tag)
+        def clear_and_close(*args):
+            self._apply_tag_filter(None)
             popup.dismiss()
         
-        all_btn.bind(on_press=lambda x: update_and_close(None))
-        for child in tag_container.children:
-            if hasattr(child, 'tag'):
-                child.bind(on_press=lambda x, t=child.tag: update_and_close(t))
+        all_btn.bind(on_press=clear_and_close)
+        done_btn.bind(on_press=popup.dismiss)
         
         popup.open_with_animation()
     
-    def _apply_tag_filter(self, tag: Optional[str]):
-        """Apply tag filter"""
-        self.current_filter["tag"] = tag
-        
-        # Update filter button text
-        if tag:
-            self.tag_filter_btn.text = f"#{tag}"
+    def _tag_option_text(self, tag: str, tag_count: int) -> str:
+        """Label for a tag filter option, checked when the tag is selected"""
+        mark = "✓ " if tag in self.selected_tags else ""
+        return f"{mark}#{tag} ({tag_count})"
+    
+    def _sorted_tag_counts(self) -> List[tuple]:
+        """Alphabetical (tag, idea count) pairs, rebuilt only after idea changes"""
+        version, tag_counts = self._tag_counts_cache
+        if version != self._ideas_version:
+            tag_counts = [(tag, len(ids)) for tag, ids in sorted(self._tag_index.items())]
+            self._tag_counts_cache = (self._ideas_version, tag_counts)
+        return tag_counts
+    
+    def _on_tag_option_press(self, option: Dict[str, Any], button):
+        """Toggle a tag from the filter popup and update its row text"""
+        self._toggle_tag_filter(option['tag'])
+        option['text'] = button.text = self._tag_option_text(option['tag'], option['count'])
+    
+    def _toggle_tag_filter(self, tag: str):
+        """Add or remove a tag from the multi-tag filter"""
+        if tag in self.selected_tags:
+            self.selected_tags.discard(tag)
         else:
+            self.selected_tags.add(tag)
+        
+        self._on_tag_selection_changed()
+    
+    def _apply_tag_filter(self, tag: Optional[str]):
+        """Filter by a single tag, or clear the tag filter when tag is None"""
+        self.selected_tags = {tag} if tag else set()
+        self._on_tag_selection_changed()
+    
+    def _on_tag_selection_changed(self):
+        """Update the filter button text and re-filter the list"""
+        if not self.selected_tags:
             self.tag_filter_btn.text = "All Tags"
+        else:
+            first, *rest = sorted(self.selected_tags)
+            self.tag_filter_btn.text = f"#{first} +{len(rest)}" if rest else f"#{first}"
         
-        self._apply_filters_and_sort()
-        self._refresh_idea_list()
+        self._request_refresh()
     
     def _show_sort_options(self, *args):
         """Show sort options"""
@@ -1268,32 +1736,31 @@ _load_ideas(self):
                 text=sort_label,
                 button_type="accent" if self.current_sort == sort_key else "secondary"
             )
-            btn.bind(on_press=lambda x, key=sort_key, label=sort_label: self._apply_sort(key, label))
+            btn.sort_key = sort_key
+            btn.sort_label = sort_label
+            btn.bind(on_press=self._on_sort_option_press)
             content.add_widget(btn)
         
-        popup = StosOSPopup(
+        self._sort_popup = StosOSPopup(
             title="Sort Ideas",
             content=content,
             size_hint=(0.5, 0.6)
         )
-        
-        def update_and_close(key, label):
-            self._apply_sort(key, label)
-            popup.dismiss()
-        
-        for child in content.children:
-            if hasattr(child, 'sort_key'):
-                child.bind(on_press=lambda x, k=child.sort_key, l=child.sort_label: update_and_close(k, l))
-        
-        popup.open_with_animation()
+        self._sort_popup.open_with_animation()
+    
+    def _on_sort_option_press(self, instance):
+        """Apply the pressed button's sort option and close the popup"""
+        self._apply_sort(instance.sort_key, instance.sort_label)
+        if self._sort_popup:
+            self._sort_popup.dismiss()
+            self._sort_popup = None
     
     def _apply_sort(self, sort_key: str, sort_label: str):
         """Apply sort option"""
         self.current_sort = sort_key
         self.sort_btn.text = f"Sort: {sort_label}"
         
-        self._apply_filters_and_sort()
-        self._refresh_idea_list()
+        self._request_refresh()
     
     def handle_voice_command(self, command: str) -> bool:
         """Handle voice commands for idea board"""
@@ -1318,11 +1785,19 @@ _load_ideas(self):
     def on_activate(self):
         """Called when module becomes active"""
         super().on_activate()
-        # Refresh data when activated
-        self._load_ideas()
-        self._refresh_idea_list()
+        # This module's own writes update the indexes in place, so the
+        # database only needs re-reading if the last load didn't succeed
+        if self._ideas_dirty:
+            self._load_ideas()
+            self._refresh_idea_list()
+        else:
+            self._refresh_if_changed()
+            # Week/recent counts depend on the current time
+            self._update_statistics()
     
     def cleanup(self):
         """Cleanup module resources"""
         super().cleanup()
-        # Clear any timers or resources if needed
\ No newline at end of file
+        # Clear any timers or resources if needed
+        self._search_trigger.cancel()
+        self._refresh_trigger.cancel()
@@ -20,6 +20,9 @@ from ui.components import StosOSButton, StosOSLabel
 class PowerDemoModule(BaseModule):
     """Interactive power management demonstration"""
     
+    # Seconds between status refreshes while the module is visible
+    UPDATE_INTERVAL = 2.0
+    
     def __init__(self):
         super().__init__(
             module_id="power_demo",
@@ -32,6 +35,11 @@ class PowerDemoModule(BaseModule):
         self.idle_label = None
         self.update_event = None
         self.screen = None
+        
+        # Last values shown, so unchanged labels are not re-rendered
+        self._last_state = None
+        self._last_brightness = None
+        self._last_idle_bucket = None
     
     def initialize(self):
         """Initialize the power demo module"""
@@ -80,7 +88,7 @@ class PowerDemoModule(BaseModule):
             main_layout.add_widget(controls_layout)
             
             # Start status updates
-            self.update_event = Clock.schedule_interval(self._update_status, 1.0)
+            self._start_status_updates()
             
             return main_layout
             
@@ -215,20 +223,50 @@ class PowerDemoModule(BaseModule):
         
         return controls_container
     
+    def _start_status_updates(self):
+        """(Re)start the periodic status refresh"""
+        self._stop_status_updates()
+        self.update_event = Clock.schedule_interval(self._update_status, self.UPDATE_INTERVAL)
+    
+    def _stop_status_updates(self):
+        """Stop the periodic status refresh"""
+        if self.update_event:
+            self.update_event.cancel()
+            self.update_event = None
+    
+    def on_activate(self):
+        """Resume status updates when the demo becomes visible"""
+        super().on_activate()
+        if self.status_label:
+            self._update_status(0)
+            self._start_status_updates()
+    
+    def on_deactivate(self):
+        """Pause status updates while the demo is hidden"""
+        super().on_deactivate()
+        self._stop_status_updates()
+    
     def _update_status(self, dt):
-        """Update status display"""
+        """Update status display, touching only labels whose value changed"""
         try:
             if self.status_label:
                 state = self.power_manager.get_power_state()
-                self.status_label.text = f'Power State: {state.value.upper()}'
+                if state != self._last_state:
+                    self.status_label.text = f'Power State: {state.value.upper()}'
+                    self._last_state = state
             
             if self.brightness_label:
                 brightness = self.power_manager.get_brightness()
-                self.brightness_label.text = f'Brightness: {brightness}%'
+                if brightness != self._last_brightness:
+                    self.brightness_label.text = f'Brightness: {brightness}%'
+                    self._last_brightness = brightness
             
             if self.idle_label:
-                idle_time = self.power_manager.get_idle_time()
-                self.idle_label.text = f'Idle Time: {idle_time:.1f}s'
+                # Half-second buckets; finer changes aren't worth a re-render
+                idle_bucket = round(self.power_manager.get_idle_time() * 2) / 2
+                if idle_bucket != self._last_idle_bucket:
+                    self.idle_label.text = f'Idle Time: {idle_bucket:.1f}s'
+                    self._last_idle_bucket = idle_bucket
                 
         except Exception as e:
             self.logger.error(f"Status update error: {e}")
@@ -269,9 +307,7 @@ class PowerDemoModule(BaseModule):
     def cleanup(self):
         """Clean up the module"""
         try:
-            if self.update_event:
-                self.update_event.cancel()
-                self.update_event = None
+            self._stop_status_updates()
             
             super().cleanup()
             self.logger.info("Power demo module cleaned up")
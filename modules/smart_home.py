@@ -11,97 +11,243 @@ Provides comprehensive smart home device control including:
 Requirements: 3.1, 3.2, 3.3, 3.4, 3.5
 """
 
-import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Callable
+import functools
+import itertools
+import operator
+import queue
+import re
+import threading
+import time
+from types import MappingProxyType
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Callable, Tuple, Pattern
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.gridlayout import GridLayout
-from kivy.uix.floatlayout import FloatLayout
+from kivy.uix.slider import Slider
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
 from kivy.clock import Clock
 from kivy.metrics import dp
+from kivy.utils import escape_markup, get_hex_from_color
 
 from core.base_module import BaseModule
 from core.database_manager import DatabaseManager
 from models.smart_device import SmartDevice, DeviceType, Platform
-from services.google_assistant_service import GoogleAssistantService
-from services.alexa_service import AlexaService
 from ui.components import (
     StosOSButton, StosOSLabel, StosOSTextInput, StosOSPanel, 
-    StosOSCard, StosOSScrollView, StosOSPopup, StosOSLoadingOverlay,
-    StosOSIconButton, StosOSToggleButton
+    StosOSCard, StosOSScrollView, StosOSIconButton, StosOSToggleButton
 )
 from ui.theme import StosOSTheme
-from ui.animations import StosOSAnimations
 
 
-class DeviceCard(StosOSCard):
-    """Individual smart device card component"""
+# Values a device card shows; a card skips updates whose state is unchanged
+_CardState = namedtuple('_CardState', [
+    'name', 'device_type', 'room',
+    'power', 'brightness', 'volume', 'target_temperature', 'muted'
+])
+
+# Shared worker pool for room and scene commands and status refreshes;
+# service calls are network-bound, so they overlap
+_CONTROL_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="smarthome-io")
+
+# Scene setting -> (command, parameter name) for the settings sent with their
+# value as the single parameter; "power" picks its command from the value
+_SETTING_COMMANDS = {
+    "brightness": ("set_brightness", "brightness"),
+    "volume": ("set_volume", "volume"),
+    "temperature": ("set_temperature", "temperature"),
+    "color": ("set_color", "color"),
+}
+
+# Commands setting the same device state; a queued command is dropped when
+# a newer one for the same state of the device comes in
+_COMMAND_STATES = {
+    "power_on": "power",
+    "power_off": "power",
+    "mute": "mute",
+    "unmute": "mute",
+    "play": "playback",
+    "pause": "playback",
+}
+
+# Shared read-only parameters for commands that take none
+_NO_PARAMETERS = MappingProxyType({})
+
+# Voice command keywords, found in one pass over the command
+_VOICE_KEYWORDS = re.compile(r"turn on|turn off|lights|activate|scene")
+
+# Device lookups for voice commands: ids by type, ids by lowercased name,
+# and one pattern matching any of the names
+_VoiceIndex = namedtuple('_VoiceIndex', ['devices_by_type', 'devices_by_name', 'name_pattern'])
+
+
+def _compile_names(names) -> Optional[Pattern]:
+    """Compile names into one alternation, longest first so it wins overlaps"""
+    names = sorted((name for name in names if name), key=len, reverse=True)
+    if not names:
+        return None
+    return re.compile("|".join(map(re.escape, names)))
+
+
+# Card icon per device type
+_DEVICE_ICONS = {
+    DeviceType.LIGHT: "💡",
+    DeviceType.THERMOSTAT: "🌡️",
+    DeviceType.SPEAKER: "🔊",
+    DeviceType.SWITCH: "🔌",
+    DeviceType.SENSOR: "📡",
+    DeviceType.CAMERA: "📹",
+    DeviceType.LOCK: "🔒",
+    DeviceType.FAN: "🌀",
+    DeviceType.OTHER: "📱"
+}
+
+
+class _SmartHomeStyle:
+    """Theme values shared by the smart home cards and module, read once at import"""
+    
+    _COLOR_ERROR = StosOSTheme.get_color('error')
+    _COLOR_SUCCESS = StosOSTheme.get_color('success')
+    _COLOR_TEXT_DISABLED = StosOSTheme.get_color('text_disabled')
+    _COLOR_TEXT_PRIMARY = StosOSTheme.get_color('text_primary')
+    _COLOR_TEXT_SECONDARY = StosOSTheme.get_color('text_secondary')
+    _COLOR_WARNING = StosOSTheme.get_color('warning')
+    _SPACING_MD = StosOSTheme.get_spacing('md')
+    _SPACING_SM = StosOSTheme.get_spacing('sm')
+    _SPACING_XS = StosOSTheme.get_spacing('xs')
+    _FONT_BODY = StosOSTheme.get_font_size('body')
+    _FONT_CAPTION = StosOSTheme.get_font_size('caption')
+    
+    # Pixel sizes used on card and panel builds; display density doesn't
+    # change at runtime
+    _H30 = dp(30)
+    _H35 = dp(35)
+    _H40 = dp(40)
+    _H50 = dp(50)
+    _H60 = dp(60)
+    _H80 = dp(80)
+    _H100 = dp(100)
+    
+    # Markup colors for the single-label card header
+    _HEX_ACCENT_SECONDARY = get_hex_from_color(StosOSTheme.get_color('accent_secondary'))
+    _HEX_ERROR = get_hex_from_color(StosOSTheme.get_color('error'))
+    _HEX_SUCCESS = get_hex_from_color(StosOSTheme.get_color('success'))
+    _HEX_TEXT_SECONDARY = get_hex_from_color(StosOSTheme.get_color('text_secondary'))
+
+
+# Card status markup per platform; it only depends on the platform, so every
+# card shares one of these. Online cards show platform over online status on
+# their right, offline cards one caption line under the header
+_STATUS_MARKUP = {
+    platform: (
+        f"[color={_SmartHomeStyle._HEX_ACCENT_SECONDARY}]{platform.value}[/color]\n"
+        f"[color={_SmartHomeStyle._HEX_SUCCESS}]🟢 Online[/color]"
+    )
+    for platform in Platform
+}
+_OFFLINE_MARKUP = {
+    platform: (
+        f"[size={int(_SmartHomeStyle._FONT_CAPTION)}]"
+        f"[color={_SmartHomeStyle._HEX_ACCENT_SECONDARY}]{platform.value}[/color] • "
+        f"[color={_SmartHomeStyle._HEX_ERROR}]🔴 Offline[/color][/size]"
+    )
+    for platform in Platform
+}
+
+
+class DeviceCard(_SmartHomeStyle, RecycleDataViewBehavior, StosOSCard):
+    """
+    Individual smart device card component
     
-    def __init__(self, device: SmartDevice, on_control: Callable = None, **kwargs):
+    Status refreshes are applied to the existing widgets; the card is only
+    rebuilt when the device's capabilities or online state change. Offline
+    devices can't be controlled, so their card is a single header label. Also the
+    view class of the devices RecycleView, where it is created empty and
+    bound to a device by refresh_view_attrs.
+    """
+    
+    CARD_HEIGHT = dp(160)
+    
+    # Seconds a slider has to rest before its value is sent to the device
+    SLIDER_DEBOUNCE = 0.15
+    
+    # Control rows in card order, as (capabilities any of which shows the
+    # row, builder method name)
+    _CONTROL_ROWS = (
+        (("power",), "_build_power_row"),
+        (("brightness",), "_build_brightness_row"),
+        (("volume",), "_build_volume_row"),
+        (("target_temperature",), "_build_temp_row"),
+        (("play", "pause"), "_build_media_row"),
+    )
+    
+    def __init__(self, device: SmartDevice = None, on_control: Callable = None, **kwargs):
         super().__init__(**kwargs)
         
+        self.index = None
         self.device = device
         self.on_control = on_control
         
         self.size_hint_y = None
-        self.height = dp(160)
-        self.spacing = StosOSTheme.get_spacing('sm')
+        self.height = self.CARD_HEIGHT
+        self.spacing = self._SPACING_SM
         
-        self._build_ui()
+        # Set while device state is pushed into the widgets, so the control
+        # bindings don't echo it back to the device as commands
+        self._syncing = False
+        
+        # Latest parameters per slider command, sent once dragging pauses
+        self._pending_slider: Dict[str, Dict[str, Any]] = {}
+        self._slider_trigger = Clock.create_trigger(self._flush_sliders, self.SLIDER_DEBOUNCE)
+        
+        if device is not None:
+            self._build_ui()
     
     def _build_ui(self):
         """Build the device card UI"""
-        # Main content layout
-        content_layout = BoxLayout(orientation='vertical', spacing=StosOSTheme.get_spacing('sm'))
+        # Widgets that update_device mutates in place; None when not shown
+        self._header_label = None
+        self._power_btn = None
+        self._brightness_slider = None
+        self._volume_slider = None
+        self._temp_input = None
+        self._mute_btn = None
+        self._layout_key = self._layout_key_for(self.device)
+        self._last_state = None
+        
+        if not self.device.is_online:
+            self._build_offline_ui()
+            return
         
-        # Header with device name and status
-        header_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(40))
+        # Main content layout
+        content_layout = BoxLayout(orientation='vertical', spacing=self._SPACING_SM)
         
-        # Device name and type
-        name_layout = BoxLayout(orientation='vertical', size_hint_x=0.7)
+        # Header with device name and status; each side is a single markup
+        # label rather than a layout of one label per line
+        header_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=self._H40)
         
-        name_label = StosOSLabel(
-            text=self.device.name,
+        # Device name over type and room
+        self._header_label = StosOSLabel(
             label_type="subtitle",
-            color=StosOSTheme.get_color('text_primary') if self.device.is_online 
-                  else StosOSTheme.get_color('text_disabled')
-        )
-        name_layout.add_widget(name_label)
-        
-        type_label = StosOSLabel(
-            text=f"{self._get_device_icon()} {self.device.device_type.value} • {self.device.room}",
-            font_size=StosOSTheme.get_font_size('caption'),
-            color=StosOSTheme.get_color('text_secondary')
-        )
-        name_layout.add_widget(type_label)
-        
-        header_layout.add_widget(name_layout)
-        
-        # Status indicator
-        status_layout = BoxLayout(orientation='vertical', size_hint_x=0.3)
-        
-        platform_label = StosOSLabel(
-            text=self.device.platform.value,
-            font_size=StosOSTheme.get_font_size('caption'),
-            color=StosOSTheme.get_color('accent_secondary'),
-            halign='right'
+            markup=True,
+            size_hint_x=0.7,
+            color=self._COLOR_TEXT_PRIMARY
         )
-        platform_label.bind(size=platform_label.setter('text_size'))
-        status_layout.add_widget(platform_label)
+        header_layout.add_widget(self._header_label)
         
-        online_status = "🟢 Online" if self.device.is_online else "🔴 Offline"
+        # Platform over online status
         status_label = StosOSLabel(
-            text=online_status,
-            font_size=StosOSTheme.get_font_size('caption'),
-            color=StosOSTheme.get_color('success') if self.device.is_online 
-                  else StosOSTheme.get_color('error'),
+            text=_STATUS_MARKUP[self.device.platform],
+            markup=True,
+            font_size=self._FONT_CAPTION,
+            size_hint_x=0.3,
             halign='right'
         )
         status_label.bind(size=status_label.setter('text_size'))
-        status_layout.add_widget(status_label)
-        
-        header_layout.add_widget(status_layout)
+        header_layout.add_widget(status_label)
         content_layout.add_widget(header_layout)
         
         # Device controls based on type and capabilities
@@ -110,162 +256,235 @@ class DeviceCard(StosOSCard):
             content_layout.add_widget(controls_layout)
         
         self.add_widget(content_layout)
+        
+        self._apply_device_state()
+    
+    def _build_offline_ui(self):
+        """Build the offline card: the header label alone, with the status under it"""
+        self._header_label = StosOSLabel(
+            label_type="subtitle",
+            markup=True,
+            color=self._COLOR_TEXT_DISABLED
+        )
+        self.add_widget(self._header_label)
+        
+        self._apply_device_state()
     
     def _get_device_icon(self) -> str:
         """Get icon for device type"""
-        icons = {
-            DeviceType.LIGHT: "💡",
-            DeviceType.THERMOSTAT: "🌡️",
-            DeviceType.SPEAKER: "🔊",
-            DeviceType.SWITCH: "🔌",
-            DeviceType.SENSOR: "📡",
-            DeviceType.CAMERA: "📹",
-            DeviceType.LOCK: "🔒",
-            DeviceType.FAN: "🌀",
-            DeviceType.OTHER: "📱"
-        }
-        return icons.get(self.device.device_type, "📱")
+        return _DEVICE_ICONS.get(self.device.device_type, "📱")
     
     def _build_device_controls(self) -> Optional[BoxLayout]:
         """Build device-specific controls"""
-        if not self.device.is_online or not self.device.capabilities:
+        # The layout key already holds the capabilities as a frozenset
+        caps = self._layout_key[2]
+        if not caps:
             return None
         
-        controls_layout = BoxLayout(orientation='vertical', spacing=StosOSTheme.get_spacing('xs'))
+        controls_layout = BoxLayout(orientation='vertical', spacing=self._SPACING_XS)
         
-        # Power control (most common)
-        if self.device.has_capability("power"):
-            power_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(35))
-            
-            power_label = StosOSLabel(
-                text="Power:",
-                size_hint_x=0.3,
-                font_size=StosOSTheme.get_font_size('body')
-            )
-            power_layout.add_widget(power_label)
-            
-            power_btn = StosOSToggleButton(
-                text="ON" if self.device.get_status_value("power", False) else "OFF",
-                size_hint_x=0.7,
-                button_type="success" if self.device.get_status_value("power", False) else "secondary"
-            )
-            power_btn.is_toggled = self.device.get_status_value("power", False)
-            power_btn.bind(on_press=lambda x: self._control_device("power_toggle"))
-            power_layout.add_widget(power_btn)
-            
-            controls_layout.add_widget(power_layout)
+        for row_caps, builder in self._CONTROL_ROWS:
+            if not caps.isdisjoint(row_caps):
+                controls_layout.add_widget(getattr(self, builder)(caps))
         
-        # Brightness control (lights)
-        if self.device.has_capability("brightness"):
-            brightness_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(35))
-            
-            brightness_label = StosOSLabel(
-                text="Brightness:",
-                size_hint_x=0.3,
-                font_size=StosOSTheme.get_font_size('body')
-            )
-            brightness_layout.add_widget(brightness_label)
-            
-            brightness_slider = StosOSSlider(
-                min=0, max=100,
-                value=self.device.get_status_value("brightness", 50),
-                size_hint_x=0.7
-            )
-            brightness_slider.bind(value=lambda x, v: self._control_device("set_brightness", {"brightness": int(v)}))
-            brightness_layout.add_widget(brightness_slider)
-            
-            controls_layout.add_widget(brightness_layout)
+        return controls_layout if controls_layout.children else None
+    
+    def _build_control_row(self, label_text: str) -> BoxLayout:
+        """Create a control row holding its label"""
+        row_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=self._H35)
+        row_layout.add_widget(StosOSLabel(
+            text=label_text,
+            size_hint_x=0.3,
+            font_size=self._FONT_BODY
+        ))
+        return row_layout
+    
+    def _build_power_row(self, caps: frozenset) -> BoxLayout:
+        """Power control (most common)"""
+        power_layout = self._build_control_row("Power:")
         
-        # Volume control (speakers)
-        if self.device.has_capability("volume"):
-            volume_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(35))
-            
-            volume_label = StosOSLabel(
-                text="Volume:",
-                size_hint_x=0.3,
-                font_size=StosOSTheme.get_font_size('body')
-            )
-            volume_layout.add_widget(volume_label)
-            
-            volume_slider = StosOSSlider(
-                min=0, max=100,
-                value=self.device.get_status_value("volume", 50),
-                size_hint_x=0.7
-            )
-            volume_slider.bind(value=lambda x, v: self._control_device("set_volume", {"volume": int(v)}))
-            volume_layout.add_widget(volume_slider)
-            
-            controls_layout.add_widget(volume_layout)
+        self._power_btn = StosOSToggleButton(
+            size_hint_x=0.7,
+            button_type="success" if self.device.get_status_value("power", False) else "secondary"
+        )
+        self._power_btn.control_command = "power_toggle"
+        self._power_btn.bind(on_press=self._on_control_press)
+        power_layout.add_widget(self._power_btn)
         
-        # Temperature control (thermostats)
-        if self.device.has_capability("target_temperature"):
-            temp_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(35))
-            
-            temp_label = StosOSLabel(
-                text="Target:",
-                size_hint_x=0.3,
-                font_size=StosOSTheme.get_font_size('body')
+        return power_layout
+    
+    def _build_brightness_row(self, caps: frozenset) -> BoxLayout:
+        """Brightness control (lights)"""
+        brightness_layout = self._build_control_row("Brightness:")
+        
+        self._brightness_slider = Slider(
+            min=0, max=100,
+            size_hint_x=0.7
+        )
+        self._brightness_slider.control_command = ("set_brightness", "brightness")
+        self._brightness_slider.bind(value=self._on_slider_change)
+        brightness_layout.add_widget(self._brightness_slider)
+        
+        return brightness_layout
+    
+    def _build_volume_row(self, caps: frozenset) -> BoxLayout:
+        """Volume control (speakers)"""
+        volume_layout = self._build_control_row("Volume:")
+        
+        self._volume_slider = Slider(
+            min=0, max=100,
+            size_hint_x=0.7
+        )
+        self._volume_slider.control_command = ("set_volume", "volume")
+        self._volume_slider.bind(value=self._on_slider_change)
+        volume_layout.add_widget(self._volume_slider)
+        
+        return volume_layout
+    
+    def _build_temp_row(self, caps: frozenset) -> BoxLayout:
+        """Temperature control (thermostats)"""
+        temp_layout = self._build_control_row("Target:")
+        
+        self._temp_input = StosOSTextInput(
+            input_filter='int',
+            size_hint_x=0.4,
+            multiline=False
+        )
+        # Enter unfocuses the single-line input, so this also covers it
+        self._temp_input.bind(focus=self._on_temp_focus)
+        temp_layout.add_widget(self._temp_input)
+        
+        temp_unit_label = StosOSLabel(
+            text="°F",
+            size_hint_x=0.3,
+            font_size=self._FONT_BODY
+        )
+        temp_layout.add_widget(temp_unit_label)
+        
+        return temp_layout
+    
+    def _build_media_row(self, caps: frozenset) -> BoxLayout:
+        """Media controls (speakers)"""
+        media_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=self._H35)
+        
+        if "play" in caps:
+            play_btn = StosOSIconButton(
+                icon="▶️",
+                size=(self._H30, self._H30),
+                button_type="accent"
             )
-            temp_layout.add_widget(temp_label)
-            
-            current_temp = self.device.get_status_value("target_temperature", 70)
-            temp_input = StosOSTextInput(
-                text=str(current_temp),
-                input_filter='int',
-                size_hint_x=0.4,
-                multiline=False
+            play_btn.control_command = "play"
+            play_btn.bind(on_press=self._on_control_press)
+            media_layout.add_widget(play_btn)
+        
+        if "pause" in caps:
+            pause_btn = StosOSIconButton(
+                icon="⏸️",
+                size=(self._H30, self._H30),
+                button_type="secondary"
             )
-            temp_input.bind(text=lambda x, t: self._control_device("set_temperature", {"temperature": int(t) if t.isdigit() else 70}))
-            temp_layout.add_widget(temp_input)
-            
-            temp_unit_label = StosOSLabel(
-                text="°F",
-                size_hint_x=0.3,
-                font_size=StosOSTheme.get_font_size('body')
+            pause_btn.control_command = "pause"
+            pause_btn.bind(on_press=self._on_control_press)
+            media_layout.add_widget(pause_btn)
+        
+        if "mute" in caps:
+            self._mute_btn = StosOSToggleButton(
+                size=(self._H30, self._H30),
+                button_type="warning" if self.device.get_status_value("muted", False) else "secondary"
             )
-            temp_layout.add_widget(temp_unit_label)
-            
-            controls_layout.add_widget(temp_layout)
+            self._mute_btn.control_command = "mute_toggle"
+            self._mute_btn.bind(on_press=self._on_control_press)
+            media_layout.add_widget(self._mute_btn)
         
-        # Media controls (speakers)
-        if self.device.has_capability("play") or self.device.has_capability("pause"):
-            media_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(35))
-            
-            if self.device.has_capability("play"):
-                play_btn = StosOSIconButton(
-                    icon="▶️",
-                    size=(dp(30), dp(30)),
-                    button_type="accent"
-                )
-                play_btn.bind(on_press=lambda x: self._control_device("play"))
-                media_layout.add_widget(play_btn)
-            
-            if self.device.has_capability("pause"):
-                pause_btn = StosOSIconButton(
-                    icon="⏸️",
-                    size=(dp(30), dp(30)),
-                    button_type="secondary"
-                )
-                pause_btn.bind(on_press=lambda x: self._control_device("pause"))
-                media_layout.add_widget(pause_btn)
-            
-            if self.device.has_capability("mute"):
-                mute_btn = StosOSToggleButton(
-                    text="🔇" if self.device.get_status_value("muted", False) else "🔊",
-                    size=(dp(30), dp(30)),
-                    button_type="warning" if self.device.get_status_value("muted", False) else "secondary"
+        return media_layout
+    
+    @staticmethod
+    def _layout_key_for(device: SmartDevice) -> tuple:
+        """What decides which widgets a card has; a change needs a rebuild"""
+        return (device.is_online, device.platform, frozenset(device.capabilities))
+    
+    def _apply_device_state(self):
+        """Push the device's name and status into the widgets, skipping unchanged values"""
+        device = self.device
+        state = _CardState(
+            device.name,
+            device.device_type,
+            device.room,
+            device.get_status_value("power", False),
+            device.get_status_value("brightness", 50),
+            device.get_status_value("volume", 50),
+            device.get_status_value("target_temperature", 70),
+            device.get_status_value("muted", False)
+        )
+        last = self._last_state
+        if state == last:
+            # Nothing shown changed; skip rebuilding the header markup too
+            return
+        
+        self._syncing = True
+        try:
+            if last is None or state[:3] != last[:3]:
+                type_line = f"{self._get_device_icon()} {device.device_type.value} • {device.room}"
+                header = (
+                    f"{escape_markup(device.name)}\n"
+                    f"[size={int(self._FONT_CAPTION)}][color={self._HEX_TEXT_SECONDARY}]"
+                    f"{escape_markup(type_line)}[/color][/size]"
                 )
-                mute_btn.is_toggled = self.device.get_status_value("muted", False)
-                mute_btn.bind(on_press=lambda x: self._control_device("mute_toggle"))
-                media_layout.add_widget(mute_btn)
-            
-            controls_layout.add_widget(media_layout)
+                if not device.is_online:
+                    header += f"\n{_OFFLINE_MARKUP[device.platform]}"
+                self._header_label.text = header
+            if self._power_btn is not None and (last is None or state.power != last.power):
+                self._power_btn.text = "ON" if state.power else "OFF"
+                self._power_btn.is_toggled = state.power
+            if self._brightness_slider is not None and (last is None or state.brightness != last.brightness):
+                self._brightness_slider.value = state.brightness
+            if self._volume_slider is not None and (last is None or state.volume != last.volume):
+                self._volume_slider.value = state.volume
+            if self._temp_input is not None and (last is None or state.target_temperature != last.target_temperature):
+                self._temp_input.text = str(state.target_temperature)
+            if self._mute_btn is not None and (last is None or state.muted != last.muted):
+                self._mute_btn.text = "🔇" if state.muted else "🔊"
+                self._mute_btn.is_toggled = state.muted
+        finally:
+            self._syncing = False
+        
+        self._last_state = state
+    
+    def _on_control_press(self, instance):
+        """Send the command stored on the pressed control button"""
+        self._control_device(instance.control_command)
+    
+    def _on_slider_change(self, slider, value):
+        """Queue the slider's command with its value as the named parameter"""
+        if self._syncing:
+            return
         
-        return controls_layout if controls_layout.children else None
+        command, param = slider.control_command
+        self._pending_slider[command] = {param: int(value)}
+        
+        # Restart the countdown so a drag sends only the value it stops at
+        self._slider_trigger.cancel()
+        self._slider_trigger()
+    
+    def _flush_sliders(self, *args):
+        """Send the queued slider commands"""
+        self._slider_trigger.cancel()
+        pending, self._pending_slider = self._pending_slider, {}
+        for command, parameters in pending.items():
+            self._control_device(command, parameters)
+    
+    def _on_temp_focus(self, instance, focused):
+        """Send the typed target temperature once editing ends"""
+        if focused or not instance.text.isdigit():
+            return
+        
+        temperature = int(instance.text)
+        if temperature != self.device.get_status_value("target_temperature", 70):
+            self._control_device("set_temperature", {"temperature": temperature})
     
     def _control_device(self, command: str, parameters: Dict[str, Any] = None):
         """Send control command to device"""
-        if self.on_control:
+        if self.on_control and not self._syncing:
             # Handle toggle commands
             if command == "power_toggle":
                 current_power = self.device.get_status_value("power", False)
@@ -276,58 +495,78 @@ class DeviceCard(StosOSCard):
             
             self.on_control(self.device.id, command, parameters or {})
     
+    def refresh_view_attrs(self, rv, index, data):
+        """Rebind this card to the device at ``index``"""
+        self.index = index
+        self.on_control = data.get('on_control')
+        self.update_device(data['device'])
+    
     def update_device(self, device: SmartDevice):
         """Update the card with new device data"""
+        if self._pending_slider and device.id != self.device.id:
+            # Recycled to another device; the queued values belong to the old one
+            self._flush_sliders()
+        
+        first_build = self.device is None
         self.device = device
-        # Rebuild UI to reflect changes
-        self.clear_widgets()
-        self._build_ui()
+        
+        if first_build:
+            self._build_ui()
+        elif self._layout_key_for(device) != self._layout_key:
+            # Different controls are needed, so rebuild the card
+            self.clear_widgets()
+            self._build_ui()
+        else:
+            self._apply_device_state()
 
 
-class SceneCard(StosOSCard):
-    """Scene management card component"""
+class SceneCard(_SmartHomeStyle, RecycleDataViewBehavior, StosOSCard):
+    """
+    Scene management card component
     
-    def __init__(self, scene_name: str, scene_data: Dict[str, Any], 
+    Also the view class of the scenes RecycleView; refresh_view_attrs
+    rewrites the labels for the scene at the recycled row.
+    """
+    
+    def __init__(self, scene_name: str = "", scene_data: Dict[str, Any] = None, 
                  on_activate: Callable = None, on_edit: Callable = None, **kwargs):
         super().__init__(**kwargs)
         
+        self.index = None
         self.scene_name = scene_name
-        self.scene_data = scene_data
+        self.scene_data = scene_data or {}
         self.on_activate = on_activate
         self.on_edit = on_edit
         
         self.size_hint_y = None
-        self.height = dp(100)
-        self.spacing = StosOSTheme.get_spacing('sm')
+        self.height = self._H100
+        self.spacing = self._SPACING_SM
         
         self._build_ui()
     
     def _build_ui(self):
         """Build the scene card UI"""
-        content_layout = BoxLayout(orientation='horizontal', spacing=StosOSTheme.get_spacing('md'))
+        content_layout = BoxLayout(orientation='horizontal', spacing=self._SPACING_MD)
         
         # Scene info
         info_layout = BoxLayout(orientation='vertical', size_hint_x=0.7)
         
-        name_label = StosOSLabel(
-            text=self.scene_name,
+        self._name_label = StosOSLabel(
             label_type="subtitle",
-            color=StosOSTheme.get_color('text_primary')
+            color=self._COLOR_TEXT_PRIMARY
         )
-        info_layout.add_widget(name_label)
+        info_layout.add_widget(self._name_label)
         
-        device_count = len(self.scene_data.get('devices', {}))
-        desc_label = StosOSLabel(
-            text=f"{device_count} devices • {self.scene_data.get('description', 'No description')}",
-            font_size=StosOSTheme.get_font_size('caption'),
-            color=StosOSTheme.get_color('text_secondary')
+        self._desc_label = StosOSLabel(
+            font_size=self._FONT_CAPTION,
+            color=self._COLOR_TEXT_SECONDARY
         )
-        info_layout.add_widget(desc_label)
+        info_layout.add_widget(self._desc_label)
         
         content_layout.add_widget(info_layout)
         
         # Action buttons
-        actions_layout = BoxLayout(orientation='horizontal', size_hint_x=0.3, spacing=StosOSTheme.get_spacing('xs'))
+        actions_layout = BoxLayout(orientation='horizontal', size_hint_x=0.3, spacing=self._SPACING_XS)
         
         activate_btn = StosOSButton(
             text="Activate",
@@ -339,7 +578,7 @@ class SceneCard(StosOSCard):
         
         edit_btn = StosOSIconButton(
             icon="✏",
-            size=(dp(35), dp(35)),
+            size=(self._H35, self._H35),
             button_type="secondary"
         )
         edit_btn.bind(on_press=self._edit_scene)
@@ -348,6 +587,23 @@ class SceneCard(StosOSCard):
         content_layout.add_widget(actions_layout)
         
         self.add_widget(content_layout)
+        
+        self._apply_scene()
+    
+    def _apply_scene(self):
+        """Show the current scene's name and description"""
+        device_count = len(self.scene_data.get('devices', {}))
+        self._name_label.text = self.scene_name
+        self._desc_label.text = f"{device_count} devices • {self.scene_data.get('description', 'No description')}"
+    
+    def refresh_view_attrs(self, rv, index, data):
+        """Rebind this card to the scene at ``index``"""
+        self.index = index
+        self.scene_name = data['scene_name']
+        self.scene_data = data['scene_data']
+        self.on_activate = data.get('on_activate')
+        self.on_edit = data.get('on_edit')
+        self._apply_scene()
     
     def _activate_scene(self, *args):
         """Activate the scene"""
@@ -360,7 +616,7 @@ class SceneCard(StosOSCard):
             self.on_edit(self.scene_name, self.scene_data)
 
 
-class SmartHomeModule(BaseModule):
+class SmartHomeModule(_SmartHomeStyle, BaseModule):
     """
     Smart Home Integration Module
     
@@ -369,6 +625,41 @@ class SmartHomeModule(BaseModule):
     and scene management.
     """
     
+    # Device cards built per frame when the rooms view streams in
+    ROOM_BUILD_CHUNK_SIZE = 8
+    
+    # Seconds a device's reported status counts as current; refreshes skip
+    # devices heard from more recently than this
+    STATUS_TTL = 30.0
+    
+    # Delays between status polls after a command, until the devices report
+    STATUS_CONFIRM_DELAYS = (0.1, 0.2, 0.4, 0.8)
+    
+    # Seconds device updates are gathered before the shown list is rebuilt
+    REFRESH_COALESCE_DELAY = 0.1
+    
+    # In-flight refresh key of the all-devices refresh
+    _REFRESH_ALL = "__all__"
+    
+    # Threads sending queued device commands and status refreshes; each
+    # device's commands always go to the same one, so they arrive in order
+    COMMAND_WORKERS = 4
+    
+    # Queue priorities; lower runs first, so the user's commands go ahead
+    # of background refreshes, and the workers stop once both are done
+    COMMAND_PRIORITY = 0
+    REFRESH_PRIORITY = 10
+    _STOP_PRIORITY = 100
+    
+    # Kept-alive connections per service host; matches the control pool so
+    # a room or scene fan-out doesn't open fresh connections
+    SERVICE_CONNECTIONS = 8
+    
+    # Status poll intervals in seconds, stepping from just after a command
+    # out to idle; the interval is multiplied while no device state is shown
+    POLL_INTERVALS = (5.0, 10.0, 20.0, 40.0, 60.0)
+    POLL_HIDDEN_FACTOR = 2
+    
     def __init__(self):
         super().__init__(
             module_id="smart_home",
@@ -377,6 +668,10 @@ class SmartHomeModule(BaseModule):
         )
         
         self.db_manager = None
+        
+        # Service per device platform, kept in step with the service
+        # attributes so control paths need a single lookup
+        self._service_by_platform: Dict[Platform, Any] = {}
         self.google_service = None
         self.alexa_service = None
         
@@ -387,22 +682,120 @@ class SmartHomeModule(BaseModule):
         # UI components
         self.device_container = None
         self.scene_container = None
+        self.content_area = None
+        self._view_buttons: Dict[str, StosOSToggleButton] = {}
+        self.device_rv = None
+        self.scene_rv = None
         self.status_panel = None
         self.current_view = "devices"  # "devices", "scenes", "rooms"
         
-        # Status monitoring
+        # Rooms view chunked build; a new token abandons an unfinished build
+        self._build_token = 0
+        self._pending_rooms = []
+        self._room_cursor = 0
+        
+        # Rooms view panels by room name, with the device ids they were built
+        # for and their cards by device id; reused while the ids match
+        self._room_panels: Dict[str, Tuple[StosOSPanel, frozenset, Dict[str, DeviceCard]]] = {}
+        # Cards of replaced or dropped room panels by device id, taken by the
+        # panels rebuilt in the same pass instead of building new cards
+        self._spare_cards: Dict[str, DeviceCard] = {}
+        
+        # (room, name) each device was last grouped and sorted under, and its
+        # row in the devices list; status updates that keep the placement
+        # only touch that device's card
+        self._device_placement: Dict[str, Tuple[str, str]] = {}
+        self._device_rows: Dict[str, int] = {}
+        
+        # Device ids in devices-view order, and the (id, room, name) snapshot
+        # they were sorted from
+        self._sorted_device_ids: List[str] = []
+        self._sort_fingerprint = None
+        
+        # Device lookups for voice commands; built on first use and dropped
+        # when devices are added or renamed
+        self._voice_index: Optional[_VoiceIndex] = None
+        
+        # Scene names by lowercased name and their pattern; rebuilt after
+        # the scenes are loaded
+        self._scene_index: Optional[Tuple[Dict[str, str], Optional[Pattern]]] = None
+        
+        # Set while a list rebuild for device updates is scheduled
+        self._refresh_pending = False
+        
+        # Background device fetch; a request made while one is running is
+        # folded into a single follow-up fetch
+        self._merge_in_flight = False
+        self._merge_pending = False
+        
+        # time.monotonic() of each device's last status report; dropped when
+        # a command is sent so the follow-up refresh asks the service again
+        self._status_times: Dict[str, float] = {}
+        
+        # Status refreshes queued or running, by device id or
+        # _REFRESH_ALL; a repeat request joins the running one. Each refresh's
+        # keys are kept too, as one refresh may cover several devices
+        self._inflight_refresh: Dict[str, Future] = {}
+        self._refresh_keys: Dict[Future, Tuple[str, ...]] = {}
+        
+        # Device, room and scene commands and status refreshes wait here for
+        # the command workers, one queue each, started with the first job, as
+        # (priority, sequence number, (function, args)). A device command
+        # superseded by a newer one for the same state of the device is dropped
+        self._command_queues: List[queue.PriorityQueue] = [
+            queue.PriorityQueue() for _ in range(self.COMMAND_WORKERS)
+        ]
+        self._command_workers: List[threading.Thread] = []
+        self._command_seq = itertools.count()
+        self._latest_command: Dict[Tuple[str, str], int] = {}
+        
+        # Status monitoring; _poll_step indexes POLL_INTERVALS
+        self._poll_step = len(self.POLL_INTERVALS) - 1
         self.status_timer = None
         self.last_refresh = None
     
+    @property
+    def google_service(self):
+        """Google Assistant service, or None"""
+        return self._service_by_platform.get(Platform.GOOGLE)
+    
+    @google_service.setter
+    def google_service(self, service):
+        self._set_platform_service(Platform.GOOGLE, service)
+    
+    @property
+    def alexa_service(self):
+        """Alexa service, or None"""
+        return self._service_by_platform.get(Platform.ALEXA)
+    
+    @alexa_service.setter
+    def alexa_service(self, service):
+        self._set_platform_service(Platform.ALEXA, service)
+    
+    def _set_platform_service(self, platform: Platform, service):
+        """Register the service that controls a platform's devices"""
+        if service:
+            self._service_by_platform[platform] = service
+        else:
+            self._service_by_platform.pop(platform, None)
+    
     def initialize(self) -> bool:
         """Initialize the smart home module"""
         try:
             self.db_manager = DatabaseManager()
             
+            # Imported here so the service client stacks only load once the
+            # module is actually started
+            from services.google_assistant_service import GoogleAssistantService
+            from services.alexa_service import AlexaService
+            
             # Initialize services
             self.google_service = GoogleAssistantService()
             self.alexa_service = AlexaService()
             
+            # Google shares one gRPC channel; Alexa calls go over HTTPS
+            self.alexa_service.configure_pool(num_clients=self.SERVICE_CONNECTIONS)
+            
             # Load scenes from database/config
             self._load_scenes()
             
@@ -430,14 +823,14 @@ class SmartHomeModule(BaseModule):
     
     def _build_ui(self):
         """Build the smart home UI"""
-        main_layout = BoxLayout(orientation='vertical', spacing=StosOSTheme.get_spacing('md'))
+        main_layout = BoxLayout(orientation='vertical', spacing=self._SPACING_MD)
         
         # Header with title and view controls
         header_layout = BoxLayout(
             orientation='horizontal',
             size_hint_y=None,
-            height=dp(60),
-            spacing=StosOSTheme.get_spacing('md')
+            height=self._H60,
+            spacing=self._SPACING_MD
         )
         
         title_label = StosOSLabel(
@@ -448,30 +841,37 @@ class SmartHomeModule(BaseModule):
         header_layout.add_widget(title_label)
         
         # View toggle buttons
-        view_layout = BoxLayout(orientation='horizontal', size_hint_x=0.6, spacing=StosOSTheme.get_spacing('xs'))
+        view_layout = BoxLayout(orientation='horizontal', size_hint_x=0.6, spacing=self._SPACING_XS)
         
         devices_btn = StosOSToggleButton(
             text="Devices",
-            button_type="accent" if self.current_view == "devices" else "secondary"
+            button_type="secondary"
         )
-        devices_btn.bind(on_press=lambda x: self._switch_view("devices"))
+        devices_btn.view_name = "devices"
+        devices_btn.bind(on_press=self._on_view_press)
         view_layout.add_widget(devices_btn)
+        self._view_buttons["devices"] = devices_btn
         
         rooms_btn = StosOSToggleButton(
             text="Rooms",
-            button_type="accent" if self.current_view == "rooms" else "secondary"
+            button_type="secondary"
         )
-        rooms_btn.bind(on_press=lambda x: self._switch_view("rooms"))
+        rooms_btn.view_name = "rooms"
+        rooms_btn.bind(on_press=self._on_view_press)
         view_layout.add_widget(rooms_btn)
+        self._view_buttons["rooms"] = rooms_btn
         
         scenes_btn = StosOSToggleButton(
             text="Scenes",
-            button_type="accent" if self.current_view == "scenes" else "secondary"
+            button_type="secondary"
         )
-        scenes_btn.bind(on_press=lambda x: self._switch_view("scenes"))
+        scenes_btn.view_name = "scenes"
+        scenes_btn.bind(on_press=self._on_view_press)
         view_layout.add_widget(scenes_btn)
+        self._view_buttons["scenes"] = scenes_btn
         
         header_layout.add_widget(view_layout)
+        self._update_view_buttons()
         
         main_layout.add_widget(header_layout)
         
@@ -479,24 +879,33 @@ class SmartHomeModule(BaseModule):
         self._build_status_panel()
         main_layout.add_widget(self.status_panel)
         
-        # Content area (will be populated based on current view)
+        # Content area (will be populated based on current view); holds the
+        # device list, the scene list or the scroll view used by rooms and
+        # empty states
+        self.content_area = BoxLayout()
+        
         self.content_scroll = StosOSScrollView()
         self.content_container = BoxLayout(
             orientation='vertical',
-            spacing=StosOSTheme.get_spacing('sm'),
+            spacing=self._SPACING_SM,
             size_hint_y=None
         )
         self.content_container.bind(minimum_height=self.content_container.setter('height'))
         
         self.content_scroll.add_widget(self.content_container)
-        main_layout.add_widget(self.content_scroll)
+        
+        # Recycled lists: only the visible cards are instantiated
+        self.device_rv = self._build_recycle_list(DeviceCard, DeviceCard.CARD_HEIGHT)
+        self.scene_rv = self._build_recycle_list(SceneCard, self._H100)
+        
+        main_layout.add_widget(self.content_area)
         
         # Action buttons
         action_layout = BoxLayout(
             orientation='horizontal',
             size_hint_y=None,
-            height=dp(50),
-            spacing=StosOSTheme.get_spacing('md')
+            height=self._H50,
+            spacing=self._SPACING_MD
         )
         
         refresh_btn = StosOSButton(
@@ -530,15 +939,35 @@ class SmartHomeModule(BaseModule):
         # Initial content load
         self._refresh_content()
     
+    def _build_recycle_list(self, viewclass, row_height: float) -> RecycleView:
+        """Build a vertical RecycleView of fixed-height cards"""
+        rv = RecycleView(viewclass=viewclass)
+        rv_layout = RecycleBoxLayout(
+            orientation='vertical',
+            spacing=self._SPACING_SM,
+            default_size=(None, row_height),
+            default_size_hint=(1, None),
+            size_hint_y=None
+        )
+        rv_layout.bind(minimum_height=rv_layout.setter('height'))
+        rv.add_widget(rv_layout)
+        return rv
+    
+    def _show_content(self, widget):
+        """Make ``widget`` the one shown in the content area"""
+        if widget.parent is not self.content_area:
+            self.content_area.clear_widgets()
+            self.content_area.add_widget(widget)
+    
     def _build_status_panel(self):
         """Build the status panel"""
         self.status_panel = StosOSPanel(
             title="System Status",
             size_hint_y=None,
-            height=dp(80)
+            height=self._H80
         )
         
-        status_layout = BoxLayout(orientation='horizontal', spacing=StosOSTheme.get_spacing('md'))
+        status_layout = BoxLayout(orientation='horizontal', spacing=self._SPACING_MD)
         
         # Google Assistant status
         self.google_status_label = StosOSLabel(
@@ -569,64 +998,109 @@ class SmartHomeModule(BaseModule):
     def _start_services(self):
         """Start Google Assistant and Alexa services"""
         # Start Google Assistant service
-        Clock.schedule_once(lambda dt: self._authenticate_google(), 0.1)
+        Clock.schedule_once(self._authenticate_google, 0.1)
         
         # Start Alexa service
-        Clock.schedule_once(lambda dt: self._authenticate_alexa(), 0.2)
+        Clock.schedule_once(self._authenticate_alexa, 0.2)
     
-    def _authenticate_google(self):
+    def _authenticate_google(self, *args):
         """Authenticate Google Assistant service"""
         try:
             if self.google_service.authenticate():
                 self.google_status_label.text = "Google: ✅ Connected"
-                self.google_status_label.color = StosOSTheme.get_color('success')
+                self.google_status_label.color = self._COLOR_SUCCESS
                 
                 # Add device update callback
                 self.google_service.add_device_callback(self._on_device_update)
                 
                 # Merge Google devices
-                self._merge_devices()
+                self._fetch_and_merge()
             else:
                 self.google_status_label.text = "Google: ❌ Failed"
-                self.google_status_label.color = StosOSTheme.get_color('error')
+                self.google_status_label.color = self._COLOR_ERROR
         except Exception as e:
             self.logger.error(f"Google authentication error: {e}")
             self.google_status_label.text = "Google: ❌ Error"
-            self.google_status_label.color = StosOSTheme.get_color('error')
+            self.google_status_label.color = self._COLOR_ERROR
     
-    def _authenticate_alexa(self):
+    def _authenticate_alexa(self, *args):
         """Authenticate Alexa service"""
         try:
             if self.alexa_service.authenticate():
                 self.alexa_status_label.text = "Alexa: ✅ Connected"
-                self.alexa_status_label.color = StosOSTheme.get_color('success')
+                self.alexa_status_label.color = self._COLOR_SUCCESS
                 
                 # Add device update callback
                 self.alexa_service.add_device_callback(self._on_device_update)
                 
                 # Merge Alexa devices
-                self._merge_devices()
+                self._fetch_and_merge()
             else:
                 self.alexa_status_label.text = "Alexa: ❌ Failed"
-                self.alexa_status_label.color = StosOSTheme.get_color('error')
+                self.alexa_status_label.color = self._COLOR_ERROR
         except Exception as e:
             self.logger.error(f"Alexa authentication error: {e}")
             self.alexa_status_label.text = "Alexa: ❌ Error"
-            self.alexa_status_label.color = StosOSTheme.get_color('error')
+            self.alexa_status_label.color = self._COLOR_ERROR
+    
+    def _fetch_and_merge(self):
+        """Fetch devices from both services off the UI thread, then merge"""
+        if self._merge_in_flight:
+            self._merge_pending = True
+            return
+        
+        self._merge_in_flight = True
+        
+        def fetch_thread():
+            fetched = None
+            try:
+                fetched = self._fetch_devices()
+            except Exception as e:
+                self.logger.error(f"Error fetching smart home devices: {e}")
+            finally:
+                # Merge on main thread
+                Clock.schedule_once(functools.partial(self._finish_fetch, fetched), 0)
+        
+        threading.Thread(target=fetch_thread, daemon=True).start()
+    
+    def _finish_fetch(self, fetched: Optional[Tuple[List[SmartDevice], List[SmartDevice]]], *args):
+        """Apply a background fetch and run any fetch requested meanwhile"""
+        self._merge_in_flight = False
+        
+        if fetched is not None:
+            self._apply_merged(*fetched)
+        
+        if self._merge_pending:
+            self._merge_pending = False
+            self._fetch_and_merge()
+    
+    def _fetch_devices(self) -> Tuple[List[SmartDevice], List[SmartDevice]]:
+        """Get the device lists of the authenticated services"""
+        google_devices = []
+        alexa_devices = []
+        
+        if self.google_service and self.google_service.is_authenticated():
+            google_devices = self.google_service.get_devices()
+        
+        if self.alexa_service and self.alexa_service.is_authenticated():
+            alexa_devices = self.alexa_service.get_devices()
+        
+        return google_devices, alexa_devices
     
     def _merge_devices(self):
         """Merge devices from both services"""
+        self._apply_merged(*self._fetch_devices())
+    
+    def _apply_merged(self, google_devices: List[SmartDevice], alexa_devices: List[SmartDevice]):
+        """Replace the device set with freshly fetched service devices"""
         self.devices.clear()
         
-        # Add Google devices
-        if self.google_service and self.google_service.is_authenticated():
-            for device in self.google_service.get_devices():
-                self.devices[device.id] = device
+        # Alexa devices win on id clashes, as they are merged last
+        for device in google_devices:
+            self.devices[device.id] = device
         
-        # Add Alexa devices
-        if self.alexa_service and self.alexa_service.is_authenticated():
-            for device in self.alexa_service.get_devices():
-                self.devices[device.id] = device
+        for device in alexa_devices:
+            self.devices[device.id] = device
         
         # Group devices by room
         self._group_devices_by_room()
@@ -640,12 +1114,15 @@ class SmartHomeModule(BaseModule):
     def _group_devices_by_room(self):
         """Group devices by room"""
         self.rooms.clear()
+        self._device_placement.clear()
+        self._voice_index = None
         
         for device in self.devices.values():
             room = device.room or "Unknown"
             if room not in self.rooms:
                 self.rooms[room] = []
             self.rooms[room].append(device)
+            self._device_placement[device.id] = (device.room, device.name)
     
     def _update_device_count(self):
         """Update device count in status panel"""
@@ -655,19 +1132,33 @@ class SmartHomeModule(BaseModule):
         self.device_count_label.text = f"Devices: {online_count}/{total_count}"
         
         if online_count == total_count and total_count > 0:
-            self.device_count_label.color = StosOSTheme.get_color('success')
+            self.device_count_label.color = self._COLOR_SUCCESS
         elif online_count > 0:
-            self.device_count_label.color = StosOSTheme.get_color('warning')
+            self.device_count_label.color = self._COLOR_WARNING
         else:
-            self.device_count_label.color = StosOSTheme.get_color('error')
+            self.device_count_label.color = self._COLOR_ERROR
+    
+    def _on_view_press(self, instance):
+        """Switch to the view stored on the pressed toggle button"""
+        self._switch_view(instance.view_name)
     
     def _switch_view(self, view: str):
         """Switch between different views"""
         self.current_view = view
+        self._update_view_buttons()
         self._refresh_content()
     
+    def _update_view_buttons(self):
+        """Show only the current view's toggle button as selected"""
+        # Pressing a toggle flips it on its own, so set every button explicitly
+        for view, button in self._view_buttons.items():
+            button.set_state(view == self.current_view)
+    
     def _refresh_content(self):
         """Refresh content based on current view"""
+        self._refresh_pending = False
+        self._build_token += 1
+        self._device_rows = {}
         self.content_container.clear_widgets()
         
         if self.current_view == "devices":
@@ -683,23 +1174,38 @@ class SmartHomeModule(BaseModule):
             empty_label = StosOSLabel(
                 text="No smart home devices found.\nMake sure your Google Assistant and Alexa devices are set up.",
                 halign='center',
-                color=StosOSTheme.get_color('text_disabled'),
+                color=self._COLOR_TEXT_DISABLED,
                 size_hint_y=None,
-                height=dp(100)
+                height=self._H100
             )
             empty_label.bind(size=empty_label.setter('text_size'))
             self.content_container.add_widget(empty_label)
+            self._show_content(self.content_scroll)
             return
         
-        # Sort devices by room, then by name
-        sorted_devices = sorted(self.devices.values(), key=lambda d: (d.room or "ZZZ", d.name))
-        
-        for device in sorted_devices:
-            device_card = DeviceCard(
-                device=device,
-                on_control=self._control_device
-            )
-            self.content_container.add_widget(device_card)
+        sorted_devices = self._sorted_devices()
+        
+        # Coming back to an unchanged list leaves the recycled cards alone
+        shown = self.device_rv.data
+        if len(shown) != len(sorted_devices) or any(
+                row['device'] is not device for row, device in zip(shown, sorted_devices)):
+            self.device_rv.data = [
+                {'device': device, 'on_control': self._control_device}
+                for device in sorted_devices
+            ]
+        self._device_rows = {device.id: row for row, device in enumerate(sorted_devices)}
+        self._show_content(self.device_rv)
+    
+    def _sorted_devices(self) -> List[SmartDevice]:
+        """Devices sorted by room, then by name; re-sorted only when ids, rooms or names change"""
+        fingerprint = tuple((d.id, d.room, d.name) for d in self.devices.values())
+        if fingerprint != self._sort_fingerprint:
+            keyed = [((room or "ZZZ", name), device_id) for device_id, room, name in fingerprint]
+            keyed.sort(key=operator.itemgetter(0))
+            self._sorted_device_ids = [device_id for _, device_id in keyed]
+            self._sort_fingerprint = fingerprint
+        
+        return [self.devices[device_id] for device_id in self._sorted_device_ids]
     
     def _build_rooms_view(self):
         """Build the rooms view"""
@@ -707,62 +1213,128 @@ class SmartHomeModule(BaseModule):
             empty_label = StosOSLabel(
                 text="No rooms found.",
                 halign='center',
-                color=StosOSTheme.get_color('text_disabled'),
+                color=self._COLOR_TEXT_DISABLED,
                 size_hint_y=None,
-                height=dp(100)
+                height=self._H100
             )
             empty_label.bind(size=empty_label.setter('text_size'))
             self.content_container.add_widget(empty_label)
+            self._show_content(self.content_scroll)
             return
         
-        for room_name, room_devices in self.rooms.items():
-            # Room header
-            room_panel = StosOSPanel(
-                title=f"{room_name} ({len(room_devices)} devices)",
-                size_hint_y=None,
-                height=dp(60) + len(room_devices) * dp(170)
-            )
-            
-            room_layout = BoxLayout(orientation='vertical', spacing=StosOSTheme.get_spacing('sm'))
-            
-            # Room controls
-            room_controls = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(40))
-            
-            all_on_btn = StosOSButton(
-                text="All On",
-                button_type="success",
-                size_hint_x=0.33
-            )
-            all_on_btn.bind(on_press=lambda x, r=room_name: self._control_room(r, "power_on"))
-            room_controls.add_widget(all_on_btn)
-            
-            all_off_btn = StosOSButton(
-                text="All Off",
-                button_type="secondary",
-                size_hint_x=0.33
-            )
-            all_off_btn.bind(on_press=lambda x, r=room_name: self._control_room(r, "power_off"))
-            room_controls.add_widget(all_off_btn)
-            
-            room_settings_btn = StosOSIconButton(
-                icon="⚙️",
-                size=(dp(35), dp(35)),
-                button_type="secondary"
-            )
-            room_controls.add_widget(room_settings_btn)
-            
-            room_layout.add_widget(room_controls)
-            
-            # Room devices
+        self._show_content(self.content_scroll)
+        
+        # Drop panels whose room is gone or holds other devices now, keeping
+        # their cards for whichever panel the devices end up in
+        for room_name, (_, device_ids, cards) in list(self._room_panels.items()):
+            room_devices = self.rooms.get(room_name)
+            if room_devices is None or device_ids != frozenset(device.id for device in room_devices):
+                self._spare_cards.update(cards)
+                del self._room_panels[room_name]
+        
+        # First rooms go out this frame, the rest stream in on later frames
+        self._pending_rooms = list(self.rooms.items())
+        self._room_cursor = 0
+        self._build_room_chunk(self._build_token)
+    
+    def _build_room_chunk(self, token: int, *args):
+        """Add the next rooms to the rooms view, about a chunk of cards at a time"""
+        if token != self._build_token:
+            return
+        
+        built = 0
+        while self._room_cursor < len(self._pending_rooms) and built < self.ROOM_BUILD_CHUNK_SIZE:
+            room_name, room_devices = self._pending_rooms[self._room_cursor]
+            self._room_cursor += 1
+            panel, was_built = self._room_panel_for(room_name, room_devices)
+            self.content_container.add_widget(panel)
+            built += max(len(room_devices), 1) if was_built else 1
+        
+        if self._room_cursor < len(self._pending_rooms):
+            Clock.schedule_once(functools.partial(self._build_room_chunk, token), 0)
+        else:
+            # Whatever is left belongs to devices that are gone
+            self._spare_cards.clear()
+    
+    def _room_panel_for(self, room_name: str, room_devices: List[SmartDevice]) -> Tuple[StosOSPanel, bool]:
+        """Get the room's panel, reusing the cached one if it holds the same devices
+        
+        Returns the panel and whether it had to be built.
+        """
+        device_ids = frozenset(device.id for device in room_devices)
+        cached = self._room_panels.get(room_name)
+        if cached is not None and cached[1] == device_ids:
+            room_panel, _, cards = cached
             for device in room_devices:
+                cards[device.id].update_device(device)
+            return room_panel, False
+        
+        room_panel, cards = self._build_room_panel(room_name, room_devices)
+        self._room_panels[room_name] = (room_panel, device_ids, cards)
+        return room_panel, True
+    
+    def _build_room_panel(self, room_name: str,
+                          room_devices: List[SmartDevice]) -> Tuple[StosOSPanel, Dict[str, DeviceCard]]:
+        """Build the panel for one room with its controls and device cards"""
+        # Room header; each card row is a card plus the layout spacing
+        room_panel = StosOSPanel(
+            title=f"{room_name} ({len(room_devices)} devices)",
+            size_hint_y=None,
+            height=self._H60 + len(room_devices) * (DeviceCard.CARD_HEIGHT + self._SPACING_SM)
+        )
+        
+        room_layout = BoxLayout(orientation='vertical', spacing=self._SPACING_SM)
+        
+        # Room controls
+        room_controls = BoxLayout(orientation='horizontal', size_hint_y=None, height=self._H40)
+        
+        all_on_btn = StosOSButton(
+            text="All On",
+            button_type="success",
+            size_hint_x=0.33
+        )
+        all_on_btn.room_name = room_name
+        all_on_btn.room_command = "power_on"
+        all_on_btn.bind(on_press=self._on_room_control_press)
+        room_controls.add_widget(all_on_btn)
+        
+        all_off_btn = StosOSButton(
+            text="All Off",
+            button_type="secondary",
+            size_hint_x=0.33
+        )
+        all_off_btn.room_name = room_name
+        all_off_btn.room_command = "power_off"
+        all_off_btn.bind(on_press=self._on_room_control_press)
+        room_controls.add_widget(all_off_btn)
+        
+        room_settings_btn = StosOSIconButton(
+            icon="⚙️",
+            size=(self._H35, self._H35),
+            button_type="secondary"
+        )
+        room_controls.add_widget(room_settings_btn)
+        
+        room_layout.add_widget(room_controls)
+        
+        # Room devices
+        cards = {}
+        for device in room_devices:
+            device_card = self._spare_cards.pop(device.id, None)
+            if device_card is None:
                 device_card = DeviceCard(
                     device=device,
                     on_control=self._control_device
                 )
-                room_layout.add_widget(device_card)
-            
-            room_panel.add_widget(room_layout)
-            self.content_container.add_widget(room_panel)
+            else:
+                if device_card.parent is not None:
+                    device_card.parent.remove_widget(device_card)
+                device_card.update_device(device)
+            room_layout.add_widget(device_card)
+            cards[device.id] = device_card
+        
+        room_panel.add_widget(room_layout)
+        return room_panel, cards
     
     def _build_scenes_view(self):
         """Build the scenes view"""
@@ -770,25 +1342,89 @@ class SmartHomeModule(BaseModule):
             empty_label = StosOSLabel(
                 text="No scenes configured.\nCreate scenes to control multiple devices at once.",
                 halign='center',
-                color=StosOSTheme.get_color('text_disabled'),
+                color=self._COLOR_TEXT_DISABLED,
                 size_hint_y=None,
-                height=dp(100)
+                height=self._H100
             )
             empty_label.bind(size=empty_label.setter('text_size'))
             self.content_container.add_widget(empty_label)
+            self._show_content(self.content_scroll)
             return
         
-        for scene_name, scene_data in self.scenes.items():
-            scene_card = SceneCard(
-                scene_name=scene_name,
-                scene_data=scene_data,
-                on_activate=self._activate_scene,
-                on_edit=self._edit_scene
-            )
-            self.content_container.add_widget(scene_card)
+        self.scene_rv.data = [
+            {
+                'scene_name': scene_name,
+                'scene_data': scene_data,
+                'on_activate': self._activate_scene,
+                'on_edit': self._edit_scene
+            }
+            for scene_name, scene_data in self.scenes.items()
+        ]
+        self._show_content(self.scene_rv)
     
     def _control_device(self, device_id: str, command: str, parameters: Dict[str, Any] = None):
-        """Control a specific device"""
+        """Queue a command for a device; a command worker sends it"""
+        if device_id not in self.devices:
+            self.logger.error(f"Device not found: {device_id}")
+            return
+        
+        seq = next(self._command_seq)
+        self._latest_command[(device_id, _COMMAND_STATES.get(command, command))] = seq
+        self._note_activity()
+        
+        # A refresh still waiting would report the status from before the
+        # command; the command is followed by fresh polls anyway. Other
+        # devices the refresh covered get one of their own
+        pending_refresh = self._inflight_refresh.get(device_id)
+        if pending_refresh is not None:
+            keys = self._refresh_keys.get(pending_refresh, ())
+            if pending_refresh.cancel():
+                other_ids = [key for key in keys if key != device_id]
+                if other_ids:
+                    self._refresh_devices_status(other_ids)
+        
+        self._queue_job(
+            self.COMMAND_PRIORITY, seq, device_id, self._send_control, seq, device_id, command, parameters
+        )
+    
+    def _queue_job(self, priority: int, seq: int, route, run: Callable, *args):
+        """Queue run(*args) for the command workers, starting them if needed
+        
+        Jobs with the same route (a device id for device commands) go to
+        the same worker and run in the order queued.
+        """
+        if not self._command_workers:
+            self._start_command_workers()
+        command_queue = self._command_queues[hash(route) % len(self._command_queues)]
+        command_queue.put((priority, seq, (run, args)))
+    
+    def _start_command_workers(self):
+        """Start the threads that send queued device commands"""
+        for command_queue in self._command_queues:
+            worker = threading.Thread(
+                target=self._command_worker, args=(command_queue,), name="smarthome-cmd", daemon=True
+            )
+            worker.start()
+            self._command_workers.append(worker)
+    
+    def _command_worker(self, command_queue: queue.PriorityQueue):
+        """Run a queue's commands and refreshes, most urgent first, until told to stop"""
+        while True:
+            priority, seq, job = command_queue.get()
+            try:
+                if job is None:
+                    return
+                
+                run, args = job
+                run(*args)
+            finally:
+                command_queue.task_done()
+    
+    def _send_control(self, seq: int, device_id: str, command: str, parameters: Dict[str, Any] = None):
+        """Send a command to a device's service, unless a newer one replaced it; runs on a command worker"""
+        if self._latest_command.get((device_id, _COMMAND_STATES.get(command, command))) != seq:
+            return
+        
         device = self.devices.get(device_id)
         if not device:
             self.logger.error(f"Device not found: {device_id}")
@@ -798,154 +1434,408 @@ class SmartHomeModule(BaseModule):
             success = False
             
             # Route command to appropriate service
-            if device.platform == Platform.GOOGLE and self.google_service:
-                success = self.google_service.control_device(device_id, command, parameters)
-            elif device.platform == Platform.ALEXA and self.alexa_service:
-                success = self.alexa_service.control_device(device_id, command, parameters)
+            service = self._service_by_platform.get(device.platform)
+            if service:
+                success = service.control_device(device_id, command, parameters)
             
             if success:
                 self.logger.info(f"Device control successful: {device.name} - {command}")
                 # Refresh device status
-                Clock.schedule_once(lambda dt: self._refresh_device_status(device_id), 1.0)
+                self._await_status((device_id,))
             else:
                 self.logger.error(f"Device control failed: {device.name} - {command}")
                 
         except Exception as e:
             self.logger.error(f"Error controlling device {device.name}: {e}")
-            self.handle_error(e, f"control_device_{device_id}")
+            # Report on main thread
+            Clock.schedule_once(
+                functools.partial(self._report_error, e, f"control_device_{device_id}"), 0
+            )
+    
+    def _report_error(self, error: Exception, context: str, *args):
+        """Pass an error from a worker thread to handle_error; scheduled on the main thread"""
+        self.handle_error(error, context)
+    
+    def _on_room_control_press(self, instance):
+        """Send the pressed room button's command to its room"""
+        self._control_room(instance.room_name, instance.room_command)
     
     def _control_room(self, room_name: str, command: str, parameters: Dict[str, Any] = None):
-        """Control all devices in a room"""
+        """Control all devices in a room; a command worker sends the commands"""
         room_devices = self.rooms.get(room_name, [])
         
         if not room_devices:
             self.logger.warning(f"No devices found in room: {room_name}")
             return
         
-        success_count = 0
+        # One group command per platform
+        device_ids_by_platform: Dict[Platform, List[str]] = {}
         for device in room_devices:
-            try:
-                if device.platform == Platform.GOOGLE and self.google_service:
-                    if self.google_service.control_device(device.id, command, parameters):
-                        success_count += 1
-                elif device.platform == Platform.ALEXA and self.alexa_service:
-                    if self.alexa_service.control_device(device.id, command, parameters):
-                        success_count += 1
-            except Exception as e:
-                self.logger.error(f"Error controlling device {device.name}: {e}")
+            if device.platform in self._service_by_platform:
+                device_ids_by_platform.setdefault(device.platform, []).append(device.id)
+        
+        self._note_activity()
+        seq = next(self._command_seq)
+        self._queue_job(
+            self.COMMAND_PRIORITY, seq, seq, self._control_room_blocking,
+            room_name, command, parameters, device_ids_by_platform, [device.id for device in room_devices]
+        )
+    
+    def _control_room_blocking(self, room_name: str, command: str, parameters: Optional[Dict[str, Any]],
+                               device_ids_by_platform: Dict[Platform, List[str]], room_device_ids: List[str]):
+        """Send a room's group commands to all services at once; runs on a command worker"""
+        futures = [
+            _CONTROL_EXECUTOR.submit(
+                self._send_group_command, self._service_by_platform[platform], device_ids, command, parameters
+            )
+            for platform, device_ids in device_ids_by_platform.items()
+        ]
+        success_count = sum(future.result() for future in futures)
         
-        self.logger.info(f"Room control '{command}' executed on {success_count}/{len(room_devices)} devices in {room_name}")
+        self.logger.info(f"Room control '{command}' executed on {success_count}/{len(room_device_ids)} devices in {room_name}")
         
         # Refresh room device status
-        Clock.schedule_once(lambda dt: self._refresh_room_status(room_name), 1.0)
+        self._await_status(room_device_ids)
     
     def _activate_scene(self, scene_name: str, scene_data: Dict[str, Any]):
-        """Activate a scene"""
+        """Activate a scene; a command worker sends its settings"""
         devices_config = scene_data.get('devices', {})
         
         if not devices_config:
             self.logger.warning(f"No devices configured in scene: {scene_name}")
             return
         
-        success_count = 0
-        total_count = len(devices_config)
-        
+        # One batch of (device_id, command, parameters) per platform
+        batches: Dict[Platform, List[Tuple[str, str, Dict[str, Any]]]] = {}
         for device_id, device_config in devices_config.items():
             device = self.devices.get(device_id)
             if not device:
                 self.logger.warning(f"Device not found for scene: {device_id}")
                 continue
             
-            try:
-                # Apply each setting in the device config
-                for setting, value in device_config.items():
-                    command = self._setting_to_command(setting, value)
-                    if command:
-                        cmd, params = command
-                        if device.platform == Platform.GOOGLE and self.google_service:
-                            if self.google_service.control_device(device_id, cmd, params):
-                                success_count += 1
-                        elif device.platform == Platform.ALEXA and self.alexa_service:
-                            if self.alexa_service.control_device(device_id, cmd, params):
-                                success_count += 1
-                        
-            except Exception as e:
-                self.logger.error(f"Error applying scene to device {device.name}: {e}")
+            if device.platform not in self._service_by_platform:
+                continue
+            commands = batches.setdefault(device.platform, [])
+            
+            # Apply each setting in the device config
+            for setting, value in device_config.items():
+                command = self._setting_to_command(setting, value)
+                if command:
+                    cmd, params = command
+                    commands.append((device_id, cmd, params))
+        
+        self._note_activity()
+        seq = next(self._command_seq)
+        self._queue_job(
+            self.COMMAND_PRIORITY, seq, seq, self._activate_scene_blocking,
+            scene_name, batches, [device_id for device_id in devices_config if device_id in self.devices]
+        )
+    
+    def _activate_scene_blocking(self, scene_name: str, batches: Dict[Platform, List[Tuple[str, str, Dict[str, Any]]]],
+                                 scene_device_ids: List[str]):
+        """Send a scene's batches to all services at once; runs on a command worker"""
+        futures = [
+            _CONTROL_EXECUTOR.submit(self._send_command_batch, self._service_by_platform[platform], commands)
+            for platform, commands in batches.items()
+            if commands
+        ]
+        success_count = sum(future.result() for future in futures)
         
         self.logger.info(f"Scene '{scene_name}' activated on {success_count} device settings")
         
-        # Refresh all device status
-        Clock.schedule_once(lambda dt: self._refresh_devices(), 2.0)
+        # Refresh the scene's devices
+        self._await_status(scene_device_ids)
+    
+    def _send_group_command(self, service, device_ids: List[str], command: str,
+                            parameters: Dict[str, Any] = None) -> int:
+        """Send one command to several of a service's devices; runs on a worker thread
+        
+        Returns the number of devices that accepted it.
+        """
+        try:
+            results = service.control_device_group(device_ids, command, parameters)
+            return sum(1 for success in results.values() if success)
+        except Exception as e:
+            self.logger.error(f"Error sending '{command}' to {len(device_ids)} devices: {e}")
+            return 0
+    
+    def _send_command_batch(self, service, commands: List[Tuple[str, str, Dict[str, Any]]]) -> int:
+        """Send a batch of commands through a service; runs on a worker thread
+        
+        Returns the number of commands the devices accepted.
+        """
+        try:
+            return sum(1 for success in service.control_devices_batch(commands) if success)
+        except Exception as e:
+            self.logger.error(f"Error sending {len(commands)} scene commands: {e}")
+            return 0
     
     def _setting_to_command(self, setting: str, value: Any) -> Optional[tuple]:
         """Convert scene setting to device command"""
         if setting == "power":
-            return ("power_on" if value else "power_off", {})
-        elif setting == "brightness":
-            return ("set_brightness", {"brightness": value})
-        elif setting == "volume":
-            return ("set_volume", {"volume": value})
-        elif setting == "temperature":
-            return ("set_temperature", {"temperature": value})
-        elif setting == "color":
-            return ("set_color", {"color": value})
-        else:
+            return ("power_on" if value else "power_off", _NO_PARAMETERS)
+        
+        entry = _SETTING_COMMANDS.get(setting)
+        if entry is None:
             return None
+        
+        command, param = entry
+        return (command, {param: value})
+    
+    def _await_status(self, device_ids):
+        """Poll commanded devices for their status until each reports back
+        
+        Their recorded status is dropped first, as it predates the command.
+        """
+        for device_id in device_ids:
+            self._status_times.pop(device_id, None)
+        
+        Clock.schedule_once(
+            functools.partial(self._confirm_status, tuple(device_ids), 0),
+            self.STATUS_CONFIRM_DELAYS[0]
+        )
+    
+    def _confirm_status(self, device_ids: Tuple[str, ...], attempt: int, *args):
+        """Refresh the devices that haven't reported yet, backing off between tries"""
+        self._refresh_devices_status(device_ids)
+        
+        pending = tuple(
+            device_id for device_id in device_ids
+            if device_id in self.devices and not self._is_status_fresh(device_id)
+        )
+        attempt += 1
+        if pending and attempt < len(self.STATUS_CONFIRM_DELAYS):
+            Clock.schedule_once(
+                functools.partial(self._confirm_status, pending, attempt),
+                self.STATUS_CONFIRM_DELAYS[attempt]
+            )
+    
+    def _is_status_fresh(self, device_id: str) -> bool:
+        """Whether the device reported its status within STATUS_TTL
+        
+        Shortly after a command the current poll interval is shorter, and
+        is used instead so the faster polls reach the services.
+        """
+        reported = self._status_times.get(device_id)
+        ttl = min(self.STATUS_TTL, self.POLL_INTERVALS[self._poll_step])
+        return reported is not None and time.monotonic() - reported < ttl
     
     def _refresh_devices(self, *args):
         """Refresh all device status"""
+        if self.devices and all(self._is_status_fresh(device_id) for device_id in self.devices):
+            return
+        
+        # Nothing is returned: this is also a button and Clock callback
+        self._submit_refresh((self._REFRESH_ALL,), self._refresh_all_blocking)
+    
+    def _refresh_all_blocking(self):
+        """Ask every authenticated service for its devices' status; runs on a worker thread"""
         try:
-            if self.google_service and self.google_service.is_authenticated():
-                self.google_service.refresh_device_status()
-            
-            if self.alexa_service and self.alexa_service.is_authenticated():
-                self.alexa_service.refresh_device_status()
+            for service in list(self._service_by_platform.values()):
+                if service.is_authenticated():
+                    service.refresh_device_status()
             
             self.last_refresh = datetime.now()
             self.logger.info("Device status refresh completed")
             
         except Exception as e:
             self.logger.error(f"Error refreshing devices: {e}")
-            self.handle_error(e, "refresh_devices")
+            Clock.schedule_once(functools.partial(self._report_error, e, "refresh_devices"), 0)
     
     def _refresh_device_status(self, device_id: str):
         """Refresh status for a specific device"""
-        device = self.devices.get(device_id)
-        if not device:
-            return
+        self._refresh_devices_status((device_id,))
+    
+    def _refresh_devices_status(self, device_ids):
+        """Refresh status for several devices, with one request per platform
+        
+        Devices whose status is fresh, or which are being refreshed
+        already, are left out.
+        """
+        device_ids_by_platform: Dict[Platform, List[str]] = {}
+        for device_id in device_ids:
+            device = self.devices.get(device_id)
+            if not device or self._is_status_fresh(device_id):
+                continue
+            running = self._inflight_refresh.get(device_id)
+            if running is not None and not running.done():
+                continue
+            if device.platform in self._service_by_platform:
+                device_ids_by_platform.setdefault(device.platform, []).append(device_id)
         
+        for platform, platform_device_ids in device_ids_by_platform.items():
+            self._submit_refresh(
+                tuple(platform_device_ids), self._refresh_devices_blocking,
+                self._service_by_platform[platform], platform_device_ids
+            )
+    
+    def _refresh_devices_blocking(self, service, device_ids: List[str]):
+        """Ask a service for some of its devices' status; runs on a worker thread"""
         try:
-            if device.platform == Platform.GOOGLE and self.google_service:
-                self.google_service.refresh_device_status(device_id)
-            elif device.platform == Platform.ALEXA and self.alexa_service:
-                self.alexa_service.refresh_device_status(device_id)
-                
+            service.refresh_devices_status(device_ids)
+        except Exception as e:
+            self.logger.error(f"Error refreshing {len(device_ids)} devices: {e}")
+    
+    def _submit_refresh(self, keys: Tuple[str, ...], refresh: Callable, *args) -> Future:
+        """Queue a status refresh behind any waiting device commands
+        
+        The refresh is tracked under its keys: the device ids it covers, or
+        _REFRESH_ALL. If one of them has a refresh still running, that one
+        is returned instead of starting another.
+        """
+        for key in keys:
+            future = self._inflight_refresh.get(key)
+            if future is not None and not future.done():
+                return future
+        
+        future = Future()
+        for key in keys:
+            self._inflight_refresh[key] = future
+        self._refresh_keys[future] = keys
+        future.add_done_callback(functools.partial(self._on_refresh_done, keys))
+        seq = next(self._command_seq)
+        self._queue_job(self.REFRESH_PRIORITY, seq, seq, self._run_refresh, future, refresh, args)
+        return future
+    
+    @staticmethod
+    def _run_refresh(future: Future, refresh: Callable, args: tuple):
+        """Run a queued refresh on a command worker, unless it was cancelled"""
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(refresh(*args))
         except Exception as e:
-            self.logger.error(f"Error refreshing device {device.name}: {e}")
+            future.set_exception(e)
+    
+    def _on_refresh_done(self, keys: Tuple[str, ...], future: Future):
+        """Forget a finished refresh, except for keys a newer one took"""
+        self._refresh_keys.pop(future, None)
+        for key in keys:
+            if self._inflight_refresh.get(key) is future:
+                self._inflight_refresh.pop(key, None)
     
     def _refresh_room_status(self, room_name: str):
         """Refresh status for all devices in a room"""
         room_devices = self.rooms.get(room_name, [])
-        
-        for device in room_devices:
-            self._refresh_device_status(device.id)
+        self._refresh_devices_status([device.id for device in room_devices])
     
     def _on_device_update(self, device: SmartDevice):
-        """Handle device status update callback"""
+        """Handle device status update callback
+        
+        Services call this from worker threads too; those
+        updates are passed on to the main thread.
+        """
+        self._status_times[device.id] = time.monotonic()
+        if threading.current_thread() is threading.main_thread():
+            self._apply_device_update(device)
+        else:
+            Clock.schedule_once(functools.partial(self._apply_device_update, device), 0)
+    
+    def _apply_device_update(self, device: SmartDevice, *args):
+        """Apply one device's update, rebuilding the lists only if its place in them changed"""
+        ui_built = self.content_area is not None
+        
         # Update local device cache
+        previous = self.devices.get(device.id)
         self.devices[device.id] = device
         
-        # Update UI if currently viewing devices
-        if self.current_view in ["devices", "rooms"]:
-            Clock.schedule_once(lambda dt: self._refresh_content(), 0.1)
+        # A new device, or a new room or name, changes the sort order
+        resorted = self._device_placement.get(device.id) != (device.room, device.name)
+        moved = False
+        if resorted or previous is not device:
+            moved = self._place_device(device)
+        
+        if not ui_built:
+            return
+        
+        self._update_device_count()
+        
+        if moved or (resorted and self.current_view == "devices"):
+            if self.current_view in ("devices", "rooms"):
+                self._schedule_refresh()
+            return
+        
+        # Rewriting the row makes the RecycleView refresh that card, if shown;
+        # rows are stale while a rebuild is due, which rewrites them anyway
+        row = self._device_rows.get(device.id)
+        if row is not None and not self._refresh_pending:
+            self.device_rv.data[row] = {'device': device, 'on_control': self._control_device}
+        
+        cached = self._room_panels.get(device.room or "Unknown")
+        if cached is not None and device.id in cached[2]:
+            cached[2][device.id].update_device(device)
+    
+    def _schedule_refresh(self):
+        """Rebuild the shown list shortly, once for a whole burst of updates"""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            Clock.schedule_once(self._on_refresh_due, self.REFRESH_COALESCE_DELAY)
+    
+    def _on_refresh_due(self, *args):
+        """Run the scheduled rebuild, unless a refresh already happened"""
+        if self._refresh_pending:
+            self._refresh_content()
+    
+    def _place_device(self, device: SmartDevice) -> bool:
+        """Put a device in its room's bucket, touching only the rooms it left and joined
+        
+        Returns True if the device is new or changed rooms.
+        """
+        room = device.room or "Unknown"
+        placement = self._device_placement.get(device.id)
+        self._device_placement[device.id] = (device.room, device.name)
+        
+        if placement is None or placement[1] != device.name:
+            device.name_lower = device.name.lower()
+            self._voice_index = None
+        
+        if placement is not None:
+            old_room = placement[0] or "Unknown"
+            old_devices = self.rooms.get(old_room, [])
+            for index, room_device in enumerate(old_devices):
+                if room_device.id == device.id:
+                    if old_room == room:
+                        old_devices[index] = device
+                        return False
+                    del old_devices[index]
+                    break
+            if not old_devices:
+                self.rooms.pop(old_room, None)
+        
+        self.rooms.setdefault(room, []).append(device)
+        return True
     
     def _start_status_monitoring(self):
         """Start periodic status monitoring"""
-        # Refresh device status every 30 seconds
-        self.status_timer = Clock.schedule_interval(self._refresh_devices, 30.0)
+        self._schedule_status_poll()
+    
+    def _schedule_status_poll(self):
+        """Schedule the next status poll for the current activity level"""
+        if self.status_timer:
+            self.status_timer.cancel()
+        
+        interval = self.POLL_INTERVALS[self._poll_step]
+        if not self._active or self.current_view == "scenes":
+            interval *= self.POLL_HIDDEN_FACTOR
+        self.status_timer = Clock.schedule_once(self._on_status_poll, interval)
+    
+    def _on_status_poll(self, *args):
+        """Refresh device status, then back off one step towards idle"""
+        self._refresh_devices()
+        self._poll_step = min(self._poll_step + 1, len(self.POLL_INTERVALS) - 1)
+        self._schedule_status_poll()
+    
+    def _note_activity(self):
+        """Poll quickly again after the user controlled something"""
+        if self._poll_step != 0:
+            self._poll_step = 0
+            if self.status_timer:
+                self._schedule_status_poll()
     
     def _load_scenes(self):
         """Load scenes from configuration"""
+        self._scene_index = None
+        
         # Default scenes
         self.scenes = {
             "Study Mode": {
@@ -974,41 +1864,80 @@ class SmartHomeModule(BaseModule):
         # TODO: Implement scene editing dialog
         self.logger.info(f"Scene editing not yet implemented: {scene_name}")
     
+    def _save_scene(self, scene_name: str, scene_data: Dict[str, Any], old_name: str = None):
+        """Add or replace a scene, renaming it from old_name if given
+        
+        The scene dialogs save through here so voice matching sees the change.
+        """
+        if old_name and old_name != scene_name:
+            self.scenes.pop(old_name, None)
+        self.scenes[scene_name] = scene_data
+        self._scene_index = None
+        
+        if self.content_area is not None and self.current_view == "scenes":
+            self._schedule_refresh()
+    
     def _show_settings(self, *args):
         """Show smart home settings"""
         # TODO: Implement settings dialog
         self.logger.info("Smart home settings not yet implemented")
     
+    def _get_voice_index(self) -> _VoiceIndex:
+        """Get the device lookups for voice commands, building them if needed"""
+        if self._voice_index is None:
+            devices_by_type = {}
+            devices_by_name = {}
+            for device in self.devices.values():
+                devices_by_type.setdefault(device.device_type, []).append(device.id)
+                # First device wins a shared name, as the old scan did
+                devices_by_name.setdefault(device.name_lower, device.id)
+            self._voice_index = _VoiceIndex(
+                devices_by_type, devices_by_name, _compile_names(devices_by_name)
+            )
+        return self._voice_index
+    
+    def _get_scene_index(self) -> Tuple[Dict[str, str], Optional[Pattern]]:
+        """Get scene names by lowercased name and their pattern, building them if needed"""
+        if self._scene_index is None:
+            scenes_by_name = {}
+            for scene_name in self.scenes:
+                scenes_by_name.setdefault(scene_name.lower(), scene_name)
+            self._scene_index = (scenes_by_name, _compile_names(scenes_by_name))
+        return self._scene_index
+    
     def handle_voice_command(self, command: str) -> bool:
         """Handle voice command directed to smart home"""
         command_lower = command.lower()
         
         try:
-            # Simple command parsing
-            if "turn on" in command_lower or "turn off" in command_lower:
-                action = "power_on" if "turn on" in command_lower else "power_off"
+            # One pass finds every command keyword
+            keywords = set(_VOICE_KEYWORDS.findall(command_lower))
+            
+            if "turn on" in keywords or "turn off" in keywords:
+                action = "power_on" if "turn on" in keywords else "power_off"
                 
-                # Extract device/room name
-                words = command_lower.split()
-                if "lights" in command_lower:
-                    # Control all lights
-                    light_devices = [d for d in self.devices.values() if d.device_type == DeviceType.LIGHT]
-                    for device in light_devices:
-                        self._control_device(device.id, action)
+                voice_index = self._get_voice_index()
+                if "lights" in keywords:
+                    # Control all lights; the command workers send them in parallel
+                    for device_id in voice_index.devices_by_type.get(DeviceType.LIGHT, ()):
+                        self._control_device(device_id, action)
                     return True
                 
-                # Look for specific device names
-                for device in self.devices.values():
-                    if device.name.lower() in command_lower:
-                        self._control_device(device.id, action)
-                        return True
+                # Look for a device name; one scan over all names, preferring
+                # the longer of overlapping ones
+                match = voice_index.name_pattern and voice_index.name_pattern.search(command_lower)
+                if match:
+                    self._control_device(voice_index.devices_by_name[match.group()], action)
+                    return True
             
-            elif "activate" in command_lower or "scene" in command_lower:
+            elif "activate" in keywords or "scene" in keywords:
                 # Scene activation
-                for scene_name in self.scenes.keys():
-                    if scene_name.lower() in command_lower:
-                        self._activate_scene(scene_name, self.scenes[scene_name])
-                        return True
+                scenes_by_name, scene_pattern = self._get_scene_index()
+                match = scene_pattern and scene_pattern.search(command_lower)
+                if match:
+                    scene_name = scenes_by_name[match.group()]
+                    self._activate_scene(scene_name, self.scenes[scene_name])
+                    return True
             
             return False
             
@@ -1021,7 +1950,11 @@ class SmartHomeModule(BaseModule):
         super().on_activate()
         
         # Refresh devices when module is activated
-        Clock.schedule_once(lambda dt: self._refresh_devices(), 0.5)
+        Clock.schedule_once(self._refresh_devices, 0.5)
+        
+        # Drop the slower polling used while hidden
+        if self.status_timer:
+            self._schedule_status_poll()
     
     def cleanup(self):
         """Clean up module resources"""
@@ -1030,6 +1963,12 @@ class SmartHomeModule(BaseModule):
             if self.status_timer:
                 self.status_timer.cancel()
             
+            # Stop the command workers once the queued commands are sent
+            if self._command_workers:
+                for command_queue in self._command_queues:
+                    command_queue.put((self._STOP_PRIORITY, next(self._command_seq), None))
+            self._command_workers = []
+            
             # Clean up services
             if self.google_service:
                 self.google_service.cleanup()
@@ -7,8 +7,10 @@ Handles device discovery and control through Alexa Voice Service API.
 import os
 import json
 import logging
+import weakref
 import requests
-from typing import List, Dict, Any, Optional, Callable
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -63,6 +65,10 @@ class AlexaService:
         self.auth_url = "https://api.amazon.com/auth/o2/token"
         self.smart_home_url = "https://api.amazonalexa.com/v1/smarthome"
         
+        # Keep-alive HTTPS connections shared by all API calls
+        self._session = requests.Session()
+        self.configure_pool()
+        
         # Mock data for development/testing
         self._mock_devices = self._create_mock_devices()
     
@@ -175,7 +181,7 @@ class AlexaService:
                 'client_secret': self.client_secret
             }
             
-            response = requests.post(self.auth_url, data=token_data)
+            response = self._session.post(self.auth_url, data=token_data)
             response.raise_for_status()
             
             token_info = response.json()
@@ -214,6 +220,19 @@ class AlexaService:
         
         return True
     
+    def configure_pool(self, num_clients: int = 4):
+        """
+        Set how many kept-alive connections API calls share per host
+        
+        Calls beyond that wait for a free connection instead of opening a
+        new one, so this also caps how many calls run at once.
+        
+        Args:
+            num_clients: Connections kept open per host
+        """
+        adapter = HTTPAdapter(pool_maxsize=num_clients, pool_block=True)
+        self._session.mount("https://", adapter)
+    
     def _get_headers(self) -> Dict[str, str]:
         """Get HTTP headers for API requests"""
         return {
@@ -272,36 +291,78 @@ class AlexaService:
         Returns:
             True if command successful, False otherwise
         """
+        return self.control_devices_batch([(device_id, command, parameters)])[0]
+    
+    def control_devices_batch(self, commands: List[Tuple[str, str, Dict[str, Any]]]) -> List[bool]:
+        """
+        Send a batch of control commands, e.g. all of a scene's settings
+        
+        Commands run in order. Each changed device notifies the callbacks
+        once, after the batch, rather than once per command.
+        
+        Args:
+            commands: (device_id, command, parameters) tuples
+            
+        Returns:
+            Success flag for each command, in order
+        """
         if not self.is_authenticated():
             self.logger.error("Not authenticated with Alexa")
-            return False
+            return [False] * len(commands)
         
-        device = self.get_device(device_id)
-        if not device:
-            self.logger.error(f"Device not found: {device_id}")
-            return False
+        results = []
+        updated = {}
         
-        if not device.is_online:
-            self.logger.error(f"Device offline: {device.name}")
-            return False
-        
-        try:
-            # Execute command based on device type and capabilities
-            success = self._execute_device_command(device, command, parameters or {})
+        for device_id, command, parameters in commands:
+            device = self.get_device(device_id)
+            if not device:
+                self.logger.error(f"Device not found: {device_id}")
+                results.append(False)
+                continue
             
-            if success:
-                # Update device status
-                device.last_updated = datetime.now()
-                self._notify_device_update(device)
-                self.logger.info(f"Command '{command}' executed on {device.name}")
-            else:
-                self.logger.error(f"Failed to execute command '{command}' on {device.name}")
+            if not device.is_online:
+                self.logger.error(f"Device offline: {device.name}")
+                results.append(False)
+                continue
             
-            return success
+            try:
+                # Execute command based on device type and capabilities
+                success = self._execute_device_command(device, command, parameters or {})
+                
+                if success:
+                    # Update device status
+                    device.last_updated = datetime.now()
+                    updated[device.id] = device
+                    self.logger.info(f"Command '{command}' executed on {device.name}")
+                else:
+                    self.logger.error(f"Failed to execute command '{command}' on {device.name}")
+                
+            except Exception as e:
+                self.logger.error(f"Error controlling device {device.name}: {e}")
+                success = False
             
-        except Exception as e:
-            self.logger.error(f"Error controlling device {device.name}: {e}")
-            return False
+            results.append(success)
+        
+        for device in updated.values():
+            self._notify_device_update(device)
+        
+        return results
+    
+    def control_device_group(self, device_ids: List[str], command: str,
+                             parameters: Dict[str, Any] = None) -> Dict[str, bool]:
+        """
+        Send the same control command to several devices, e.g. a whole room
+        
+        Args:
+            device_ids: Target device IDs
+            command: Command to execute on each device
+            parameters: Command parameters
+            
+        Returns:
+            Success flag per device ID
+        """
+        results = self.control_devices_batch([(device_id, command, parameters) for device_id in device_ids])
+        return dict(zip(device_ids, results))
     
     def _execute_device_command(self, device: SmartDevice, command: str, parameters: Dict[str, Any]) -> bool:
         """
@@ -407,25 +468,37 @@ class AlexaService:
         Returns:
             True if successful, False otherwise
         """
+        return self.refresh_devices_status([device_id] if device_id else None)
+    
+    def refresh_devices_status(self, device_ids: List[str] = None) -> bool:
+        """
+        Refresh status for several devices in one query, e.g. a whole room
+        
+        Args:
+            device_ids: Device IDs to refresh, or None for all devices
+            
+        Returns:
+            True if every device was refreshed, False otherwise
+        """
         if not self.is_authenticated():
             return False
         
         try:
-            if device_id:
-                device = self.get_device(device_id)
-                if device:
-                    # In a real implementation, this would query the device status
-                    # For now, we'll just update the timestamp
-                    device.last_updated = datetime.now()
-                    self._notify_device_update(device)
-                    return True
-                return False
+            if device_ids is None:
+                devices = list(self._devices.values())
             else:
-                # Refresh all devices
-                for device in self._devices.values():
-                    device.last_updated = datetime.now()
-                    self._notify_device_update(device)
-                return True
+                devices = [self.get_device(device_id) for device_id in device_ids]
+            
+            # In a real implementation, this would query all of their statuses at once
+            # For now, we'll just update the timestamps
+            refreshed = True
+            for device in devices:
+                if not device:
+                    refreshed = False
+                    continue
+                device.last_updated = datetime.now()
+                self._notify_device_update(device)
+            return refreshed
                 
         except Exception as e:
             self.logger.error(f"Error refreshing device status: {e}")
@@ -438,8 +511,14 @@ class AlexaService:
         Args:
             callback: Function to call when device status changes
         """
-        if callback not in self._device_callbacks:
-            self._device_callbacks.append(callback)
+        if self._find_device_callback(callback) is None:
+            # Bound methods are held weakly so a registered screen can be
+            # collected without having to unregister first
+            if hasattr(callback, '__self__'):
+                ref = weakref.WeakMethod(callback)
+            else:
+                ref = lambda: callback
+            self._device_callbacks.append(ref)
     
     def remove_device_callback(self, callback: Callable[[SmartDevice], None]):
         """
@@ -448,8 +527,16 @@ class AlexaService:
         Args:
             callback: Callback function to remove
         """
-        if callback in self._device_callbacks:
-            self._device_callbacks.remove(callback)
+        ref = self._find_device_callback(callback)
+        if ref is not None:
+            self._device_callbacks.remove(ref)
+    
+    def _find_device_callback(self, callback: Callable[[SmartDevice], None]):
+        """Return the stored reference for a callback, if registered"""
+        for ref in self._device_callbacks:
+            if ref() == callback:
+                return ref
+        return None
     
     def _notify_device_update(self, device: SmartDevice):
         """
@@ -458,7 +545,15 @@ class AlexaService:
         Args:
             device: Updated device
         """
-        for callback in self._device_callbacks:
+        for ref in list(self._device_callbacks):
+            callback = ref()
+            if callback is None:
+                # Another thread notifying at the same time may have removed it
+                try:
+                    self._device_callbacks.remove(ref)
+                except ValueError:
+                    pass
+                continue
             try:
                 callback(device)
             except Exception as e:
@@ -533,6 +628,7 @@ class AlexaService:
             self.token_expires_at = None
             self._devices.clear()
             self._device_callbacks.clear()
+            self._session.close()
             self.logger.info("Alexa service cleaned up")
         except Exception as e:
             self.logger.error(f"Error during cleanup: {e}")
\ No newline at end of file
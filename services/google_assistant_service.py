@@ -7,8 +7,9 @@ Handles device discovery and control through Google Assistant SDK.
 import os
 import json
 import logging
+import weakref
 import asyncio
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -206,32 +207,74 @@ class GoogleAssistantService:
         Returns:
             True if command successful, False otherwise
         """
-        device = self.get_device(device_id)
-        if not device:
-            self.logger.error(f"Device not found: {device_id}")
-            return False
+        return self.control_devices_batch([(device_id, command, parameters)])[0]
+    
+    def control_devices_batch(self, commands: List[Tuple[str, str, Dict[str, Any]]]) -> List[bool]:
+        """
+        Send a batch of control commands, e.g. all of a scene's settings
         
-        if not device.is_online:
-            self.logger.error(f"Device offline: {device.name}")
-            return False
+        Commands run in order. Each changed device notifies the callbacks
+        once, after the batch, rather than once per command.
         
-        try:
-            # Execute command based on device type and capabilities
-            success = self._execute_device_command(device, command, parameters or {})
+        Args:
+            commands: (device_id, command, parameters) tuples
             
-            if success:
-                # Update device status
-                device.last_updated = datetime.now()
-                self._notify_device_update(device)
-                self.logger.info(f"Command '{command}' executed on {device.name}")
-            else:
-                self.logger.error(f"Failed to execute command '{command}' on {device.name}")
+        Returns:
+            Success flag for each command, in order
+        """
+        results = []
+        updated = {}
+        
+        for device_id, command, parameters in commands:
+            device = self.get_device(device_id)
+            if not device:
+                self.logger.error(f"Device not found: {device_id}")
+                results.append(False)
+                continue
             
-            return success
+            if not device.is_online:
+                self.logger.error(f"Device offline: {device.name}")
+                results.append(False)
+                continue
             
-        except Exception as e:
-            self.logger.error(f"Error controlling device {device.name}: {e}")
-            return False
+            try:
+                # Execute command based on device type and capabilities
+                success = self._execute_device_command(device, command, parameters or {})
+                
+                if success:
+                    # Update device status
+                    device.last_updated = datetime.now()
+                    updated[device.id] = device
+                    self.logger.info(f"Command '{command}' executed on {device.name}")
+                else:
+                    self.logger.error(f"Failed to execute command '{command}' on {device.name}")
+                
+            except Exception as e:
+                self.logger.error(f"Error controlling device {device.name}: {e}")
+                success = False
+            
+            results.append(success)
+        
+        for device in updated.values():
+            self._notify_device_update(device)
+        
+        return results
+    
+    def control_device_group(self, device_ids: List[str], command: str,
+                             parameters: Dict[str, Any] = None) -> Dict[str, bool]:
+        """
+        Send the same control command to several devices, e.g. a whole room
+        
+        Args:
+            device_ids: Target device IDs
+            command: Command to execute on each device
+            parameters: Command parameters
+            
+        Returns:
+            Success flag per device ID
+        """
+        results = self.control_devices_batch([(device_id, command, parameters) for device_id in device_ids])
+        return dict(zip(device_ids, results))
     
     def _execute_device_command(self, device: SmartDevice, command: str, parameters: Dict[str, Any]) -> bool:
         """
@@ -309,22 +352,34 @@ class GoogleAssistantService:
         Returns:
             True if successful, False otherwise
         """
+        return self.refresh_devices_status([device_id] if device_id else None)
+    
+    def refresh_devices_status(self, device_ids: List[str] = None) -> bool:
+        """
+        Refresh status for several devices in one query, e.g. a whole room
+        
+        Args:
+            device_ids: Device IDs to refresh, or None for all devices
+            
+        Returns:
+            True if every device was refreshed, False otherwise
+        """
         try:
-            if device_id:
-                device = self.get_device(device_id)
-                if device:
-                    # In a real implementation, this would query the device status
-                    # For now, we'll just update the timestamp
-                    device.last_updated = datetime.now()
-                    self._notify_device_update(device)
-                    return True
-                return False
+            if device_ids is None:
+                devices = list(self._devices.values())
             else:
-                # Refresh all devices
-                for device in self._devices.values():
-                    device.last_updated = datetime.now()
-                    self._notify_device_update(device)
-                return True
+                devices = [self.get_device(device_id) for device_id in device_ids]
+            
+            # In a real implementation, this would query all of their statuses at once
+            # For now, we'll just update the timestamps
+            refreshed = True
+            for device in devices:
+                if not device:
+                    refreshed = False
+                    continue
+                device.last_updated = datetime.now()
+                self._notify_device_update(device)
+            return refreshed
                 
         except Exception as e:
             self.logger.error(f"Error refreshing device status: {e}")
@@ -337,8 +392,14 @@ class GoogleAssistantService:
         Args:
             callback: Function to call when device status changes
         """
-        if callback not in self._device_callbacks:
-            self._device_callbacks.append(callback)
+        if self._find_device_callback(callback) is None:
+            # Bound methods are held weakly so a registered screen can be
+            # collected without having to unregister first
+            if hasattr(callback, '__self__'):
+                ref = weakref.WeakMethod(callback)
+            else:
+                ref = lambda: callback
+            self._device_callbacks.append(ref)
     
     def remove_device_callback(self, callback: Callable[[SmartDevice], None]):
         """
@@ -347,8 +408,16 @@ class GoogleAssistantService:
         Args:
             callback: Callback function to remove
         """
-        if callback in self._device_callbacks:
-            self._device_callbacks.remove(callback)
+        ref = self._find_device_callback(callback)
+        if ref is not None:
+            self._device_callbacks.remove(ref)
+    
+    def _find_device_callback(self, callback: Callable[[SmartDevice], None]):
+        """Return the stored reference for a callback, if registered"""
+        for ref in self._device_callbacks:
+            if ref() == callback:
+                return ref
+        return None
     
     def _notify_device_update(self, device: SmartDevice):
         """
@@ -357,7 +426,15 @@ class GoogleAssistantService:
         Args:
             device: Updated device
         """
-        for callback in self._device_callbacks:
+        for ref in list(self._device_callbacks):
+            callback = ref()
+            if callback is None:
+                # Another thread notifying at the same time may have removed it
+                try:
+                    self._device_callbacks.remove(ref)
+                except ValueError:
+                    pass
+                continue
             try:
                 callback(device)
             except Exception as e:
@@ -249,6 +249,45 @@ class TestDatabaseManager:
         deleted_idea = temp_db.get_idea(idea.id)
         assert deleted_idea is None
     
+    def test_delete_ideas(self, temp_db):
+        """Test deleting several ideas in one call."""
+        ideas = [Idea(content=f"Idea {i}") for i in range(3)]
+        for idea in ideas:
+            assert temp_db.create_idea(idea)
+        
+        assert temp_db.delete_ideas([ideas[0].id, ideas[2].id])
+        assert temp_db.get_idea(ideas[0].id) is None
+        assert temp_db.get_idea(ideas[2].id) is None
+        assert temp_db.get_idea(ideas[1].id) is not None
+        
+        # Unknown ids and an empty list are not errors
+        assert temp_db.delete_ideas(["missing-id"])
+        assert temp_db.delete_ideas([])
+        assert temp_db.get_idea(ideas[1].id) is not None
+    
+    def test_iter_ideas(self, temp_db):
+        """Test streaming ideas, most recently updated first."""
+        now = datetime.now()
+        older = Idea(content="Older idea", updated_at=now - timedelta(days=1))
+        newest = Idea(content="Newest idea", updated_at=now)
+        oldest = Idea(content="Oldest idea", updated_at=now - timedelta(days=2))
+        for idea in (older, newest, oldest):
+            assert temp_db.create_idea(idea)
+        
+        ideas = list(temp_db.iter_ideas())
+        assert [idea.id for idea in ideas] == [newest.id, older.id, oldest.id]
+        assert ideas[0].content == "Newest idea"
+    
+    def test_iter_ideas_raises_on_bad_row(self, temp_db):
+        """Test that a row failing to load stops the stream with an error."""
+        idea = Idea(content="Idea with a broken timestamp")
+        assert temp_db.create_idea(idea)
+        with temp_db.get_cursor() as cursor:
+            cursor.execute("UPDATE ideas SET updated_at = 'not a date' WHERE id = ?", (idea.id,))
+        
+        with pytest.raises(ValueError):
+            list(temp_db.iter_ideas())
+    
     def test_study_session_crud_operations(self, temp_db):
         """Test StudySession CRUD operations."""
         # Create session
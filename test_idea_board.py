@@ -181,12 +181,12 @@ def test_idea_board_module():
         assert len(idea_board.ideas) == 4
         
         # Test filtering by tag
-        idea_board.current_filter["tag"] = "physics"
+        idea_board.selected_tags = {"physics"}
         idea_board._apply_filters_and_sort()
         assert len(idea_board.filtered_ideas) == 2
         
         # Test search
-        idea_board.current_filter["tag"] = None
+        idea_board.selected_tags = set()
         idea_board.search_term = "math"
         idea_board._apply_filters_and_sort()
         assert len(idea_board.filtered_ideas) == 2
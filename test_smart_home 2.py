@@ -12,6 +12,8 @@ Tests the smart home module functionality including:
 
 import sys
 import os
+import threading
+import time
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
@@ -128,11 +130,16 @@ class TestSmartHomeModule(unittest.TestCase):
             room="Kitchen"
         )
     
+    def _wait_for_commands(self):
+        """Wait until the module's command workers have run every queued job"""
+        for command_queue in self.module._command_queues:
+            command_queue.join()
+    
     def test_module_initialization(self):
         """Test module initialization"""
         # Mock services
-        with patch('modules.smart_home.GoogleAssistantService') as mock_google, \
-             patch('modules.smart_home.AlexaService') as mock_alexa:
+        with patch('services.google_assistant_service.GoogleAssistantService') as mock_google, \
+             patch('services.alexa_service.AlexaService') as mock_alexa:
             
             mock_google.return_value.authenticate.return_value = True
             mock_alexa.return_value.authenticate.return_value = True
@@ -185,6 +192,9 @@ class TestSmartHomeModule(unittest.TestCase):
             {"brightness": 90}
         )
         
+        # Commands are sent by the module's command workers
+        self._wait_for_commands()
+        
         # Verify service was called
         mock_google_service.control_device.assert_called_once_with(
             self.test_google_device.id,
@@ -207,6 +217,9 @@ class TestSmartHomeModule(unittest.TestCase):
             {"volume": 75}
         )
         
+        # Commands are sent by the module's command workers
+        self._wait_for_commands()
+        
         # Verify service was called
         mock_alexa_service.control_device.assert_called_once_with(
             self.test_alexa_device.id,
@@ -214,6 +227,52 @@ class TestSmartHomeModule(unittest.TestCase):
             {"volume": 75}
         )
     
+    def test_device_commands_sent_in_order(self):
+        """Test that one device's commands reach the service in the order given"""
+        received = []
+        first_started = threading.Event()
+        
+        def control_device(device_id, command, parameters):
+            if command == "power_on":
+                # A slow first command, still running when the next is queued
+                first_started.set()
+                time.sleep(0.2)
+            received.append(command)
+            return True
+        
+        mock_google_service = Mock()
+        mock_google_service.control_device.side_effect = control_device
+        self.module.google_service = mock_google_service
+        self.module.devices[self.test_google_device.id] = self.test_google_device
+        
+        self.module._control_device(self.test_google_device.id, "power_on")
+        self.assertTrue(first_started.wait(1))
+        self.module._control_device(self.test_google_device.id, "power_off")
+        self._wait_for_commands()
+        
+        self.assertEqual(received, ["power_on", "power_off"])
+    
+    def test_device_command_superseded(self):
+        """Test that a queued command is dropped for a newer one for the same state"""
+        mock_google_service = Mock()
+        mock_google_service.control_device.return_value = True
+        self.module.google_service = mock_google_service
+        self.module.devices[self.test_google_device.id] = self.test_google_device
+        
+        # Hold the device's worker so all three commands are queued together
+        release = threading.Event()
+        self.module._queue_job(
+            self.module.COMMAND_PRIORITY, -1, self.test_google_device.id, release.wait, 1
+        )
+        self.module._control_device(self.test_google_device.id, "power_on")
+        self.module._control_device(self.test_google_device.id, "set_brightness", {"brightness": 30})
+        self.module._control_device(self.test_google_device.id, "power_off")
+        release.set()
+        self._wait_for_commands()
+        
+        sent = [call.args[1] for call in mock_google_service.control_device.call_args_list]
+        self.assertEqual(sent, ["set_brightness", "power_off"])
+    
     def test_room_control(self):
         """Test controlling all devices in a room"""
         # Setup devices in same room
@@ -234,19 +293,20 @@ class TestSmartHomeModule(unittest.TestCase):
         
         # Mock services
         mock_google_service = Mock()
-        mock_google_service.control_device.return_value = True
+        mock_google_service.control_device_group.return_value = {device1.id: True}
         mock_alexa_service = Mock()
-        mock_alexa_service.control_device.return_value = True
+        mock_alexa_service.control_device_group.return_value = {device2.id: True}
         
         self.module.google_service = mock_google_service
         self.module.alexa_service = mock_alexa_service
         
         # Test room control
         self.module._control_room("Bedroom", "power_on")
+        self._wait_for_commands()
         
-        # Verify both services were called
-        mock_google_service.control_device.assert_called_once()
-        mock_alexa_service.control_device.assert_called_once()
+        # Verify each service got one group command for its devices
+        mock_google_service.control_device_group.assert_called_once_with([device1.id], "power_on", None)
+        mock_alexa_service.control_device_group.assert_called_once_with([device2.id], "power_on", None)
     
     def test_scene_activation(self):
         """Test scene activation"""
@@ -270,19 +330,26 @@ class TestSmartHomeModule(unittest.TestCase):
         self.module.devices[self.test_alexa_device.id] = self.test_alexa_device
         
         mock_google_service = Mock()
-        mock_google_service.control_device.return_value = True
+        mock_google_service.control_devices_batch.return_value = [True, True]
         mock_alexa_service = Mock()
-        mock_alexa_service.control_device.return_value = True
+        mock_alexa_service.control_devices_batch.return_value = [True, True]
         
         self.module.google_service = mock_google_service
         self.module.alexa_service = mock_alexa_service
         
         # Activate scene
         self.module._activate_scene("Test Scene", scene_data)
-        
-        # Verify commands were sent to devices
-        self.assertTrue(mock_google_service.control_device.called)
-        self.assertTrue(mock_alexa_service.control_device.called)
+        self._wait_for_commands()
+        
+        # Verify each service got its devices' commands in one batch
+        mock_google_service.control_devices_batch.assert_called_once_with([
+            (self.test_google_device.id, "power_on", {}),
+            (self.test_google_device.id, "set_brightness", {"brightness": 50})
+        ])
+        mock_alexa_service.control_devices_batch.assert_called_once_with([
+            (self.test_alexa_device.id, "power_on", {}),
+            (self.test_alexa_device.id, "set_volume", {"volume": 30})
+        ])
     
     def test_voice_command_handling(self):
         """Test voice command handling"""